@@ -1,12 +1,15 @@
+from typing import Any, Callable
+
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal
 from app.models.user import User, UserRole
-from app.services.auth import get_user_by_email
+from app.services.auth import get_user_by_subject
 
 security = HTTPBearer()
 
@@ -19,6 +22,24 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database mode is not enabled")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Public read routes follow DATABASE_MODE: an AsyncSession on the async engine,
+# or a Session whose queries run in the threadpool. Everything else stays sync.
+get_read_db = get_async_db if settings.database_mode == "async" else get_db
+
+
+async def run_read(sync_service: Callable, async_service: Callable, db, **kwargs) -> Any:
+    if settings.database_mode == "async":
+        return await async_service(db, **kwargs)
+    return await run_in_threadpool(sync_service, db, **kwargs)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
@@ -32,7 +53,7 @@ def get_current_user(
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = get_user_by_email(db, subject)
+    user = get_user_by_subject(db, subject)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
@@ -0,0 +1,26 @@
+from fastapi import Response
+
+from app.services.pagination import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TICKET_TOTAL_HEADER = "X-Ticket-Total"
+STATUS_COUNTS_HEADER = "X-Status-Counts"
+EXPOSED_HEADERS = [NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TICKET_TOTAL_HEADER, STATUS_COUNTS_HEADER]
+
+
+def paginated(response: Response, page: Page) -> Page:
+    # List bodies stay plain JSON arrays; the cursor for the following page
+    # travels in a header so offset clients are unaffected.
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
+
+
+def with_facets(response: Response, facets: dict) -> None:
+    # Status counts go out as "Pending=3,Confirmed=12,...".
+    response.headers[TOTAL_COUNT_HEADER] = str(facets["total"])
+    response.headers[TICKET_TOTAL_HEADER] = str(facets["ticket_total"])
+    response.headers[STATUS_COUNTS_HEADER] = ",".join(
+        f"{status}={count}" for status, count in facets["status_counts"].items()
+    )
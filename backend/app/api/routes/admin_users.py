@@ -1,18 +1,27 @@
 from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_roles
+from app.api.pagination import paginated
+from app.models.site import Site
 from app.models.user import User, UserRole
 from app.schemas.admin_user import AdminResetPassword, AdminUserOut, AdminUserUpdate
+from app.schemas.imports import ImportReport
 from app.services.admin_users import list_users, reset_password, update_user
+from app.services.auth import release_connection
+from app.services.imports import ImportFormatError, import_members, read_rows
+from app.services.passwords import hash_password_async
 
 router = APIRouter(prefix="/admin/users", tags=["admin-users"])
 
 
 @router.get("", response_model=list[AdminUserOut])
 def get_users(
+    response: Response,
     q: Optional[str] = None,
     role: Optional[UserRole] = None,
     site_id: Optional[str] = None,
@@ -21,13 +30,14 @@ def get_users(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
     ),
     db: Session = Depends(get_db),
 ) -> list[AdminUserOut]:
     _ = current_user
-    return list_users(
+    page = list_users(
         db,
         query=q,
         role=role,
@@ -37,7 +47,29 @@ def get_users(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
+
+
+@router.post("/import", response_model=ImportReport)
+def import_users_handler(
+    file: UploadFile = File(...),
+    site_id: Optional[UUID] = Form(None),
+    current_user: User = Depends(
+        require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
+    ),
+    db: Session = Depends(get_db),
+) -> ImportReport:
+    # CSV or XLSX with a header row: email, password, full_name, phone,
+    # member_type, site_id. Rows without a site_id go to site_id or the
+    # importer's own site.
+    if site_id and not db.get(Site, site_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Site not found")
+    try:
+        return import_members(db, read_rows(file.file, file.filename), site_id or current_user.site_id)
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
 @router.patch("/{user_id}", response_model=AdminUserOut)
@@ -57,7 +89,7 @@ def update_user_handler(
 
 
 @router.post("/{user_id}/reset-password", response_model=AdminUserOut)
-def reset_password_handler(
+async def reset_password_handler(
     user_id: str,
     payload: AdminResetPassword,
     current_user: User = Depends(
@@ -66,7 +98,9 @@ def reset_password_handler(
     db: Session = Depends(get_db),
 ) -> AdminUserOut:
     _ = current_user
-    user = reset_password(db, user_id, payload.password)
+    await release_connection(db)
+    password_hash = await hash_password_async(payload.password)
+    user = await run_in_threadpool(reset_password, db, user_id, password_hash)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
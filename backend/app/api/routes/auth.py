@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
@@ -10,23 +11,25 @@ from app.services.auth import (
     authenticate_user,
     change_password,
     create_user,
-    get_user_by_email,
+    get_user_detached,
     update_user_profile,
 )
+from app.services.passwords import hash_password_async
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserOut)
-def register(payload: UserCreate, db: Session = Depends(get_db)):
-    if get_user_by_email(db, payload.email):
+async def register(payload: UserCreate, db: Session = Depends(get_db)):
+    if await run_in_threadpool(get_user_detached, db, payload.email):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already exists")
-    return create_user(db, payload)
+    password_hash = await hash_password_async(payload.password)
+    return await run_in_threadpool(create_user, db, payload, password_hash)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = authenticate_user(db, payload.email, payload.password)
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    user = await authenticate_user(db, payload.email, payload.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     token = create_access_token(subject=user.email)
@@ -48,11 +51,11 @@ def update_me(
 
 
 @router.post("/change-password")
-def update_password(
+async def update_password(
     payload: PasswordChange,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    if not change_password(db, current_user, payload.current_password, payload.new_password):
+    if not await change_password(db, current_user, payload.current_password, payload.new_password):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid password")
     return {"status": "ok"}
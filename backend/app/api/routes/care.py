@@ -1,19 +1,25 @@
 from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_roles
+from app.api.pagination import paginated
 from app.models.care import CareSubjectStatus
+from app.models.site import Site
 from app.models.user import User, UserRole
 from app.schemas.care import CareLogCreate, CareLogOut, CareSubjectCreate, CareSubjectOut
+from app.schemas.imports import ImportReport
 from app.services.care import create_log, create_subject, list_logs, list_subjects
+from app.services.imports import ImportFormatError, import_care_subjects, read_rows
 
 router = APIRouter(prefix="/care", tags=["care"])
 
 
 @router.get("/subjects", response_model=list[CareSubjectOut])
 def get_subjects(
+    response: Response,
     site_id: Optional[str] = None,
     status: Optional[CareSubjectStatus] = None,
     q: Optional[str] = None,
@@ -21,13 +27,14 @@ def get_subjects(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff, UserRole.leader)
     ),
     db: Session = Depends(get_db),
 ) -> list[CareSubjectOut]:
     _ = current_user
-    return list_subjects(
+    page = list_subjects(
         db,
         site_id=site_id,
         status=status,
@@ -36,7 +43,9 @@ def get_subjects(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.post("/subjects", response_model=CareSubjectOut)
@@ -51,6 +60,26 @@ def create_subject_handler(
     return create_subject(db, payload)
 
 
+@router.post("/subjects/import", response_model=ImportReport)
+def import_subjects_handler(
+    file: UploadFile = File(...),
+    site_id: Optional[UUID] = Form(None),
+    current_user: User = Depends(
+        require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff, UserRole.leader)
+    ),
+    db: Session = Depends(get_db),
+) -> ImportReport:
+    # CSV or XLSX with a header row: name, subject_type, status, site_id.
+    if site_id and not db.get(Site, site_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Site not found")
+    try:
+        return import_care_subjects(
+            db, read_rows(file.file, file.filename), site_id or current_user.site_id
+        )
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
 @router.get("/subjects/{subject_id}/logs", response_model=list[CareLogOut])
 def get_logs(
     subject_id: str,
@@ -4,14 +4,35 @@ import uuid
 import uuid
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, require_roles
+from app.api.deps import get_db, get_read_db, require_roles, run_read
+from app.api.pagination import paginated
+from app.core.config import settings
 from app.models.user import User, UserRole
 from app.schemas.event import EventCreate, EventOut, EventUpdate
 from app.models.event import EventStatus
-from app.services.events import create_event, delete_event, list_events, update_event
+from app.services.events import (
+    create_event,
+    delete_event,
+    get_event_by_id,
+    list_events,
+    list_events_async,
+    update_event,
+)
+from app.services.posters import generate_poster_derivatives
+from app.services.uploads import UploadTooLargeError, store_upload
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 POSTER_DIR = BASE_DIR / "static" / "posters"
@@ -21,7 +42,8 @@ router = APIRouter(prefix="/events", tags=["events"])
 
 
 @router.get("", response_model=list[EventOut])
-def get_events(
+async def get_events(
+    response: Response,
     site_id: Optional[str] = None,
     status: Optional[EventStatus] = None,
     q: Optional[str] = None,
@@ -30,9 +52,12 @@ def get_events(
     sort_dir: str = "asc",
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db=Depends(get_read_db),
 ) -> list[EventOut]:
-    return list_events(
+    page = await run_read(
+        list_events,
+        list_events_async,
         db,
         site_id=site_id,
         status=status,
@@ -42,7 +67,9 @@ def get_events(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.post("", response_model=EventOut)
@@ -73,8 +100,9 @@ def update_event_handler(
 
 
 @router.post("/{event_id}/poster", response_model=EventOut)
-def upload_event_poster(
+async def upload_event_poster(
     event_id: str,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
@@ -82,20 +110,24 @@ def upload_event_poster(
     db: Session = Depends(get_db),
 ) -> EventOut:
     _ = current_user
+    if not await run_in_threadpool(get_event_by_id, db, event_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     if file.content_type not in ALLOWED_POSTER_TYPES:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported file type")
     extension = Path(file.filename or "").suffix.lower() or ".jpg"
     if extension not in {".jpg", ".jpeg", ".png", ".webp"}:
         extension = ".jpg"
-    POSTER_DIR.mkdir(parents=True, exist_ok=True)
-    filename = f"{event_id}-{uuid.uuid4().hex}{extension}"
-    target_path = POSTER_DIR / filename
-    with target_path.open("wb") as target:
-        target.write(file.file.read())
+    try:
+        filename = await store_upload(file, POSTER_DIR, extension, settings.poster_max_bytes)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
     poster_url = f"/static/posters/{filename}"
-    event = update_event(db, event_id, EventUpdate(poster_url=poster_url))
+    event = await run_in_threadpool(update_event, db, event_id, EventUpdate(poster_url=poster_url))
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    background_tasks.add_task(
+        generate_poster_derivatives, event_id, poster_url, POSTER_DIR / filename
+    )
     return event
 
 
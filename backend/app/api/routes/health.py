@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.services.readiness import readiness
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +9,15 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 def health_check() -> dict:
     return {"status": "ok"}
+
+
+# Liveness stays at /health; this one answers 503 while the database is
+# unreachable, the connection pool is exhausted or uploads cannot be written.
+@router.get("/health/ready")
+async def readiness_check(response: Response) -> dict:
+    # A cached result is served from the event loop, so probes still get an
+    # answer when the threadpool is saturated.
+    result = readiness.cached() or await run_in_threadpool(readiness.check)
+    if not result["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
@@ -1,21 +1,28 @@
 from typing import Optional
-import uuid
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, require_roles
+from app.api.deps import get_db, get_read_db, require_roles, run_read
+from app.api.pagination import paginated
+from app.core.config import settings
 from app.models.user import User, UserRole
 from app.schemas.life_bulletin import LifeBulletinCreate, LifeBulletinOut, LifeBulletinUpdate
 from app.services.life_bulletins import (
+    attach_uploaded_video,
     create_life_bulletin,
     delete_life_bulletin,
     get_life_bulletin_by_id,
     list_latest_life_bulletins,
+    list_latest_life_bulletins_async,
     list_life_bulletins,
+    list_life_bulletins_async,
     update_life_bulletin,
 )
+from app.services.uploads import UploadTooLargeError, store_upload
+from app.services.video_jobs import enqueue_transcode
 
 router = APIRouter(prefix="/life-bulletins", tags=["life-bulletins"])
 
@@ -25,16 +32,23 @@ ALLOWED_VIDEO_TYPES = {"video/mp4", "video/webm", "video/quicktime"}
 
 
 @router.get("/latest", response_model=list[LifeBulletinOut])
-def read_latest_life_bulletins(
+async def read_latest_life_bulletins(
     site_id: Optional[str] = Query(None),
     limit: int = Query(5, ge=1, le=10),
-    db: Session = Depends(get_db),
+    db=Depends(get_read_db),
 ) -> list[LifeBulletinOut]:
-    return list_latest_life_bulletins(db, site_id=site_id, limit=limit)
+    return await run_read(
+        list_latest_life_bulletins,
+        list_latest_life_bulletins_async,
+        db,
+        site_id=site_id,
+        limit=limit,
+    )
 
 
 @router.get("/public", response_model=list[LifeBulletinOut])
-def list_public_life_bulletins(
+async def list_public_life_bulletins(
+    response: Response,
     site_id: Optional[str] = Query(None),
     query: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
@@ -42,9 +56,12 @@ def list_public_life_bulletins(
     sort_dir: str = Query("desc"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    db=Depends(get_read_db),
 ) -> list[LifeBulletinOut]:
-    return list_life_bulletins(
+    page = await run_read(
+        list_life_bulletins,
+        list_life_bulletins_async,
         db,
         site_id=site_id,
         query=query,
@@ -53,11 +70,14 @@ def list_public_life_bulletins(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.get("", response_model=list[LifeBulletinOut])
 def list_life_bulletin_records(
+    response: Response,
     site_id: Optional[str] = Query(None),
     query: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
@@ -65,6 +85,7 @@ def list_life_bulletin_records(
     sort_dir: str = Query("desc"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
     ),
@@ -72,7 +93,7 @@ def list_life_bulletin_records(
 ) -> list[LifeBulletinOut]:
     if not current_user.site_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    return list_life_bulletins(
+    page = list_life_bulletins(
         db,
         site_id=str(current_user.site_id),
         query=query,
@@ -81,7 +102,9 @@ def list_life_bulletin_records(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.post("", response_model=LifeBulletinOut, status_code=status.HTTP_201_CREATED)
@@ -118,7 +141,7 @@ def update_life_bulletin_record(
 
 
 @router.post("/{bulletin_id}/video", response_model=LifeBulletinOut)
-def upload_life_bulletin_video(
+async def upload_life_bulletin_video(
     bulletin_id: str,
     file: UploadFile = File(...),
     current_user: User = Depends(
@@ -126,7 +149,7 @@ def upload_life_bulletin_video(
     ),
     db: Session = Depends(get_db),
 ) -> LifeBulletinOut:
-    record = get_life_bulletin_by_id(db, bulletin_id)
+    record = await run_in_threadpool(get_life_bulletin_by_id, db, bulletin_id)
     if not record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Life bulletin not found")
     if not current_user.site_id or str(record.site_id) != str(current_user.site_id):
@@ -136,15 +159,16 @@ def upload_life_bulletin_video(
     extension = Path(file.filename or "").suffix.lower() or ".mp4"
     if extension not in {".mp4", ".webm", ".mov"}:
         extension = ".mp4"
-    VIDEO_DIR.mkdir(parents=True, exist_ok=True)
-    filename = f"{bulletin_id}-{uuid.uuid4().hex}{extension}"
-    target_path = VIDEO_DIR / filename
-    with target_path.open("wb") as target:
-        target.write(file.file.read())
+    try:
+        filename = await store_upload(file, VIDEO_DIR, extension, settings.video_max_bytes)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
     video_url = f"/static/life-bulletins/{filename}"
-    record = update_life_bulletin(db, bulletin_id, LifeBulletinUpdate(video_url=video_url))
+    record = await run_in_threadpool(attach_uploaded_video, db, bulletin_id, video_url)
     if not record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Life bulletin not found")
+    # The original file plays until the transcode worker swaps in the HLS playlist.
+    await run_in_threadpool(enqueue_transcode, bulletin_id, VIDEO_DIR / filename, video_url)
     return record
 
 
@@ -0,0 +1,109 @@
+import anyio.to_thread
+from fastapi import APIRouter, Response
+
+from app.core.cache import caches
+from app.core.metrics import PrometheusText
+from app.core.request_metrics import request_metrics
+from app.db.session import pool_stats
+from app.services.amens import amen_buffer
+from app.services.passwords import password_hasher
+from app.services.prayer_wall import prayer_wall
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def _request_metrics(text: PrometheusText) -> None:
+    text.gauge(
+        "http_requests_in_flight", "Requests being handled by this worker",
+        request_metrics.in_flight,
+    )
+    for series in request_metrics.all_series():
+        for method, histogram in series.histograms.items():
+            text.histogram(
+                "http_request_duration_seconds", "Request latency by route template",
+                histogram.snapshot(), route=series.route, method=method,
+            )
+        text.counter(
+            "http_request_exceptions", "Requests that raised instead of responding",
+            series.exceptions, route=series.route,
+        )
+
+
+def _threadpool_metrics(text: PrometheusText) -> None:
+    # Sync handlers and dependencies run on this limiter's threads.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    text.gauge("threadpool_threads", "Threadpool size", limiter.total_tokens)
+    text.gauge("threadpool_threads_busy", "Threadpool threads in use", limiter.borrowed_tokens)
+    text.gauge(
+        "threadpool_queue_depth", "Calls waiting for a threadpool thread",
+        limiter.statistics().tasks_waiting,
+    )
+
+
+def _pool_metrics(text: PrometheusText) -> None:
+    for pool in pool_stats():
+        name = pool["name"]
+        for key in ("size", "checkedin", "checkedout", "overflow"):
+            if key in pool:
+                text.gauge(f"db_pool_{key}", f"Connection pool {key}", pool[key], pool=name)
+        for key in ("checkouts", "connects", "invalidations", "timeouts"):
+            text.counter(f"db_pool_{key}", f"Connection pool {key}", pool[key], pool=name)
+        text.histogram(
+            "db_pool_checkout_seconds", "Time spent waiting for a pooled connection",
+            pool["checkout_latency_ms"], scale=0.001, pool=name,
+        )
+        text.histogram(
+            "db_pool_hold_seconds", "Time a connection stays checked out",
+            pool["hold_time_ms"], scale=0.001, pool=name,
+        )
+
+
+def _service_metrics(text: PrometheusText) -> None:
+    for cache in caches.values():
+        stats = cache.stats()
+        text.counter("cache_hits", "Cache hits", stats["hits"], cache=stats["name"])
+        text.counter("cache_misses", "Cache misses", stats["misses"], cache=stats["name"])
+        text.gauge("cache_hit_ratio", "Hits over lookups", stats["hit_ratio"], cache=stats["name"])
+        text.gauge("cache_entries", "Entries held", stats["size"], cache=stats["name"])
+    wall = prayer_wall.stats()
+    text.gauge("prayer_wall_viewers", "Open prayer wall streams", wall["viewers"])
+    text.counter("prayer_wall_frames_delivered", "Frames queued to viewers", wall["delivered"])
+    text.counter("prayer_wall_viewers_dropped", "Viewers cut off for lagging", wall["dropped"])
+    text.gauge("amen_buffer_pending", "Amens waiting for the next flush", amen_buffer.pending())
+    hasher = password_hasher.stats()
+    text.gauge("password_hash_pending", "Hash jobs queued or running", hasher["pending"])
+    text.counter("password_hash_completed", "Hash jobs finished", hasher["completed"])
+    text.counter("password_hash_rejected", "Requests turned away with 503", hasher["rejected"])
+
+
+# Prometheus scrape target. Every uvicorn worker keeps its own numbers and a
+# scrape is answered by whichever worker takes the connection.
+# async so it can read the event loop's threadpool limiter.
+@router.get("", include_in_schema=False)
+async def read_prometheus_metrics() -> Response:
+    text = PrometheusText()
+    _request_metrics(text)
+    _threadpool_metrics(text)
+    _pool_metrics(text)
+    _service_metrics(text)
+    return Response(text.render(), media_type=PrometheusText.content_type)
+
+
+@router.get("/db-pool")
+def read_db_pool_metrics() -> dict:
+    return {"pools": pool_stats()}
+
+
+@router.get("/caches")
+def read_cache_metrics() -> dict:
+    return {"caches": [cache.stats() for cache in caches.values()]}
+
+
+@router.get("/prayer-wall")
+def read_prayer_wall_metrics() -> dict:
+    return prayer_wall.stats()
+
+
+@router.get("/password-hasher")
+def read_password_hasher_metrics() -> dict:
+    return password_hasher.stats()
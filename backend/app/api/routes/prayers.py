@@ -1,19 +1,30 @@
 from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_user, require_roles
+from app.api.deps import get_current_user, get_db, get_read_db, require_roles, run_read
+from app.api.pagination import paginated
 from app.models.user import User, UserRole
 from app.schemas.prayer import PrayerCreate, PrayerOut, PrayerStatusUpdate
 from app.models.prayer import PrayerPrivacy
-from app.services.prayers import create_prayer, list_prayers, update_prayer_status
+from app.services.amens import AmenBacklogFullError, amen_buffer, can_receive_amen
+from app.services.prayers import (
+    create_prayer,
+    list_prayers,
+    list_prayers_async,
+    update_prayer_status,
+)
+from app.services.prayer_wall import stream_wall_events
 
 router = APIRouter(prefix="/prayers", tags=["prayers"])
 
 
 @router.get("", response_model=list[PrayerOut])
-def get_prayers(
+async def get_prayers(
+    response: Response,
     site_id: Optional[str] = None,
     privacy_level: Optional[PrayerPrivacy] = None,
     q: Optional[str] = None,
@@ -21,9 +32,12 @@ def get_prayers(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db=Depends(get_read_db),
 ) -> list[PrayerOut]:
-    return list_prayers(
+    page = await run_read(
+        list_prayers,
+        list_prayers_async,
         db,
         site_id=site_id,
         approved_only=True,
@@ -33,11 +47,31 @@ def get_prayers(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+    )
+    return paginated(response, page)
+
+
+@router.get("/stream")
+async def stream_prayers(
+    site_id: Optional[UUID] = None,
+    last_event_id: Optional[int] = None,
+    last_event_id_header: Optional[int] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    # Server-sent events: prayer.approved, prayer.removed and prayer.amens.
+    # Browsers resend Last-Event-ID on reconnect; the query parameter lets a
+    # client resume from an id it kept across page loads.
+    resume_from = last_event_id_header if last_event_id_header is not None else last_event_id
+    return StreamingResponse(
+        stream_wall_events(str(site_id) if site_id else None, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
 @router.get("/admin", response_model=list[PrayerOut])
 def get_prayers_admin(
+    response: Response,
     site_id: Optional[str] = None,
     privacy_level: Optional[PrayerPrivacy] = None,
     q: Optional[str] = None,
@@ -45,13 +79,14 @@ def get_prayers_admin(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff, UserRole.leader)
     ),
     db: Session = Depends(get_db),
 ) -> list[PrayerOut]:
     _ = current_user
-    return list_prayers(
+    page = list_prayers(
         db,
         site_id=site_id,
         approved_only=False,
@@ -61,7 +96,9 @@ def get_prayers_admin(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.post("", response_model=PrayerOut)
@@ -87,3 +124,24 @@ def update_prayer_status_handler(
     if not prayer:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Prayer not found")
     return prayer
+
+
+@router.post("/{prayer_id}/amen", status_code=status.HTTP_202_ACCEPTED)
+def amen_prayer_handler(
+    prayer_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> None:
+    # Accepted into this worker's buffer; amen_count catches up on the next
+    # flush, and a member's repeated amens on one prayer only count once.
+    if not can_receive_amen(db, str(prayer_id)):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Prayer not found")
+    try:
+        amen_buffer.add(prayer_id, current_user.id)
+    except AmenBacklogFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        )
+    return None
@@ -1,25 +1,34 @@
-from typing import Optional
+from typing import Iterator, Optional
 import csv
 import io
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user, require_roles
+from app.api.pagination import paginated, with_facets
+from app.db.session import SessionLocal
 from app.models.event import Event
 from app.models.user import User, UserRole
 from app.schemas.registration import (
     RegistrationAdminOut,
+    RegistrationBulkResult,
+    RegistrationBulkUpdate,
     RegistrationCreate,
     RegistrationOut,
     RegistrationUpdate,
 )
 from app.services.registrations import (
+    EventFullError,
+    EventNotFoundError,
+    bulk_update_registrations,
     create_registration,
     get_registration_by_id,
     list_registrations,
-    list_registrations_for_event,
+    list_registration_rows_for_event,
     delete_registration,
+    iter_registrations_for_event,
     update_registration,
 )
 
@@ -42,6 +51,8 @@ def create_registration_handler(
 ) -> RegistrationOut:
     try:
         return create_registration(db, payload, user_id=str(current_user.id))
+    except EventNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
 
@@ -58,16 +69,21 @@ def update_registration_handler(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Registration not found")
     if not record.user_id or str(record.user_id) != str(current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    return update_registration(db, record, payload)
+    try:
+        return update_registration(db, record, payload)
+    except EventFullError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
 
 
 @router.get("/admin", response_model=list[RegistrationAdminOut])
 def list_registrations_admin(
+    response: Response,
     event_id: str = Query(...),
     q: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
     ),
@@ -78,38 +94,78 @@ def list_registrations_admin(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     if not current_user.site_id or str(event.site_id) != str(current_user.site_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    rows = list_registrations_for_event(
+    page = list_registration_rows_for_event(
         db,
         event_id=event_id,
         query=q,
         status=status_filter,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    results: list[RegistrationAdminOut] = []
-    for registration, user, event_row in rows:
-        results.append(
-            RegistrationAdminOut(
-                id=registration.id,
-                event_id=registration.event_id,
-                event_title=event_row.title,
-                event_site_id=event_row.site_id,
-                event_start_at=event_row.start_at,
-                user_id=registration.user_id,
-                user_email=user.email if user else None,
-                user_full_name=user.full_name if user else None,
-                user_phone=user.phone if user else None,
-                user_member_type=user.member_type.value if user and user.member_type else None,
-                user_role=user.role.value if user and user.role else None,
-                status=registration.status,
-                ticket_count=registration.ticket_count,
-                is_proxy=registration.is_proxy,
-                proxy_entries=registration.proxy_entries or [],
-                created_at=registration.created_at,
-                updated_at=registration.updated_at,
+    paginated(response, page)
+    with_facets(response, page.facets)
+    event_columns = {
+        "event_id": event.id,
+        "event_title": event.title,
+        "event_site_id": event.site_id,
+        "event_start_at": event.start_at,
+    }
+    # Plain dicts: FastAPI validates them against the response model once.
+    return [{**row._mapping, **event_columns} for row in page]
+
+
+@router.post("/admin/bulk", response_model=RegistrationBulkResult)
+def bulk_update_registrations_admin(
+    payload: RegistrationBulkUpdate,
+    current_user: User = Depends(
+        require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
+    ),
+    db: Session = Depends(get_db),
+) -> RegistrationBulkResult:
+    if (payload.ids is None) == (payload.filter is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Provide either ids or filter"
+        )
+    if payload.filter is not None and not payload.filter.all:
+        if payload.filter.status is None and not (payload.filter.q or "").strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Empty filter matches the whole event; set filter.all to confirm",
             )
+    if payload.status is None and payload.ticket_count is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Nothing to update")
+    # Every registration is scoped to this one event, so its site is checked once.
+    event = db.query(Event).filter(Event.id == payload.event_id).first()
+    if not event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    if not current_user.site_id or str(event.site_id) != str(current_user.site_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        results, promoted = bulk_update_registrations(
+            db,
+            event.id,
+            status=payload.status,
+            ticket_count=payload.ticket_count,
+            ids=payload.ids,
+            query=payload.filter.q if payload.filter else None,
+            match_status=payload.filter.status if payload.filter else None,
         )
-    return results
+    except EventNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    if payload.ids is not None:
+        # Ids outside the event are reported rather than silently skipped.
+        found = {row["id"] for row in results}
+        results += [
+            {"id": registration_id, "outcome": "not_found"}
+            for registration_id in dict.fromkeys(payload.ids)
+            if registration_id not in found
+        ]
+    return {
+        "updated": sum(1 for row in results if row["outcome"] == "updated"),
+        "results": results,
+        "promoted": promoted,
+    }
 
 
 @router.patch("/admin/{registration_id}", response_model=RegistrationAdminOut)
@@ -129,7 +185,10 @@ def update_registration_admin(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     if not current_user.site_id or str(event.site_id) != str(current_user.site_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    record = update_registration(db, record, payload)
+    try:
+        record = update_registration(db, record, payload)
+    except EventFullError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
     user = db.query(User).filter(User.id == record.user_id).first()
     return RegistrationAdminOut(
         id=record.id,
@@ -172,7 +231,110 @@ def delete_registration_admin(
     return None
 
 
-@router.get("/admin/export", response_class=Response)
+EXPORT_COLUMNS = [
+    "event_title",
+    "event_start_at",
+    "user_full_name",
+    "user_email",
+    "user_phone",
+    "user_member_type",
+    "user_role",
+    "status",
+    "ticket_count",
+    "is_proxy",
+    "proxy_name",
+    "proxy_relation",
+    "proxy_phone",
+    "proxy_note",
+    "created_at",
+    "updated_at",
+]
+EXPORT_FLUSH_BYTES = 64 * 1024
+
+
+def _format_phone(phone: Optional[str]) -> str:
+    if not phone:
+        return ""
+    return f"'{phone}"
+
+
+def _format_datetime(value) -> str:
+    if not value:
+        return ""
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def _export_rows(registration, user, event_row):
+    user_columns = [
+        user.full_name if user else "",
+        user.email if user else "",
+        _format_phone(user.phone if user else None),
+        user.member_type.value if user and user.member_type else "",
+        user.role.value if user and user.role else "",
+    ]
+    event_columns = [event_row.title, _format_datetime(event_row.start_at)]
+    timestamps = [
+        _format_datetime(registration.created_at),
+        _format_datetime(registration.updated_at),
+    ]
+    yield [
+        *event_columns,
+        *user_columns,
+        registration.status.value,
+        registration.ticket_count,
+        "N",
+        "",
+        "",
+        "",
+        "",
+        *timestamps,
+    ]
+    for entry in registration.proxy_entries or []:
+        yield [
+            *event_columns,
+            *user_columns,
+            registration.status.value,
+            "",
+            "Y",
+            entry.get("name", ""),
+            entry.get("relation", ""),
+            _format_phone(entry.get("phone", "")),
+            entry.get("note", ""),
+            *timestamps,
+        ]
+
+
+def _stream_registrations_csv(
+    event_id: str,
+    query: Optional[str],
+    status_filter: Optional[str],
+) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    # BOM and header go out before the query runs so the download starts at once.
+    yield "\ufeff" + buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    # The request-scoped session is closed before a streamed body is sent,
+    # so the export holds its own session for the lifetime of the cursor.
+    with SessionLocal() as db:
+        for registration, user, event_row in iter_registrations_for_event(
+            db,
+            event_id=event_id,
+            query=query,
+            status=status_filter,
+        ):
+            writer.writerows(_export_rows(registration, user, event_row))
+            if buffer.tell() >= EXPORT_FLUSH_BYTES:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/admin/export", response_class=StreamingResponse)
 def export_registrations_admin(
     event_id: str = Query(...),
     q: Optional[str] = Query(None),
@@ -181,96 +343,15 @@ def export_registrations_admin(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
     ),
     db: Session = Depends(get_db),
-) -> Response:
+) -> StreamingResponse:
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     if not current_user.site_id or str(event.site_id) != str(current_user.site_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    rows = list_registrations_for_event(
-        db,
-        event_id=event_id,
-        query=q,
-        status=status_filter,
-        limit=10000,
-        offset=0,
-    )
-    def format_phone(phone: Optional[str]) -> str:
-        if not phone:
-            return ""
-        return f"'{phone}"
-    def format_datetime(value) -> str:
-        if not value:
-            return ""
-        return value.strftime("%Y-%m-%d %H:%M")
-    buffer = io.StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
-            "event_title",
-            "event_start_at",
-            "user_full_name",
-            "user_email",
-            "user_phone",
-            "user_member_type",
-            "user_role",
-            "status",
-            "ticket_count",
-            "is_proxy",
-            "proxy_name",
-            "proxy_relation",
-            "proxy_phone",
-            "proxy_note",
-            "created_at",
-            "updated_at",
-        ]
-    )
-    for registration, user, event_row in rows:
-        proxy_entries = registration.proxy_entries or []
-        base_row = [
-            event_row.title,
-            format_datetime(event_row.start_at),
-            user.full_name if user else "",
-            user.email if user else "",
-            format_phone(user.phone if user else None),
-            user.member_type.value if user and user.member_type else "",
-            user.role.value if user and user.role else "",
-            registration.status.value,
-            registration.ticket_count,
-            "N",
-            "",
-            "",
-            "",
-            "",
-            format_datetime(registration.created_at),
-            format_datetime(registration.updated_at),
-        ]
-        writer.writerow(base_row)
-        for entry in proxy_entries:
-            writer.writerow(
-                [
-                    event_row.title,
-                    format_datetime(event_row.start_at),
-                    user.full_name if user else "",
-                    user.email if user else "",
-                    format_phone(user.phone if user else None),
-                    user.member_type.value if user and user.member_type else "",
-                    user.role.value if user and user.role else "",
-                    registration.status.value,
-                    "",
-                    "Y",
-                    entry.get("name", ""),
-                    entry.get("relation", ""),
-                    format_phone(entry.get("phone", "")),
-                    entry.get("note", ""),
-                    format_datetime(registration.created_at),
-                    format_datetime(registration.updated_at),
-                ]
-            )
-    content = "\ufeff" + buffer.getvalue()
     filename = f"registrations_{event_id}.csv"
-    return Response(
-        content=content,
+    return StreamingResponse(
+        _stream_registrations_csv(event_id, q, status_filter),
         media_type="text/csv; charset=utf-8",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -1,9 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, require_roles
+from app.api.deps import get_db, get_read_db, require_roles, run_read
+from app.api.pagination import paginated
 from app.models.user import User, UserRole
 from app.schemas.sunday_message import (
     SundayMessageCreate,
@@ -15,7 +16,9 @@ from app.services.sunday_messages import (
     delete_sunday_message,
     get_sunday_message_by_id,
     list_latest_sunday_messages,
+    list_latest_sunday_messages_async,
     list_sunday_messages,
+    list_sunday_messages_async,
     update_sunday_message,
 )
 
@@ -23,25 +26,35 @@ router = APIRouter(prefix="/sunday-messages", tags=["sunday-messages"])
 
 
 @router.get("/latest", response_model=list[SundayMessageOut])
-def read_latest_sunday_messages(
+async def read_latest_sunday_messages(
     site_id: Optional[str] = Query(None),
     limit: int = Query(5, ge=1, le=20),
-    db: Session = Depends(get_db),
+    db=Depends(get_read_db),
 ) -> list[SundayMessageOut]:
-    return list_latest_sunday_messages(db, site_id=site_id, limit=limit)
+    return await run_read(
+        list_latest_sunday_messages,
+        list_latest_sunday_messages_async,
+        db,
+        site_id=site_id,
+        limit=limit,
+    )
 
 
 @router.get("/public", response_model=list[SundayMessageOut])
-def list_public_sunday_messages(
+async def list_public_sunday_messages(
+    response: Response,
     site_id: Optional[str] = Query(None),
     query: Optional[str] = Query(None),
     sort_by: str = Query("message_date"),
     sort_dir: str = Query("desc"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    db=Depends(get_read_db),
 ) -> list[SundayMessageOut]:
-    return list_sunday_messages(
+    page = await run_read(
+        list_sunday_messages,
+        list_sunday_messages_async,
         db,
         site_id=site_id,
         query=query,
@@ -49,17 +62,21 @@ def list_public_sunday_messages(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.get("", response_model=list[SundayMessageOut])
 def list_sunday_message_records(
+    response: Response,
     site_id: str = Query(...),
     query: Optional[str] = Query(None),
     sort_by: str = Query("message_date"),
     sort_dir: str = Query("desc"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
     ),
@@ -67,7 +84,7 @@ def list_sunday_message_records(
 ) -> list[SundayMessageOut]:
     if not current_user.site_id or site_id != str(current_user.site_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    return list_sunday_messages(
+    page = list_sunday_messages(
         db,
         site_id=site_id,
         query=query,
@@ -75,7 +92,9 @@ def list_sunday_message_records(
         sort_dir=sort_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    return paginated(response, page)
 
 
 @router.post("", response_model=SundayMessageOut, status_code=status.HTTP_201_CREATED)
@@ -1,15 +1,18 @@
 from datetime import date
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, require_roles
+from app.api.deps import get_db, get_read_db, require_roles, run_read
+from app.api.pagination import paginated
 from app.models.user import User, UserRole
 from app.schemas.weekly_verse import WeeklyVerseCreate, WeeklyVerseOut, WeeklyVerseUpdate
 from app.services.weekly_verse import (
     create_weekly_verse,
     delete_weekly_verse,
     get_current_weekly_verse,
+    get_current_weekly_verse_async,
     get_weekly_verse_by_id,
     list_weekly_verses,
     update_weekly_verse,
@@ -19,11 +22,13 @@ router = APIRouter(prefix="/weekly-verse", tags=["weekly-verse"])
 
 
 @router.get("/current", response_model=WeeklyVerseOut)
-def read_current_weekly_verse(
+async def read_current_weekly_verse(
     site_id: str = Query(...),
-    db: Session = Depends(get_db),
+    db=Depends(get_read_db),
 ) -> WeeklyVerseOut:
-    record = get_current_weekly_verse(db, site_id)
+    record = await run_read(
+        get_current_weekly_verse, get_current_weekly_verse_async, db, site_id=site_id
+    )
     if not record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Weekly verse not set")
     return record
@@ -31,9 +36,11 @@ def read_current_weekly_verse(
 
 @router.get("", response_model=list[WeeklyVerseOut])
 def list_weekly_verse_records(
+    response: Response,
     site_id: str = Query(...),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(
         require_roles(UserRole.admin, UserRole.center_staff, UserRole.branch_staff)
     ),
@@ -41,7 +48,8 @@ def list_weekly_verse_records(
 ) -> list[WeeklyVerseOut]:
     if not current_user.site_id or site_id != str(current_user.site_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    return list_weekly_verses(db, site_id=site_id, limit=limit, offset=offset)
+    page = list_weekly_verses(db, site_id=site_id, limit=limit, offset=offset, cursor=cursor)
+    return paginated(response, page)
 
 
 @router.post("", response_model=WeeklyVerseOut, status_code=status.HTTP_201_CREATED)
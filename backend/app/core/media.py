@@ -0,0 +1,163 @@
+import gzip
+import mimetypes
+import os
+import re
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip sidecars are written without it
+    brotli = None
+
+# Uploads are stored under their content hash (or a per-upload uuid hex for
+# older files), so a given URL never changes and can be cached forever.
+HASHED_NAME = re.compile(r"[0-9a-f]{32}")
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/vnd.apple.mpegurl",
+    "application/x-mpegurl",
+    "image/svg+xml",
+    "text/css",
+    "text/plain",
+    "text/vtt",
+}
+SIDECARS = (("br", ".br"), ("gzip", ".gz"))
+CHUNK_SIZE = 1024 * 1024
+
+
+# System mime.types files disagree on these (.ts is often Qt Linguist).
+mimetypes.add_type("application/vnd.apple.mpegurl", ".m3u8")
+mimetypes.add_type("video/mp2t", ".ts")
+
+
+def _media_type(path: str) -> str:
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+def precompress(path: str) -> None:
+    # Writes .gz (and .br when brotli is installed) next to a compressible file
+    # when it saves at least 10%; MediaFiles serves them to accepting clients.
+    if _media_type(path) not in COMPRESSIBLE_TYPES:
+        return
+    with open(path, "rb") as source:
+        data = source.read()
+    variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(data)))
+    for suffix, compressed in variants:
+        if len(compressed) > len(data) * 0.9:
+            continue
+        temp_path = f"{path}{suffix}.part"
+        with open(temp_path, "wb") as target:
+            target.write(compressed)
+        os.replace(temp_path, path + suffix)
+
+
+class MediaFileResponse(FileResponse):
+    chunk_size = CHUNK_SIZE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.extensions = scope.get("extensions") or {}
+        await super().__call__(scope, receive, send)
+
+    async def _handle_simple(self, send: Send, send_header_only: bool) -> None:
+        if send_header_only or not self._can_zerocopy():
+            await super()._handle_simple(send, send_header_only)
+            return
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await self._zerocopy(send, 0, None)
+
+    async def _handle_single_range(
+        self, send: Send, start: int, end: int, file_size: int, send_header_only: bool
+    ) -> None:
+        if send_header_only or "http.response.zerocopysend" not in self.extensions:
+            await super()._handle_single_range(send, start, end, file_size, send_header_only)
+            return
+        self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        self.headers["content-length"] = str(end - start)
+        await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+        await self._zerocopy(send, start, end - start)
+
+    def _can_zerocopy(self) -> bool:
+        return (
+            "http.response.pathsend" in self.extensions
+            or "http.response.zerocopysend" in self.extensions
+        )
+
+    async def _zerocopy(self, send: Send, offset: int, count: Optional[int]) -> None:
+        # Servers implementing these ASGI extensions hand the file to
+        # sendfile(2); uvicorn does not, and falls back to 1 MiB reads.
+        if "http.response.zerocopysend" in self.extensions:
+            with open(self.path, "rb") as file:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": file,
+                        "offset": offset,
+                        "count": count,
+                        "more_body": False,
+                    }
+                )
+            return
+        await send({"type": "http.response.pathsend", "path": os.fspath(self.path)})
+
+
+class MediaFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = os.fspath(full_path)
+        headers = {"cache-control": self._cache_control(path)}
+        media_type = _media_type(path)
+        if media_type in COMPRESSIBLE_TYPES:
+            headers["vary"] = "Accept-Encoding"
+            sidecar = self._sidecar(path, request_headers)
+            if sidecar is not None:
+                encoding, full_path, stat_result = sidecar
+                headers["content-encoding"] = encoding
+        response = MediaFileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _cache_control(self, path: str) -> str:
+        if HASHED_NAME.search(os.path.basename(path)):
+            return f"public, max-age={settings.media_cache_max_age}, immutable"
+        return f"public, max-age={settings.media_cache_fallback_max_age}"
+
+    def _sidecar(
+        self, path: str, request_headers: Headers
+    ) -> Optional[tuple[str, str, os.stat_result]]:
+        # Ranges address the identity bytes, so they never get a sidecar.
+        if "range" in request_headers:
+            return None
+        accepted = {
+            token.split(";")[0].strip()
+            for token in request_headers.get("accept-encoding", "").split(",")
+        }
+        for encoding, suffix in SIDECARS:
+            if encoding not in accepted:
+                continue
+            try:
+                return encoding, path + suffix, os.stat(path + suffix)
+            except FileNotFoundError:
+                continue
+        return None
@@ -0,0 +1,84 @@
+import threading
+from bisect import bisect_left
+from typing import Sequence
+
+# Milliseconds; covers sub-millisecond pool hits up to multi-second stalls.
+DEFAULT_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+            count = self._count
+        cumulative = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            running += bucket_count
+            cumulative.append({"le": bound, "count": running})
+        cumulative.append({"le": "+Inf", "count": count})
+        return {"count": count, "sum": round(total, 6), "buckets": cumulative}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class PrometheusText:
+    # Prometheus text exposition format (version 0.0.4), built at scrape time.
+    # Samples are grouped per metric family whatever order they are added in.
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._families: dict[str, list[str]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> list[str]:
+        lines = self._families.get(name)
+        if lines is None:
+            lines = self._families[name] = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        return lines
+
+    @staticmethod
+    def _sample(lines: list[str], name: str, labels: dict, value) -> None:
+        lines.append(f"{name}{_labels(labels)} {'NaN' if value is None else value}")
+
+    def gauge(self, name: str, help_text: str, value, **labels) -> None:
+        self._sample(self._family(name, "gauge", help_text), name, labels, value)
+
+    def counter(self, name: str, help_text: str, value, **labels) -> None:
+        self._sample(self._family(name, "counter", help_text), f"{name}_total", labels, value)
+
+    def histogram(
+        self, name: str, help_text: str, snapshot: dict, scale: float = 1, **labels
+    ) -> None:
+        # scale converts the histogram's unit, e.g. 0.001 for ms -> seconds.
+        lines = self._family(name, "histogram", help_text)
+        for bucket in snapshot["buckets"]:
+            bound = bucket["le"] if bucket["le"] == "+Inf" else f"{bucket['le'] * scale:g}"
+            self._sample(lines, f"{name}_bucket", {**labels, "le": bound}, bucket["count"])
+        self._sample(lines, f"{name}_sum", labels, f"{snapshot['sum'] * scale:g}")
+        self._sample(lines, f"{name}_count", labels, snapshot["count"])
+
+    def render(self) -> str:
+        return "\n".join(line for lines in self._families.values() for line in lines) + "\n"
@@ -0,0 +1,76 @@
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.query_stats import QueryStats, current_query_stats
+
+logger = logging.getLogger("app.queries")
+
+
+class QueryBudgetExceededError(RuntimeError):
+    pass
+
+
+def server_timing(stats: QueryStats) -> bytes:
+    return f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries"'.encode()
+
+
+class QueryStatsMiddleware:
+    # Counts the queries each request runs. The header goes out with the
+    # response start, so queries made while streaming a body are only logged.
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append((b"server-timing", server_timing(stats)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+        self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        route = scope.get("route")
+        path = getattr(route, "path", scope["path"])
+        repeated = stats.repeated(settings.query_repeat_threshold)
+        over_budget = settings.query_budget is not None and stats.count > settings.query_budget
+        level = logging.WARNING if over_budget or repeated else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                "%s %s ran %d queries in %.1f ms%s",
+                scope["method"],
+                path,
+                stats.count,
+                stats.duration_ms,
+                f", {len(repeated)} repeated statement(s)" if repeated else "",
+                extra={
+                    "query_stats": {
+                        "method": scope["method"],
+                        "route": path,
+                        "queries": stats.count,
+                        "db_ms": round(stats.duration_ms, 1),
+                        "budget": settings.query_budget,
+                        "repeated": repeated,
+                    }
+                },
+            )
+        if over_budget and settings.query_budget_strict:
+            raise QueryBudgetExceededError(
+                f"{scope['method']} {path} ran {stats.count} queries, "
+                f"budget is {settings.query_budget}"
+            )
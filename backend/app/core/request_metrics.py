@@ -0,0 +1,88 @@
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import Histogram
+from app.core.response_cache import CACHED_ROUTES
+
+# Seconds, from cached responses to slow exports.
+LATENCY_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class RouteSeries:
+    __slots__ = ("route", "histograms", "exceptions")
+
+    def __init__(self, route: str):
+        self.route = route
+        self.histograms: dict[str, Histogram] = {}
+        self.exceptions = 0
+
+    def histogram(self, method: str) -> Histogram:
+        histogram = self.histograms.get(method)
+        if histogram is None:
+            histogram = self.histograms.setdefault(method, Histogram(LATENCY_BUCKETS_SECONDS))
+        return histogram
+
+
+class RequestMetrics:
+    # Series are keyed by the matched endpoint (handler function or mounted
+    # app), so after a route's first request recording is two dict lookups
+    # and a bisect: no label strings or tuples are built per request.
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self._series: dict[object, RouteSeries] = {}
+        self._unmatched = RouteSeries("<unmatched>")
+
+    def series(self, scope: Scope) -> RouteSeries:
+        key = scope.get("endpoint")
+        if key is None:
+            # Answered by the response cache before routing, or a 404.
+            key = scope["path"]
+            if key not in CACHED_ROUTES:
+                return self._unmatched
+        series = self._series.get(key)
+        if series is None:
+            route = scope.get("route")
+            if isinstance(key, str):
+                label = f"{key} (cached)"
+            elif route is not None:
+                label = route.path
+            else:
+                # Mounted apps (static media) have no route template.
+                label = f"{scope.get('root_path', '')}/{{path}}"
+            series = self._series.setdefault(key, RouteSeries(label))
+        return series
+
+    def all_series(self) -> list[RouteSeries]:
+        return [*self._series.values(), self._unmatched]
+
+
+request_metrics = RequestMetrics()
+
+
+class RequestMetricsMiddleware:
+    # Outermost, so latency covers every other middleware. The clock stops
+    # when the response is fully sent, so streamed responses (SSE) report
+    # their connection lifetime under their own route.
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # Only touched from the event loop, so plain integers are safe.
+        request_metrics.in_flight += 1
+        started = time.perf_counter()
+        failed = False
+        try:
+            await self.app(scope, receive, send)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            request_metrics.in_flight -= 1
+            series = request_metrics.series(scope)
+            series.histogram(scope["method"]).observe(time.perf_counter() - started)
+            if failed:
+                series.exceptions += 1
@@ -0,0 +1,123 @@
+import hashlib
+import threading
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Public anonymous GET routes and the content namespace that invalidates them.
+CACHED_ROUTES = {
+    "/weekly-verse/current": "weekly_verses",
+    "/sunday-messages/latest": "sunday_messages",
+    "/life-bulletins/latest": "life_bulletins",
+    "/events": "events",
+    "/prayers": "prayers",
+}
+
+response_cache = TTLCache(
+    "responses",
+    maxsize=settings.response_cache_max_size,
+    ttl=settings.response_cache_ttl_seconds,
+)
+
+# Bumping a namespace's generation orphans every entry cached under the old
+# one, so invalidation is O(1) and a request that read stale rows before the
+# bump can never store them under the new generation.
+_generations: dict[str, int] = {namespace: 0 for namespace in CACHED_ROUTES.values()}
+_generations_lock = threading.Lock()
+
+
+def invalidate_responses(*namespaces: str) -> None:
+    with _generations_lock:
+        for namespace in namespaces:
+            _generations[namespace] = _generations.get(namespace, 0) + 1
+
+
+def _normalized_query(query_string: bytes) -> str:
+    params = [(key, value) for key, value in parse_qsl(query_string.decode("latin-1")) if value]
+    return urlencode(sorted(params))
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCacheMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.cache_control = (
+            f"public, max-age={settings.response_cache_max_age}, must-revalidate".encode()
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        namespace = CACHED_ROUTES.get(scope["path"])
+        if namespace is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["path"], _normalized_query(scope["query_string"]), _generations[namespace])
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        cached = response_cache.get(key)
+        if cached is not None:
+            headers, body, etag = cached
+            await self._send_cached(send, headers, body, etag, if_none_match)
+            return
+
+        start: Optional[Message] = None
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                if start["status"] != 200:
+                    await send(message)
+                return
+            if start is None or start["status"] != 200:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            headers = [
+                (name, value)
+                for name, value in start["headers"]
+                if name.lower() not in (b"etag", b"cache-control")
+            ]
+            response_cache.set(key, (headers, body, etag))
+            await self._send_cached(send, headers, body, etag, if_none_match)
+
+        await self.app(scope, receive, capture)
+
+    async def _send_cached(
+        self,
+        send: Send,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+        etag: str,
+        if_none_match: Optional[str],
+    ) -> None:
+        validators = [(b"etag", etag.encode()), (b"cache-control", self.cache_control)]
+        if _etag_matches(if_none_match, etag):
+            await send({"type": "http.response.start", "status": 304, "headers": validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": headers + validators}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,45 @@
+import re
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Upload routes and the setting holding their per-file limit.
+UPLOAD_ROUTES = (
+    (re.compile(r"/events/[^/]+/poster"), "poster_max_bytes"),
+    (re.compile(r"/life-bulletins/[^/]+/video"), "video_max_bytes"),
+)
+# Boundaries and part headers of the multipart body on top of the file.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def upload_limit(path: str) -> Optional[int]:
+    for pattern, setting in UPLOAD_ROUTES:
+        if pattern.fullmatch(path):
+            return getattr(settings, setting)
+    return None
+
+
+class UploadLimitMiddleware:
+    # FastAPI spools the whole multipart body to disk before any dependency or
+    # handler runs, so an oversized upload is refused here on Content-Length
+    # instead. store_upload still counts the bytes it copies, which covers
+    # chunked bodies that announce no length.
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "POST":
+            limit = upload_limit(scope["path"])
+            length = Headers(scope=scope).get("content-length")
+            if limit is not None and length and length.isdigit():
+                if int(length) > limit + MULTIPART_OVERHEAD_BYTES:
+                    response = JSONResponse(
+                        {"detail": f"File exceeds {limit} bytes"}, status_code=413
+                    )
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Type
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import Pool
+
+from app.core.metrics import Histogram
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        # Time spent in pool.connect(): queue wait, new connections and pre-ping.
+        self.checkout_latency_ms = Histogram()
+        # Time a connection stays checked out, i.e. per-request DB occupancy.
+        self.hold_time_ms = Histogram()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool: Pool) -> dict:
+        status = {}
+        for key in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, key, None)
+            if method is not None:
+                status[key] = method()
+        return {
+            "name": self.name,
+            "pool": type(pool).__name__,
+            **status,
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            "timeout": getattr(pool, "_timeout", None),
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "checkout_latency_ms": self.checkout_latency_ms.snapshot(),
+            "hold_time_ms": self.hold_time_ms.snapshot(),
+        }
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    # A per-engine subclass so dispose(), which builds a new pool of the
+    # same class, keeps reporting into the same metrics.
+    class InstrumentedPool(base):
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                return super().connect()
+            except exc.TimeoutError:
+                metrics.incr("timeouts")
+                raise
+            finally:
+                metrics.checkout_latency_ms.observe((time.perf_counter() - started) * 1000)
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def listen_pool_events(engine: Engine, metrics: PoolMetrics) -> None:
+    # Engine-level listeners survive dispose(), which recreates the pool.
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        metrics.incr("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            metrics.hold_time_ms.observe((time.perf_counter() - started) * 1000)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
@@ -0,0 +1,59 @@
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import Engine, event
+
+# Bind parameters, literals and expanded IN lists fold into "?", so the same
+# query issued once per row of a loop has one shape.
+_LITERAL = re.compile(r"%\(\w+\)s|%s|\$\d+|'(?:[^']|'')*'|\b\d+\b")
+_LIST = re.compile(r"\(\?(?:::\w+)?(?:,\s*\?(?:::\w+)?)+\)")
+
+
+@lru_cache(maxsize=2048)
+def statement_shape(statement: str) -> str:
+    shape = _LIST.sub("(?)", _LITERAL.sub("?", statement))
+    return " ".join(shape.split())
+
+
+class QueryStats:
+    # One per request; the listeners below add to whichever one is current.
+    __slots__ = ("count", "duration_ms", "shapes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_ms = 0.0
+        self.shapes: dict[str, int] = {}
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.duration_ms += duration_ms
+        shape = statement_shape(statement)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+# Set by QueryStatsMiddleware. Threadpool calls run in a copy of the request's
+# context, so queries from sync handlers land on the same object.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def listen_query_events(engine: Engine) -> None:
+    # Outside a request (workers, scripts) nothing is recorded.
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if current_query_stats.get() is not None:
+            conn.info["query_started_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = current_query_stats.get()
+        started = conn.info.pop("query_started_at", None)
+        if stats is not None and started is not None:
+            stats.record(statement, (time.perf_counter() - started) * 1000)
@@ -1,8 +1,51 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.db.pool_metrics import PoolMetrics, instrumented_pool_class, listen_pool_events
+from app.db.query_stats import listen_query_events
 
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+pool_options = {
+    "pool_size": settings.database_pool_size,
+    "max_overflow": settings.database_max_overflow,
+    "pool_timeout": settings.database_pool_timeout,
+    "pool_recycle": settings.database_pool_recycle,
+    "pool_pre_ping": settings.database_pool_pre_ping,
+}
+
+pool_metrics = PoolMetrics("sync")
+engine = create_engine(
+    settings.database_url,
+    poolclass=instrumented_pool_class(QueuePool, pool_metrics),
+    **pool_options,
+)
+listen_pool_events(engine, pool_metrics)
+listen_query_events(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_pool_metrics = None
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_mode == "async":
+    async_pool_metrics = PoolMetrics("async")
+    # postgresql+psycopg resolves to psycopg's async driver here.
+    async_engine = create_async_engine(
+        settings.database_url,
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, async_pool_metrics),
+        **pool_options,
+    )
+    listen_pool_events(async_engine.sync_engine, async_pool_metrics)
+    listen_query_events(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+def pool_stats() -> list[dict]:
+    stats = [pool_metrics.snapshot(engine.pool)]
+    if async_engine is not None:
+        stats.append(async_pool_metrics.snapshot(async_engine.sync_engine.pool))
+    return stats
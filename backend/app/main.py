@@ -1,7 +1,8 @@
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routes import (
@@ -12,30 +13,69 @@ from app.api.routes import (
     events,
     health,
     life_bulletins,
+    metrics,
     prayers,
     registrations,
     sunday_messages,
     weekly_verse,
 )
 import app.models  # noqa: F401
+from app.api.pagination import EXPOSED_HEADERS
 from app.core.config import settings
+from app.core.media import MediaFiles
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.request_metrics import RequestMetricsMiddleware
+from app.core.response_cache import ResponseCacheMiddleware
+from app.core.upload_limits import UploadLimitMiddleware
+from app.services.pagination import InvalidCursorError
+from app.services.passwords import PasswordHasherBusyError
 
 
 app = FastAPI(title="Liferiverchurch API", version="0.1.0")
 
 STATIC_DIR = Path(__file__).resolve().parents[1] / "static"
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
+# Uploaded media first: the generic /static mount would otherwise shadow them.
+for media_dir in ("posters", "life-bulletins"):
+    (STATIC_DIR / media_dir).mkdir(exist_ok=True)
+    app.mount(f"/static/{media_dir}", MediaFiles(directory=STATIC_DIR / media_dir), name=media_dir)
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
+app.add_middleware(ResponseCacheMiddleware)
+# Outside the response cache, so a cached response is not served with the
+# Server-Timing of the request that filled it.
+app.add_middleware(QueryStatsMiddleware)
+# Inside CORS, so browsers can read the 413.
+app.add_middleware(UploadLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[origin.strip() for origin in settings.allowed_origins.split(",")],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=EXPOSED_HEADERS,
 )
+app.add_middleware(RequestMetricsMiddleware)
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(settings.password_hash_retry_after_seconds)},
+    )
+
 
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(auth.router)
 app.include_router(dashboard.router)
 app.include_router(events.router)
@@ -12,3 +12,13 @@ class DashboardSummary(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
     data = Column(JSONB, nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class DashboardSummaryQueue(Base):
+    # Users whose summary is stale; drained by app.workers.dashboard.
+    __tablename__ = "dashboard_summary_queue"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    queued_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
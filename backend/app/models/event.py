@@ -2,7 +2,7 @@ import enum
 import uuid
 
 from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -22,6 +22,7 @@ class Event(Base):
     title = Column(String, nullable=False)
     description = Column(Text)
     poster_url = Column(String)
+    poster_srcset = Column(JSONB)
     start_at = Column(DateTime(timezone=True), nullable=False)
     end_at = Column(DateTime(timezone=True))
     capacity = Column(Integer)
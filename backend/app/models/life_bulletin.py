@@ -13,6 +13,13 @@ class LifeBulletinStatus(str, enum.Enum):
     published = "Published"
 
 
+class LifeBulletinVideoStatus(str, enum.Enum):
+    queued = "Queued"
+    processing = "Processing"
+    ready = "Ready"
+    failed = "Failed"
+
+
 class LifeBulletin(Base):
     __tablename__ = "life_bulletins"
 
@@ -21,6 +28,16 @@ class LifeBulletin(Base):
     bulletin_date = Column(Date, nullable=False)
     content = Column(Text, nullable=False)
     video_url = Column(String)
+    # The raw upload behind video_url; HLS jobs only apply while it is current.
+    video_source_url = Column(String)
+    video_poster_url = Column(String)
+    video_status = Column(
+        Enum(
+            LifeBulletinVideoStatus,
+            values_callable=lambda items: [item.value for item in items],
+            name="life_bulletin_video_status",
+        )
+    )
     status = Column(
         Enum(
             LifeBulletinStatus,
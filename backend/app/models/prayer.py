@@ -1,8 +1,8 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, Text, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Integer, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -47,3 +47,26 @@ class PrayerRequest(Base):
     )
     amen_count = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class PrayerAmen(Base):
+    # One row per (prayer, user): an amen counts once per member.
+    __tablename__ = "prayer_amens"
+
+    prayer_id = Column(
+        UUID(as_uuid=True), ForeignKey("prayer_requests.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class PrayerWallEvent(Base):
+    # Changes pushed to prayer wall viewers; the id doubles as the SSE event id
+    # a reconnecting client replays from.
+    __tablename__ = "prayer_wall_events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    site_id = Column(UUID(as_uuid=True))
+    type = Column(Text, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
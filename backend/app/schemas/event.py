@@ -37,5 +37,7 @@ class EventUpdate(BaseModel):
 
 class EventOut(EventBase):
     id: UUID
+    # MIME type -> srcset of resized poster derivatives, filled in after upload.
+    poster_srcset: Optional[dict[str, str]] = None
     created_at: datetime
     created_by: Optional[UUID] = None
@@ -0,0 +1,35 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.user import MemberType
+from app.schemas.care import CareSubjectCreate
+from app.schemas.user import UserCreate
+
+
+class MemberImportRow(UserCreate):
+    # Rosters rarely carry passwords; a blank one leaves the account without
+    # a usable password until staff reset it.
+    password: Optional[str] = None
+    phone: Optional[str] = None
+    member_type: MemberType = MemberType.member
+    site_id: Optional[UUID] = None
+
+
+class CareSubjectImportRow(CareSubjectCreate):
+    site_id: Optional[UUID] = None
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class ImportReport(BaseModel):
+    total: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, HttpUrl
 
-from app.models.life_bulletin import LifeBulletinStatus
+from app.models.life_bulletin import LifeBulletinStatus, LifeBulletinVideoStatus
 
 
 class LifeBulletinBase(BaseModel):
@@ -28,5 +28,9 @@ class LifeBulletinUpdate(BaseModel):
 
 class LifeBulletinOut(LifeBulletinBase):
     id: UUID
+    # Uploaded videos and HLS playlists are served from /static, not absolute URLs.
+    video_url: Optional[str] = None
+    video_poster_url: Optional[str] = None
+    video_status: Optional[LifeBulletinVideoStatus] = None
     created_at: datetime
     updated_at: datetime
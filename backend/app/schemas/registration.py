@@ -58,3 +58,34 @@ class RegistrationAdminOut(BaseModel):
     proxy_entries: list[ProxyEntry] = Field(default_factory=list)
     created_at: datetime
     updated_at: Optional[datetime] = None
+
+
+class RegistrationBulkFilter(BaseModel):
+    status: Optional[RegistrationStatus] = None
+    q: Optional[str] = None
+    # Required to match every registration of the event when status and q are unset.
+    all: bool = False
+
+
+class RegistrationBulkUpdate(BaseModel):
+    event_id: UUID
+    # Exactly one of ids or filter picks the registrations.
+    ids: Optional[list[UUID]] = Field(None, max_length=5000)
+    filter: Optional[RegistrationBulkFilter] = None
+    status: Optional[RegistrationStatus] = None
+    ticket_count: Optional[int] = Field(None, ge=1)
+
+
+class RegistrationBulkOutcome(BaseModel):
+    id: UUID
+    # updated, unchanged, event_full or not_found
+    outcome: str
+    status: Optional[RegistrationStatus] = None
+    ticket_count: Optional[int] = None
+
+
+class RegistrationBulkResult(BaseModel):
+    updated: int
+    results: list[RegistrationBulkOutcome]
+    # Waitlisted registrations admitted into seats the update freed.
+    promoted: list[UUID] = Field(default_factory=list)
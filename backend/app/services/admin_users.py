@@ -1,11 +1,13 @@
 from typing import Optional
 
-from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from app.core.security import hash_password
 from app.models.user import User, UserRole
 from app.schemas.admin_user import AdminUserUpdate
+from app.services.auth import invalidate_user
+from app.services.dashboard import mark_dashboards_stale
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.search import search_filter
 
 
 def list_users(
@@ -18,13 +20,11 @@ def list_users(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
-) -> list[User]:
+    cursor: Optional[str] = None,
+) -> Page:
     query_set = db.query(User)
     if query:
-        like_value = f"%{query}%"
-        query_set = query_set.filter(
-            or_(User.email.ilike(like_value), User.full_name.ilike(like_value))
-        )
+        query_set = query_set.filter(search_filter(query, User.email, User.full_name))
     if role:
         query_set = query_set.filter(User.role == role)
     if site_id:
@@ -37,11 +37,9 @@ def list_users(
         "full_name": User.full_name,
     }
     sort_column = sort_map.get(sort_by, User.created_at)
-    if sort_dir == "asc":
-        query_set = query_set.order_by(sort_column.asc())
-    else:
-        query_set = query_set.order_by(sort_column.desc())
-    return query_set.offset(offset).limit(limit).all()
+    query_set = order_by_keyset(query_set, sort_column, User.id, sort_dir != "asc", cursor)
+    rows = query_set.offset(offset).limit(limit + 1).all()
+    return page_of(rows, limit, sort_column, User.id)
 
 
 def update_user(db: Session, user_id: str, payload: AdminUserUpdate) -> Optional[User]:
@@ -49,18 +47,22 @@ def update_user(db: Session, user_id: str, payload: AdminUserUpdate) -> Optional
     if not user:
         return None
     updates = payload.model_dump(exclude_unset=True)
+    if "site_id" in updates and updates["site_id"] != user.site_id:
+        mark_dashboards_stale(db, [user.id])
     for key, value in updates.items():
         setattr(user, key, value)
     db.commit()
+    invalidate_user(user.email)
     db.refresh(user)
     return user
 
 
-def reset_password(db: Session, user_id: str, password: str) -> Optional[User]:
+def reset_password(db: Session, user_id: str, password_hash: str) -> Optional[User]:
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         return None
-    user.password_hash = hash_password(password)
+    user.password_hash = password_hash
     db.commit()
+    invalidate_user(user.email)
     db.refresh(user)
     return user
@@ -0,0 +1,148 @@
+import atexit
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.response_cache import invalidate_responses
+from app.db.session import SessionLocal
+from app.models.prayer import PrayerRequest, PrayerStatus
+from app.services.dashboard import mark_dashboards_stale
+from app.services.prayer_wall import amen_count_event, publish_wall_events
+
+logger = logging.getLogger(__name__)
+
+# Whether a prayer may receive amens, so a burst of taps on one prayer costs
+# a single lookup rather than one per tap.
+amen_targets = TTLCache("amen_targets", maxsize=10000, ttl=settings.amen_target_ttl_seconds)
+
+# Inserts the new (prayer, user) pairs and bumps each prayer once by the number
+# that were actually new, all in one statement. prayer_amens' primary key does
+# the per-user dedup, so repeats across flushes, workers and restarts never
+# count twice, and each hot prayer row is locked once per flush, not per tap.
+# Prayer rows are locked in id order first, so concurrent flushes from other
+# workers queue instead of deadlocking. Pairs whose prayer or user has been
+# deleted since the tap are dropped rather than failing the whole batch.
+FLUSH_SQL = text(
+    """
+    with targets as materialized (
+        select id from prayer_requests
+        where id = any(cast(:prayer_ids as uuid[]))
+        order by id
+        for no key update
+    ), new_amens as (
+        insert into prayer_amens (prayer_id, user_id)
+        select pairs.prayer_id, pairs.user_id
+        from unnest(cast(:prayer_ids as uuid[]), cast(:user_ids as uuid[]))
+            as pairs (prayer_id, user_id)
+        join targets on targets.id = pairs.prayer_id
+        join users on users.id = pairs.user_id
+        order by pairs.prayer_id, pairs.user_id
+        on conflict do nothing
+        returning prayer_id
+    ), counts as (
+        select prayer_id, count(*) as amens from new_amens group by prayer_id
+    )
+    update prayer_requests
+    set amen_count = prayer_requests.amen_count + counts.amens
+    from counts
+    where prayer_requests.id = counts.prayer_id
+    returning prayer_requests.id, prayer_requests.user_id, prayer_requests.site_id,
+              prayer_requests.amen_count, counts.amens
+    """
+)
+
+
+def can_receive_amen(db: Session, prayer_id: str) -> bool:
+    allowed = amen_targets.get(prayer_id)
+    if allowed is None:
+        status = (
+            db.query(PrayerRequest.status).filter(PrayerRequest.id == prayer_id).scalar()
+        )
+        allowed = status == PrayerStatus.approved
+        amen_targets.set(prayer_id, allowed)
+    return allowed
+
+
+def flush_amens(db: Session, pairs: list[tuple[str, str]]) -> list:
+    if not pairs:
+        return []
+    prayer_ids, user_ids = zip(*sorted(pairs))
+    updated = db.execute(
+        FLUSH_SQL, {"prayer_ids": list(prayer_ids), "user_ids": list(user_ids)}
+    ).all()
+    # A prayer's first amen changes its owner's dashboard.
+    mark_dashboards_stale(db, [row.user_id for row in updated if row.amen_count == row.amens])
+    # One total per prayer per flush, however many taps it took.
+    publish_wall_events(db, [amen_count_event(row) for row in updated])
+    db.commit()
+    if updated:
+        invalidate_responses("prayers")
+    return updated
+
+
+class AmenBacklogFullError(RuntimeError):
+    pass
+
+
+class AmenBuffer:
+    # Collects amens in memory and writes them from a background thread every
+    # amen_flush_interval_seconds, or sooner once amen_flush_batch_size pairs
+    # are pending. Repeated taps by one user inside a window collapse here.
+    def __init__(self) -> None:
+        self._pending: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushed = 0
+
+    def add(self, prayer_id: str, user_id: str) -> bool:
+        pair = (str(prayer_id), str(user_id))
+        with self._lock:
+            if pair in self._pending:
+                return False
+            # Only reachable while flushes keep failing; shed load, don't grow.
+            if len(self._pending) >= settings.amen_max_pending:
+                raise AmenBacklogFullError("Too many amens pending")
+            self._pending.add(pair)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="amen-flush", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+            if len(self._pending) >= settings.amen_flush_batch_size:
+                self._wake.set()
+        return True
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        with self._lock:
+            pairs, self._pending = list(self._pending), set()
+        if not pairs:
+            return 0
+        try:
+            with SessionLocal() as db:
+                flush_amens(db, pairs)
+        except Exception:
+            # Keep the amens for the next attempt; the insert is idempotent.
+            logger.exception("Amen flush failed; retrying %d pending", len(pairs))
+            with self._lock:
+                self._pending.update(pairs)
+            return 0
+        self.flushed += len(pairs)
+        return len(pairs)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(settings.amen_flush_interval_seconds)
+            self._wake.clear()
+            self.flush()
+
+
+amen_buffer = AmenBuffer()
@@ -1,20 +1,56 @@
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import inspect, update
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from app.core.security import hash_password, verify_password
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.passwords import hash_password_async, verify_password_async
+
+# Authenticated principals keyed by token subject (the user's email).
+user_cache = TTLCache(
+    "users",
+    maxsize=settings.user_cache_max_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
-def create_user(db: Session, payload: UserCreate) -> User:
+def _detached_copy(user: User) -> User:
+    values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    copy = User(**values)
+    make_transient_to_detached(copy)
+    return copy
+
+
+def get_user_by_subject(db: Session, subject: str) -> Optional[User]:
+    cached = user_cache.get(subject)
+    if cached is not None:
+        # load=False attaches a session-local copy without a SELECT, so
+        # handlers can still modify and commit the returned user.
+        return db.merge(cached, load=False)
+    user = get_user_by_email(db, subject)
+    if user:
+        user_cache.set(subject, _detached_copy(user))
+    return user
+
+
+def invalidate_user(*subjects: Optional[str]) -> None:
+    for subject in subjects:
+        if subject:
+            user_cache.delete(subject)
+
+
+def create_user(db: Session, payload: UserCreate, password_hash: str) -> User:
     user = User(
         email=payload.email,
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
         full_name=payload.full_name,
         role=UserRole.member,
     )
@@ -24,30 +60,77 @@ def create_user(db: Session, payload: UserCreate) -> User:
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+def set_password_hash(db: Session, user: User, password_hash: str) -> User:
+    user.password_hash = password_hash
+    db.commit()
+    invalidate_user(user.email)
+    db.refresh(user)
+    return user
+
+
+# While a password is hashed the request must not hold a pooled connection:
+# during a login spike that pins one connection per queued login. Each DB
+# step below ends its transaction in the same threadpool call, because a
+# connection waiting for a free thread to be handed back deadlocks against
+# threads waiting for a free connection.
+def get_user_detached(db: Session, email: str) -> Optional[User]:
     user = get_user_by_email(db, email)
+    if user:
+        # Columns stay loaded after the rollback since it is detached.
+        db.expunge(user)
+    db.rollback()
+    return user
+
+
+def _store_rehash(db: Session, user: User, password_hash: str) -> None:
+    db.execute(update(User).where(User.id == user.id).values(password_hash=password_hash))
+    db.commit()
+    user.password_hash = password_hash
+    invalidate_user(user.email)
+
+
+async def release_connection(db: Session) -> None:
+    if db.in_transaction():
+        await run_in_threadpool(db.rollback)
+
+
+# Both await the hashing processes and raise PasswordHasherBusyError when
+# their queue is full.
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+    user = await run_in_threadpool(get_user_detached, db, email)
     if not user:
         return None
     if not user.is_active:
         return None
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = await verify_password_async(password, user.password_hash)
+    if not valid:
         return None
+    if new_hash:
+        # Stored at an outdated bcrypt cost; the plain password is only
+        # available now, so upgrade it in place.
+        await run_in_threadpool(_store_rehash, db, user, new_hash)
     return user
 
 
 def update_user_profile(db: Session, user: User, payload: UserUpdate) -> User:
+    previous_email = user.email
     updates = payload.model_dump(exclude_unset=True)
     for key, value in updates.items():
         setattr(user, key, value)
     db.commit()
+    invalidate_user(previous_email, user.email)
     db.refresh(user)
     return user
 
 
-def change_password(db: Session, user: User, current_password: str, new_password: str) -> bool:
-    if not verify_password(current_password, user.password_hash):
+async def change_password(
+    db: Session, user: User, current_password: str, new_password: str
+) -> bool:
+    stored_hash = user.password_hash
+    await release_connection(db)
+    valid, _ = await verify_password_async(current_password, stored_hash)
+    if not valid:
         return False
-    user.password_hash = hash_password(new_password)
-    db.commit()
-    db.refresh(user)
+    password_hash = await hash_password_async(new_password)
+    await run_in_threadpool(set_password_hash, db, user, password_hash)
     return True
@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 
 from app.models.care import CareLog, CareSubject, CareSubjectStatus
 from app.schemas.care import CareLogCreate, CareSubjectCreate
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.search import search_filter
 
 
 def list_subjects(
@@ -15,25 +17,23 @@ def list_subjects(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
-) -> list[CareSubject]:
+    cursor: Optional[str] = None,
+) -> Page:
     query_set = db.query(CareSubject)
     if site_id:
         query_set = query_set.filter(CareSubject.site_id == site_id)
     if status:
         query_set = query_set.filter(CareSubject.status == status)
     if query:
-        like_value = f"%{query}%"
-        query_set = query_set.filter(CareSubject.name.ilike(like_value))
+        query_set = query_set.filter(search_filter(query, CareSubject.name))
     sort_map = {
         "created_at": CareSubject.created_at,
         "name": CareSubject.name,
     }
     sort_column = sort_map.get(sort_by, CareSubject.created_at)
-    if sort_dir == "asc":
-        query_set = query_set.order_by(sort_column.asc())
-    else:
-        query_set = query_set.order_by(sort_column.desc())
-    return query_set.offset(offset).limit(limit).all()
+    query_set = order_by_keyset(query_set, sort_column, CareSubject.id, sort_dir != "asc", cursor)
+    rows = query_set.offset(offset).limit(limit + 1).all()
+    return page_of(rows, limit, sort_column, CareSubject.id)
 
 
 def create_subject(db: Session, payload: CareSubjectCreate) -> CareSubject:
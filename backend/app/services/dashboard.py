@@ -1,9 +1,222 @@
-from typing import Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional
 
+from sqlalchemy import Date, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from app.models.dashboard import DashboardSummary
+from app.core.config import settings
+from app.models.dashboard import DashboardSummary, DashboardSummaryQueue
+from app.models.event import Event
+from app.models.prayer import PrayerRequest
+from app.models.registration import EventRegistration, RegistrationStatus
+from app.models.user import User
+from app.models.weekly_verse import WeeklyVerse
+from app.schemas.dashboard import DailyVerse
+from app.schemas.dashboard import DashboardSummary as DashboardSummaryData
+
+RECENT_LIMIT = 5
+DEFAULT_VERSE = DailyVerse(text="凡勞苦擔重擔的人，可以到我這裡來。", reference="馬太福音 11:28")
+REGISTRATION_LABELS = {
+    RegistrationStatus.pending: "待確認",
+    RegistrationStatus.confirmed: "已確認",
+    RegistrationStatus.waitlisted: "候補中",
+}
 
 
 def fetch_dashboard_summary(db: Session, user_id) -> Optional[DashboardSummary]:
     return db.query(DashboardSummary).filter(DashboardSummary.user_id == user_id).first()
+
+
+# Callers mark users stale inside the transaction that changes their data, so
+# a summary can never miss a committed change. The queue row is keyed by user,
+# so repeated changes before the next refresh collapse into one recompute.
+def mark_dashboards_stale(db: Session, user_ids: Iterable) -> None:
+    rows = [{"user_id": user_id} for user_id in {user_id for user_id in user_ids if user_id}]
+    if rows:
+        db.execute(insert(DashboardSummaryQueue).values(rows).on_conflict_do_nothing())
+
+
+def _queue_from(db: Session, user_ids_statement) -> None:
+    db.execute(
+        insert(DashboardSummaryQueue)
+        .from_select(["user_id"], user_ids_statement)
+        .on_conflict_do_nothing()
+    )
+
+
+def mark_site_dashboards_stale(db: Session, site_id) -> None:
+    _queue_from(db, select(User.id).where(User.site_id == site_id))
+
+
+def mark_event_dashboards_stale(db: Session, event_id) -> None:
+    _queue_from(
+        db,
+        select(EventRegistration.user_id)
+        .where(EventRegistration.event_id == event_id, EventRegistration.user_id.is_not(None))
+        .distinct(),
+    )
+
+
+def queue_all_dashboards(db: Session) -> None:
+    _queue_from(db, select(User.id).where(User.is_active.is_(True)))
+    db.commit()
+
+
+def queue_week_rollover(db: Session, today: Optional[date] = None) -> None:
+    # A verse whose week started after a summary was built has since become
+    # the site's current verse without any write to mark it.
+    today = today or date.today()
+    _queue_from(
+        db,
+        select(DashboardSummary.user_id)
+        .join(User, User.id == DashboardSummary.user_id)
+        .join(WeeklyVerse, WeeklyVerse.site_id == User.site_id)
+        .where(
+            WeeklyVerse.week_start <= today,
+            WeeklyVerse.week_start > cast(DashboardSummary.updated_at, Date),
+        )
+        .distinct(),
+    )
+    db.commit()
+
+
+def _ranked(statement, partition, order):
+    ranked = statement.add_columns(
+        func.row_number().over(partition_by=partition, order_by=order).label("rank")
+    ).subquery()
+    return select(ranked).where(ranked.c.rank <= RECENT_LIMIT)
+
+
+def _day(value: datetime) -> str:
+    local = value.astimezone(timezone(timedelta(hours=settings.dashboard_utc_offset_hours)))
+    return local.strftime("%m/%d")
+
+
+def build_dashboard_summaries(db: Session, user_ids: list) -> dict:
+    # A fixed number of set-based queries for the whole batch, however large.
+    users = db.execute(select(User.id, User.site_id).where(User.id.in_(user_ids))).all()
+    if not users:
+        return {}
+    user_ids = [user.id for user in users]
+    site_ids = {user.site_id for user in users if user.site_id}
+
+    verses = {}
+    if site_ids:
+        for verse in db.scalars(
+            select(WeeklyVerse)
+            .where(WeeklyVerse.site_id.in_(site_ids), WeeklyVerse.week_start <= date.today())
+            .distinct(WeeklyVerse.site_id)
+            .order_by(WeeklyVerse.site_id, WeeklyVerse.week_start.desc())
+        ):
+            verses[verse.site_id] = DailyVerse(text=verse.text, reference=verse.reference)
+
+    registrations: dict = {user_id: [] for user_id in user_ids}
+    for row in db.execute(
+        _ranked(
+            select(
+                EventRegistration.user_id,
+                EventRegistration.status,
+                EventRegistration.created_at,
+                Event.title,
+            )
+            .join(Event, Event.id == EventRegistration.event_id)
+            .where(
+                EventRegistration.user_id.in_(user_ids),
+                EventRegistration.status != RegistrationStatus.cancelled,
+            ),
+            EventRegistration.user_id,
+            EventRegistration.created_at.desc(),
+        )
+    ):
+        registrations[row.user_id].append(row)
+
+    prayers: dict = {user_id: [] for user_id in user_ids}
+    for row in db.execute(
+        _ranked(
+            select(PrayerRequest.user_id, PrayerRequest.created_at).where(
+                PrayerRequest.user_id.in_(user_ids)
+            ),
+            PrayerRequest.user_id,
+            PrayerRequest.created_at.desc(),
+        )
+    ):
+        prayers[row.user_id].append(row)
+
+    answered = dict(
+        db.execute(
+            select(PrayerRequest.user_id, func.count())
+            .where(PrayerRequest.user_id.in_(user_ids), PrayerRequest.amen_count > 0)
+            .group_by(PrayerRequest.user_id)
+        ).all()
+    )
+
+    summaries = {}
+    for user in users:
+        activity = [
+            (row.created_at, f"{_day(row.created_at)} 已報名「{row.title}」")
+            for row in registrations[user.id]
+        ] + [(row.created_at, f"{_day(row.created_at)} 已新增代禱事項") for row in prayers[user.id]]
+        activity.sort(key=lambda item: item[0], reverse=True)
+        answered_count = answered.get(user.id, 0)
+        summaries[user.id] = DashboardSummaryData(
+            daily_verse=verses.get(user.site_id, DEFAULT_VERSE),
+            checkin_qr_hint="主日/活動簽到快速通行",
+            giving_masked="******",
+            giving_last="尚無奉獻紀錄",
+            registrations=[
+                f"{row.title} · {REGISTRATION_LABELS[row.status]}" for row in registrations[user.id]
+            ],
+            prayer_response_count=answered_count,
+            prayer_message=(
+                f"{answered_count} 則代禱已被回應" if answered_count else "代禱事項尚未被回應"
+            ),
+            group_name="尚未加入小組",
+            group_schedule="",
+            group_leader="",
+            notifications=[],
+            recent_activity=[text for _, text in activity[:RECENT_LIMIT]],
+        ).model_dump()
+    return summaries
+
+
+def write_dashboard_summaries(db: Session, summaries: dict) -> list[DashboardSummary]:
+    if not summaries:
+        return []
+    statement = insert(DashboardSummary).values(
+        [{"user_id": user_id, "data": data} for user_id, data in summaries.items()]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[DashboardSummary.user_id],
+        set_={"data": statement.excluded.data, "updated_at": func.now()},
+    ).returning(DashboardSummary)
+    return list(db.scalars(statement, execution_options={"populate_existing": True}))
+
+
+def refresh_dashboard_summary(db: Session, user_id) -> Optional[DashboardSummary]:
+    records = write_dashboard_summaries(db, build_dashboard_summaries(db, [user_id]))
+    db.commit()
+    return records[0] if records else None
+
+
+def refresh_stale_dashboards(db: Session, batch_size: Optional[int] = None) -> int:
+    # Claiming (deleting queue rows), rebuilding and writing share one
+    # transaction: a change committed meanwhile re-queues its user once the
+    # claim commits, and SKIP LOCKED lets several workers split the queue.
+    claimed = (
+        select(DashboardSummaryQueue.user_id)
+        .order_by(DashboardSummaryQueue.queued_at)
+        .limit(batch_size or settings.dashboard_refresh_batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    user_ids = db.scalars(
+        delete(DashboardSummaryQueue)
+        .where(DashboardSummaryQueue.user_id.in_(claimed))
+        .returning(DashboardSummaryQueue.user_id)
+    ).all()
+    if not user_ids:
+        db.commit()
+        return 0
+    write_dashboard_summaries(db, build_dashboard_summaries(db, user_ids))
+    db.commit()
+    return len(user_ids)
@@ -1,12 +1,51 @@
 from typing import Optional
 
-from sqlalchemy import or_
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
+from app.core.response_cache import invalidate_responses
 from app.models.event import Event
 from app.models.event import EventStatus
 from app.schemas.event import EventCreate, EventUpdate
+from app.services.dashboard import mark_event_dashboards_stale
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.search import search_filter
+
+
+def get_event_by_id(db: Session, event_id: str) -> Optional[Event]:
+    return db.query(Event).filter(Event.id == event_id).first()
+
+
+def _sort_column(sort_by: str):
+    sort_map = {
+        "start_at": Event.start_at,
+        "created_at": Event.created_at,
+        "title": Event.title,
+    }
+    return sort_map.get(sort_by, Event.start_at)
+
+
+def _events_statement(
+    site_id: Optional[str] = None,
+    status: Optional[EventStatus] = None,
+    query: Optional[str] = None,
+    upcoming_only: bool = False,
+    sort_by: str = "start_at",
+    sort_dir: str = "asc",
+    cursor: Optional[str] = None,
+) -> Select:
+    statement = select(Event)
+    if site_id:
+        statement = statement.where(Event.site_id == site_id)
+    if status:
+        statement = statement.where(Event.status == status)
+    if query:
+        statement = statement.where(search_filter(query, Event.title, Event.description))
+    if upcoming_only:
+        statement = statement.where(Event.start_at >= func.now())
+    return order_by_keyset(statement, _sort_column(sort_by), Event.id, sort_dir == "desc", cursor)
 
 
 def list_events(
@@ -19,35 +58,35 @@ def list_events(
     sort_dir: str = "asc",
     limit: int = 50,
     offset: int = 0,
-) -> list[Event]:
-    search_query = query
-    query = db.query(Event)
-    if site_id:
-        query = query.filter(Event.site_id == site_id)
-    if status:
-        query = query.filter(Event.status == status)
-    if search_query:
-        like_value = f"%{search_query}%"
-        query = query.filter(or_(Event.title.ilike(like_value), Event.description.ilike(like_value)))
-    if upcoming_only:
-        query = query.filter(Event.start_at >= func.now())
-    sort_map = {
-        "start_at": Event.start_at,
-        "created_at": Event.created_at,
-        "title": Event.title,
-    }
-    sort_column = sort_map.get(sort_by, Event.start_at)
-    if sort_dir == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-    return query.offset(offset).limit(limit).all()
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _events_statement(site_id, status, query, upcoming_only, sort_by, sort_dir, cursor)
+    rows = list(db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), Event.id)
+
+
+async def list_events_async(
+    db: AsyncSession,
+    site_id: Optional[str] = None,
+    status: Optional[EventStatus] = None,
+    query: Optional[str] = None,
+    upcoming_only: bool = False,
+    sort_by: str = "start_at",
+    sort_dir: str = "asc",
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _events_statement(site_id, status, query, upcoming_only, sort_by, sort_dir, cursor)
+    rows = list(await db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), Event.id)
 
 
 def create_event(db: Session, payload: EventCreate, created_by: Optional[str]) -> Event:
     event = Event(**payload.model_dump(), created_by=created_by)
     db.add(event)
     db.commit()
+    invalidate_responses("events")
     db.refresh(event)
     return event
 
@@ -57,17 +96,35 @@ def update_event(db: Session, event_id: str, payload: EventUpdate) -> Optional[E
     if not event:
         return None
     updates = payload.model_dump(exclude_unset=True)
+    if "poster_url" in updates and updates["poster_url"] != event.poster_url:
+        event.poster_srcset = None
+    if "title" in updates and updates["title"] != event.title:
+        mark_event_dashboards_stale(db, event.id)
     for key, value in updates.items():
         setattr(event, key, value)
     db.commit()
+    invalidate_responses("events")
     db.refresh(event)
     return event
 
 
+def set_poster_srcset(db: Session, event_id: str, poster_url: str, srcset: dict) -> bool:
+    # Only applies while the poster it was rendered from is still current.
+    result = db.execute(
+        update(Event)
+        .where(Event.id == event_id, Event.poster_url == poster_url)
+        .values(poster_srcset=srcset)
+    )
+    db.commit()
+    invalidate_responses("events")
+    return result.rowcount > 0
+
+
 def delete_event(db: Session, event_id: str) -> bool:
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         return False
     db.delete(event)
     db.commit()
+    invalidate_responses("events")
     return True
@@ -0,0 +1,267 @@
+import csv
+import io
+import secrets
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import hash_password, pwd_context
+from app.models.site import Site
+from app.models.user import MemberType, User
+from app.schemas.imports import (
+    CareSubjectImportRow,
+    ImportReport,
+    ImportRowError,
+    MemberImportRow,
+)
+from app.services.auth import invalidate_user
+from app.services.dashboard import mark_dashboards_stale
+from app.services.passwords import password_hasher
+
+# Placeholder secrets are random and thrown away, so bcrypt's minimum cost
+# gives nothing away, and one placeholder can serve a whole batch.
+PLACEHOLDER_ROUNDS = 4
+
+# One statement per batch, whatever its size: the rows travel as arrays.
+# Blank cells keep the stored value; role, is_active and password_hash of an
+# existing account are left alone.
+MEMBER_UPSERT_SQL = text(
+    """
+    insert into users (email, password_hash, full_name, phone, member_type, site_id)
+    select * from unnest(
+        cast(:emails as text[]),
+        cast(:password_hashes as text[]),
+        cast(:full_names as text[]),
+        cast(:phones as text[]),
+        cast(:member_types as member_type[]),
+        cast(:site_ids as uuid[])
+    )
+    on conflict (email) do update set
+        full_name = coalesce(excluded.full_name, users.full_name),
+        phone = coalesce(excluded.phone, users.phone),
+        member_type = excluded.member_type,
+        site_id = coalesce(excluded.site_id, users.site_id)
+    returning id, email, xmax = 0 as inserted
+    """
+)
+
+# A subject already on file for the site under the same name and type is
+# skipped, so re-running an interrupted import does not duplicate anyone.
+CARE_IMPORT_SQL = text(
+    """
+    insert into care_subjects (name, subject_type, status, site_id)
+    select distinct on (incoming.name, incoming.subject_type, incoming.site_id)
+        incoming.name,
+        incoming.subject_type::care_subject_type,
+        incoming.status::care_subject_status,
+        incoming.site_id
+    from unnest(
+        cast(:names as text[]),
+        cast(:subject_types as text[]),
+        cast(:statuses as text[]),
+        cast(:site_ids as uuid[])
+    ) as incoming (name, subject_type, status, site_id)
+    where not exists (
+        select 1 from care_subjects existing
+        where existing.name = incoming.name
+          and existing.subject_type = incoming.subject_type::care_subject_type
+          and existing.site_id is not distinct from incoming.site_id
+    )
+    """
+)
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def placeholder_password_hash() -> str:
+    # Hash of a random secret nobody ever sees: the account has no usable
+    # password until it is reset.
+    handler = pwd_context.handler("bcrypt").using(rounds=PLACEHOLDER_ROUNDS)
+    return handler.hash(secrets.token_urlsafe(32))
+
+
+def _cell(value) -> Optional[str]:
+    if value is None:
+        return None
+    # Spreadsheet numbers: keep 912345678 from turning into "912345678.0".
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[tuple]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX import needs openpyxl installed; upload a CSV instead")
+    # read_only streams rows from the sheet instead of loading it whole.
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def read_rows(file: BinaryIO, filename: Optional[str]) -> Iterator[tuple[int, dict]]:
+    # Yields (spreadsheet row number, {lowercased header: value}); blank cells
+    # are left out so schema defaults apply, and blank rows are skipped.
+    suffix = Path(filename or "").suffix.lower()
+    if suffix == ".xlsx":
+        rows = _xlsx_rows(file)
+    elif suffix in ("", ".csv", ".txt"):
+        rows = csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    else:
+        raise ImportFormatError("Upload a .csv or .xlsx file")
+    try:
+        header = next(rows, None)
+        if header is None:
+            raise ImportFormatError("The file is empty")
+        keys = [(_cell(name) or "").lower() for name in header]
+        for number, values in enumerate(rows, start=2):
+            record = {}
+            for key, value in zip(keys, values):
+                value = _cell(value)
+                if key and value is not None:
+                    record[key] = value
+            if record:
+                yield number, record
+    except UnicodeDecodeError:
+        raise ImportFormatError("CSV files must be saved as UTF-8")
+
+
+def _fail(report: ImportReport, number: int, errors: list[str]) -> None:
+    report.failed += 1
+    report.errors.append(ImportRowError(row=number, errors=errors))
+
+
+def _batches(
+    rows: Iterator[tuple[int, dict]], schema: Type[BaseModel], report: ImportReport
+) -> Iterator[list[tuple[int, BaseModel]]]:
+    batch = []
+    for number, record in rows:
+        report.total += 1
+        try:
+            item = schema.model_validate(record)
+        except ValidationError as exc:
+            messages = [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            ]
+            _fail(report, number, messages)
+            continue
+        batch.append((number, item))
+        if len(batch) >= settings.import_batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _with_known_sites(db: Session, batch: list, default_site_id, report: ImportReport) -> list:
+    site_ids = {item.site_id for _, item in batch if item.site_id}
+    known = set(db.scalars(select(Site.id).where(Site.id.in_(site_ids)))) if site_ids else set()
+    kept = []
+    for number, item in batch:
+        if item.site_id is None:
+            item.site_id = default_site_id
+        elif item.site_id not in known:
+            _fail(report, number, ["site_id: unknown site"])
+            continue
+        kept.append((number, item))
+    return kept
+
+
+def import_members(
+    db: Session, rows: Iterator[tuple[int, dict]], default_site_id=None
+) -> ImportReport:
+    # Upserts on email, one batch per transaction. Passwords of existing
+    # accounts are never touched, so only new accounts with a password cost
+    # a bcrypt hash, and those are computed on the shared password hasher.
+    report = ImportReport()
+    first_seen: dict[str, int] = {}
+    for batch in _batches(rows, MemberImportRow, report):
+        unique = []
+        for number, item in batch:
+            first = first_seen.setdefault(item.email, number)
+            if first != number:
+                _fail(report, number, [f"email: duplicate of row {first}"])
+                continue
+            unique.append((number, item))
+        batch = _with_known_sites(db, unique, default_site_id, report)
+        if not batch:
+            continue
+        existing = dict(
+            db.execute(
+                select(User.email, User.member_type).where(
+                    User.email.in_([item.email for _, item in batch])
+                )
+            ).all()
+        )
+        new = [item for _, item in batch if item.email not in existing and item.password]
+        hashes = dict(
+            zip(
+                (item.email for item in new),
+                password_hasher.map(hash_password, [item.password for item in new]),
+            )
+        )
+        # Passwordless new accounts, and any listed account deleted before
+        # the upsert lands, get the placeholder.
+        placeholder = placeholder_password_hash()
+        written = db.execute(
+            MEMBER_UPSERT_SQL,
+            {
+                "emails": [item.email for _, item in batch],
+                "password_hashes": [hashes.get(item.email, placeholder) for _, item in batch],
+                "full_names": [item.full_name for _, item in batch],
+                "phones": [item.phone for _, item in batch],
+                "member_types": [
+                    (
+                        item.member_type
+                        if "member_type" in item.model_fields_set
+                        else existing.get(item.email, MemberType.member)
+                    ).value
+                    for _, item in batch
+                ],
+                "site_ids": [item.site_id for _, item in batch],
+            },
+        ).all()
+        updated = [row for row in written if not row.inserted]
+        mark_dashboards_stale(db, [row.id for row in updated])
+        db.commit()
+        invalidate_user(*(row.email for row in updated))
+        report.inserted += len(written) - len(updated)
+        report.updated += len(updated)
+    report.errors.sort(key=lambda error: error.row)
+    return report
+
+
+def import_care_subjects(
+    db: Session, rows: Iterator[tuple[int, dict]], default_site_id=None
+) -> ImportReport:
+    report = ImportReport()
+    for batch in _batches(rows, CareSubjectImportRow, report):
+        batch = _with_known_sites(db, batch, default_site_id, report)
+        if not batch:
+            continue
+        items = [item for _, item in batch]
+        inserted = db.execute(
+            CARE_IMPORT_SQL,
+            {
+                "names": [item.name for item in items],
+                "subject_types": [item.subject_type.value for item in items],
+                "statuses": [item.status.value for item in items],
+                "site_ids": [item.site_id for item in items],
+            },
+        ).rowcount
+        db.commit()
+        report.inserted += inserted
+        report.skipped += len(items) - inserted
+    report.errors.sort(key=lambda error: error.row)
+    return report
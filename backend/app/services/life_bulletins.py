@@ -1,49 +1,90 @@
 from typing import Optional
 
-from sqlalchemy import or_
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.life_bulletin import LifeBulletin, LifeBulletinStatus
+from app.core.response_cache import invalidate_responses
+from app.models.life_bulletin import LifeBulletin, LifeBulletinStatus, LifeBulletinVideoStatus
 from app.schemas.life_bulletin import LifeBulletinCreate, LifeBulletinUpdate
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.search import search_filter
 
 
 def get_life_bulletin_by_id(db: Session, bulletin_id: str) -> Optional[LifeBulletin]:
     return db.query(LifeBulletin).filter(LifeBulletin.id == bulletin_id).first()
 
 
-def list_life_bulletins(
-    db: Session,
+def _sort_column(sort_by: str):
+    sort_map = {
+        "bulletin_date": LifeBulletin.bulletin_date,
+        "created_at": LifeBulletin.created_at,
+    }
+    return sort_map.get(sort_by, LifeBulletin.bulletin_date)
+
+
+def _life_bulletins_statement(
     site_id: Optional[str] = None,
     query: Optional[str] = None,
     status: Optional[str] = None,
     sort_by: str = "bulletin_date",
     sort_dir: str = "desc",
-    limit: int = 20,
-    offset: int = 0,
-) -> list[LifeBulletin]:
-    list_query = db.query(LifeBulletin)
+    cursor: Optional[str] = None,
+) -> Select:
+    statement = select(LifeBulletin)
     if site_id:
-        list_query = list_query.filter(LifeBulletin.site_id == site_id)
+        statement = statement.where(LifeBulletin.site_id == site_id)
     if status:
-        list_query = list_query.filter(LifeBulletin.status == status)
+        statement = statement.where(LifeBulletin.status == status)
     if query:
-        like_value = f"%{query}%"
-        list_query = list_query.filter(
-            or_(
-                LifeBulletin.content.ilike(like_value),
-                LifeBulletin.video_url.ilike(like_value),
-            )
+        statement = statement.where(
+            search_filter(query, LifeBulletin.content, LifeBulletin.video_url)
         )
-    sort_map = {
-        "bulletin_date": LifeBulletin.bulletin_date,
-        "created_at": LifeBulletin.created_at,
-    }
-    sort_column = sort_map.get(sort_by, LifeBulletin.bulletin_date)
-    if sort_dir == "asc":
-        list_query = list_query.order_by(sort_column.asc())
-    else:
-        list_query = list_query.order_by(sort_column.desc())
-    return list_query.offset(offset).limit(limit).all()
+    return order_by_keyset(
+        statement, _sort_column(sort_by), LifeBulletin.id, sort_dir != "asc", cursor
+    )
+
+
+def _latest_life_bulletins_statement(site_id: Optional[str], limit: int) -> Select:
+    statement = select(LifeBulletin)
+    if site_id:
+        statement = statement.where(LifeBulletin.site_id == site_id)
+    statement = statement.where(LifeBulletin.status == LifeBulletinStatus.published)
+    return statement.order_by(
+        LifeBulletin.bulletin_date.desc(), LifeBulletin.created_at.desc()
+    ).limit(limit)
+
+
+def list_life_bulletins(
+    db: Session,
+    site_id: Optional[str] = None,
+    query: Optional[str] = None,
+    status: Optional[str] = None,
+    sort_by: str = "bulletin_date",
+    sort_dir: str = "desc",
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _life_bulletins_statement(site_id, query, status, sort_by, sort_dir, cursor)
+    rows = list(db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), LifeBulletin.id)
+
+
+async def list_life_bulletins_async(
+    db: AsyncSession,
+    site_id: Optional[str] = None,
+    query: Optional[str] = None,
+    status: Optional[str] = None,
+    sort_by: str = "bulletin_date",
+    sort_dir: str = "desc",
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _life_bulletins_statement(site_id, query, status, sort_by, sort_dir, cursor)
+    rows = list(await db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), LifeBulletin.id)
 
 
 def list_latest_life_bulletins(
@@ -51,15 +92,15 @@ def list_latest_life_bulletins(
     site_id: Optional[str],
     limit: int = 5,
 ) -> list[LifeBulletin]:
-    list_query = db.query(LifeBulletin)
-    if site_id:
-        list_query = list_query.filter(LifeBulletin.site_id == site_id)
-    list_query = list_query.filter(LifeBulletin.status == LifeBulletinStatus.published)
-    return (
-        list_query.order_by(LifeBulletin.bulletin_date.desc(), LifeBulletin.created_at.desc())
-        .limit(limit)
-        .all()
-    )
+    return list(db.scalars(_latest_life_bulletins_statement(site_id, limit)))
+
+
+async def list_latest_life_bulletins_async(
+    db: AsyncSession,
+    site_id: Optional[str],
+    limit: int = 5,
+) -> list[LifeBulletin]:
+    return list(await db.scalars(_latest_life_bulletins_statement(site_id, limit)))
 
 
 def create_life_bulletin(db: Session, payload: LifeBulletinCreate) -> LifeBulletin:
@@ -72,6 +113,7 @@ def create_life_bulletin(db: Session, payload: LifeBulletinCreate) -> LifeBullet
     )
     db.add(record)
     db.commit()
+    invalidate_responses("life_bulletins")
     db.refresh(record)
     return record
 
@@ -90,17 +132,63 @@ def update_life_bulletin(
         record.content = payload.content
     if payload.video_url is not None:
         record.video_url = str(payload.video_url)
+        # An external link replaces any upload still being transcoded.
+        record.video_source_url = None
+        record.video_poster_url = None
+        record.video_status = None
     if payload.status is not None:
         record.status = payload.status
     db.commit()
+    invalidate_responses("life_bulletins")
     db.refresh(record)
     return record
 
 
+def attach_uploaded_video(
+    db: Session, bulletin_id: str, video_url: str
+) -> Optional[LifeBulletin]:
+    # The raw upload plays right away; the transcode worker swaps in HLS later.
+    record = get_life_bulletin_by_id(db, bulletin_id)
+    if not record:
+        return None
+    record.video_url = video_url
+    record.video_source_url = video_url
+    record.video_poster_url = None
+    record.video_status = LifeBulletinVideoStatus.queued
+    db.commit()
+    invalidate_responses("life_bulletins")
+    db.refresh(record)
+    return record
+
+
+def set_video_status(
+    db: Session,
+    bulletin_id: str,
+    source_url: str,
+    status: LifeBulletinVideoStatus,
+    video_url: Optional[str] = None,
+    poster_url: Optional[str] = None,
+) -> bool:
+    values = {"video_status": status}
+    if video_url is not None:
+        values["video_url"] = video_url
+    if poster_url is not None:
+        values["video_poster_url"] = poster_url
+    result = db.execute(
+        update(LifeBulletin)
+        .where(LifeBulletin.id == bulletin_id, LifeBulletin.video_source_url == source_url)
+        .values(**values)
+    )
+    db.commit()
+    invalidate_responses("life_bulletins")
+    return result.rowcount > 0
+
+
 def delete_life_bulletin(db: Session, bulletin_id: str) -> bool:
     record = get_life_bulletin_by_id(db, bulletin_id)
     if not record:
         return False
     db.delete(record)
     db.commit()
+    invalidate_responses("life_bulletins")
     return True
@@ -0,0 +1,103 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import and_, or_, tuple_
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class Page(list):
+    # A plain list of rows that also carries the cursor for the following
+    # page, so existing callers keep treating list_* results as lists.
+    def __init__(self, items: Iterable = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _load(column, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(sort_column, value: Any, row_id: Any) -> str:
+    payload = json.dumps([sort_column.key, _dump(value), _dump(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column, id_column) -> tuple[Any, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if key != sort_column.key:
+            raise InvalidCursorError("Cursor does not match sort_by")
+        return _load(sort_column, value), _load(id_column, row_id)
+    except InvalidCursorError:
+        raise
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def _after(sort_column, id_column, descending: bool, value: Any, row_id: Any):
+    # Rows strictly after (value, row_id) in ORDER BY sort_column, id_column,
+    # with PostgreSQL's default NULL placement (last ascending, first descending).
+    if not sort_column.expression.nullable:
+        if descending:
+            return tuple_(sort_column, id_column) < tuple_(value, row_id)
+        return tuple_(sort_column, id_column) > tuple_(value, row_id)
+    id_after = id_column < row_id if descending else id_column > row_id
+    if value is None:
+        null_tail = and_(sort_column.is_(None), id_after)
+        return or_(null_tail, sort_column.is_not(None)) if descending else null_tail
+    value_after = sort_column < value if descending else sort_column > value
+    clause = or_(value_after, and_(sort_column == value, id_after))
+    return clause if descending else or_(clause, sort_column.is_(None))
+
+
+def order_by_keyset(
+    statement, sort_column, id_column, descending: bool, cursor: Optional[str] = None
+):
+    # Works for both select() statements and legacy Query objects.
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_column, id_column)
+        statement = statement.where(_after(sort_column, id_column, descending, value, row_id))
+    if descending:
+        return statement.order_by(sort_column.desc(), id_column.desc())
+    return statement.order_by(sort_column.asc(), id_column.asc())
+
+
+def page_of(
+    rows: list,
+    limit: int,
+    sort_column,
+    id_column,
+    entity: Callable[[Any], Any] = lambda row: row,
+) -> Page:
+    # Callers fetch limit + 1 rows; the extra one only signals another page.
+    if limit <= 0 or len(rows) <= limit:
+        return Page(rows[: max(limit, 0)])
+    last = entity(rows[limit - 1])
+    next_cursor = encode_cursor(
+        sort_column, getattr(last, sort_column.key), getattr(last, id_column.key)
+    )
+    return Page(rows[:limit], next_cursor)
@@ -0,0 +1,98 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+from app.core.security import hash_password, verify_and_update_password
+
+
+class PasswordHasherBusyError(RuntimeError):
+    pass
+
+
+class PasswordHasher:
+    # bcrypt is deliberately slow and holds the GIL, so it runs on worker
+    # processes and request threads only wait for the result. The queue in
+    # front of the workers is bounded: during a login spike, requests past
+    # the limit are turned away at once instead of queueing behind minutes
+    # of hashing and tying up the threadpool every other endpoint needs.
+    def __init__(self) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._bulk_slots = threading.BoundedSemaphore(settings.password_hash_workers)
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.password_hash_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self.pending >= settings.password_hash_max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusyError("Too many sign-ins right now; try again shortly")
+            self.pending += 1
+            try:
+                future = self._pool().submit(fn, *args)
+            except BaseException:
+                self.pending -= 1
+                raise
+        future.add_done_callback(self._done)
+        return future
+
+    def map(self, fn, items: list) -> list:
+        # For bulk work such as roster imports, on the same workers. Instead of
+        # being refused it waits for a slot, and it never has more than one
+        # job per worker queued, so sign-ins wait behind a few hashes rather
+        # than a whole roster.
+        futures = []
+        for item in items:
+            self._bulk_slots.acquire()
+            with self._lock:
+                self.pending += 1
+                try:
+                    future = self._pool().submit(fn, item)
+                except BaseException:
+                    self.pending -= 1
+                    self._bulk_slots.release()
+                    raise
+            future.add_done_callback(self._done)
+            future.add_done_callback(lambda _: self._bulk_slots.release())
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def stats(self) -> dict:
+        return {
+            "workers": settings.password_hash_workers,
+            "max_pending": settings.password_hash_max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+password_hasher = PasswordHasher()
+
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.wrap_future(password_hasher.submit(hash_password, password))
+
+
+async def verify_password_async(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    # (valid, replacement hash if the stored one was made at another cost)
+    return await asyncio.wrap_future(
+        password_hasher.submit(verify_and_update_password, password, hashed)
+    )
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from PIL import Image, ImageOps, features
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.events import set_poster_srcset
+
+logger = logging.getLogger(__name__)
+
+POSTER_WIDTHS = (320, 640, 1280)
+# MIME type -> (Pillow format, extension, save options), best compression first.
+DERIVATIVE_FORMATS = {
+    "image/avif": ("AVIF", ".avif", {"quality": 55}),
+    "image/webp": ("WEBP", ".webp", {"quality": 80, "method": 6}),
+}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: forking a process that runs an event loop and a threadpool
+        # is unsafe, and it is the only start method on Windows anyway.
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.image_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _save(image: Image.Image, target: str, image_format: str, options: dict) -> None:
+    if os.path.exists(target):
+        return
+    temp_path = f"{target}.part"
+    try:
+        image.save(temp_path, format=image_format, **options)
+        os.replace(temp_path, target)
+    except Exception:
+        # A half-written .part would otherwise stay in the static directory.
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def render_poster_srcset(source: str, url_prefix: str) -> dict[str, str]:
+    # Runs in a worker process; returns {mime type: srcset} for the poster.
+    directory, filename = os.path.split(source)
+    stem = os.path.splitext(filename)[0]
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    has_alpha = "A" in image.getbands() or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    widths = [width for width in POSTER_WIDTHS if width <= image.width] or [image.width]
+
+    srcset: dict[str, list[str]] = {}
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        # Drop EXIF, ICC and comments carried over from the original.
+        resized.info = {}
+        for media_type, (image_format, extension, options) in DERIVATIVE_FORMATS.items():
+            if not features.check(image_format.lower()):
+                continue
+            name = f"{stem}-{width}w{extension}"
+            _save(resized, os.path.join(directory, name), image_format, options)
+            srcset.setdefault(media_type, []).append(f"{url_prefix}/{name} {width}w")
+    return {media_type: ", ".join(entries) for media_type, entries in srcset.items()}
+
+
+def _store_srcset(event_id: str, poster_url: str, srcset: dict[str, str]) -> None:
+    with SessionLocal() as db:
+        set_poster_srcset(db, event_id, poster_url, srcset)
+
+
+async def generate_poster_derivatives(event_id: str, poster_url: str, source: Path) -> None:
+    url_prefix = poster_url.rsplit("/", 1)[0]
+    try:
+        srcset = await asyncio.get_running_loop().run_in_executor(
+            _pool(), render_poster_srcset, str(source), url_prefix
+        )
+        await run_in_threadpool(_store_srcset, event_id, poster_url, srcset)
+    except Exception:
+        logger.exception("Poster derivatives failed for event %s", event_id)
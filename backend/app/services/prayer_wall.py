@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Optional
+
+import psycopg
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Text, cast, func, insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.prayer import PrayerRequest, PrayerWallEvent
+from app.schemas.prayer import PrayerOut
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "prayer_wall"
+# NOTIFY payloads are capped at 8000 bytes, so event ids go out in chunks.
+NOTIFY_CHUNK = 500
+PRUNE_INTERVAL_SECONDS = 3600
+
+FETCH_SQL = """
+    select id, site_id, type, payload::text from prayer_wall_events
+    where id = any(%s) order by id
+"""
+PRUNE_SQL = """
+    delete from prayer_wall_events
+    where created_at < now() - make_interval(hours => %s)
+"""
+
+
+def sse_frame(event_id: int, event_type: str, data: str) -> bytes:
+    return f"id: {event_id}\nevent: {event_type}\ndata: {data}\n\n".encode()
+
+
+def prayer_approved_event(prayer: PrayerRequest) -> dict:
+    payload = PrayerOut.model_validate(prayer, from_attributes=True).model_dump(mode="json")
+    return {"site_id": prayer.site_id, "type": "prayer.approved", "payload": payload}
+
+
+def prayer_removed_event(prayer: PrayerRequest) -> dict:
+    return {"site_id": prayer.site_id, "type": "prayer.removed", "payload": {"id": str(prayer.id)}}
+
+
+def amen_count_event(row) -> dict:
+    return {
+        "site_id": row.site_id,
+        "type": "prayer.amens",
+        "payload": {"id": str(row.id), "amen_count": row.amen_count},
+    }
+
+
+# Callers publish inside the transaction that makes the change. NOTIFY is only
+# delivered on commit, so viewers never see a rolled-back change. Ids are taken
+# before commit, so concurrent transactions can commit (and notify) out of id
+# order: an id below the newest one seen may still arrive.
+def publish_wall_events(db: Session, events: list[dict]) -> None:
+    if not events:
+        return
+    ids = db.scalars(insert(PrayerWallEvent).returning(PrayerWallEvent.id), events).all()
+    for start in range(0, len(ids), NOTIFY_CHUNK):
+        chunk = ",".join(str(event_id) for event_id in ids[start : start + NOTIFY_CHUNK])
+        db.execute(select(func.pg_notify(CHANNEL, chunk)))
+
+
+def replay_wall_events(
+    db: Session, site_id: Optional[str], last_event_id: Optional[int]
+) -> tuple[list[bytes], set[int]]:
+    # Returns the frames a (re)connecting viewer missed and the ids they carry.
+    # A new viewer just learns the current id; one too far behind is told to
+    # reload the wall instead of replaying all of it.
+    latest = db.scalar(select(func.coalesce(func.max(PrayerWallEvent.id), 0)))
+    if last_event_id is None:
+        return [sse_frame(latest, "ready", "{}")], set()
+    statement = (
+        select(PrayerWallEvent.id, PrayerWallEvent.type, cast(PrayerWallEvent.payload, Text))
+        .where(PrayerWallEvent.id > last_event_id, PrayerWallEvent.id <= latest)
+        .order_by(PrayerWallEvent.id)
+        .limit(settings.prayer_wall_replay_limit + 1)
+    )
+    if site_id:
+        statement = statement.where(PrayerWallEvent.site_id == site_id)
+    rows = db.execute(statement).all()
+    if len(rows) > settings.prayer_wall_replay_limit:
+        return [sse_frame(latest, "reset", "{}")], set()
+    return [sse_frame(*row) for row in rows], {row.id for row in rows}
+
+
+def _replay(
+    site_id: Optional[str], last_event_id: Optional[int]
+) -> tuple[list[bytes], set[int]]:
+    with SessionLocal() as db:
+        return replay_wall_events(db, site_id, last_event_id)
+
+
+def _conninfo() -> str:
+    url = make_url(settings.database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class PrayerWallHub:
+    # One LISTEN connection per worker fans each event out to every viewer's
+    # queue. A frame is encoded once and shared by all viewers of its site.
+    def __init__(self) -> None:
+        self._subscribers: dict[Optional[str], set[asyncio.Queue]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._listening = asyncio.Event()
+        self.delivered = 0
+        self.dropped = 0
+
+    def viewers(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def subscribe(self, site_id: Optional[str]) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(site_id, set()).add(queue)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+        return queue
+
+    async def listening(self) -> None:
+        await self._listening.wait()
+
+    def unsubscribe(self, site_id: Optional[str], queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(site_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[site_id]
+
+    def _close(self, site_id: Optional[str], queue: asyncio.Queue) -> None:
+        # None ends the stream; the browser reconnects with Last-Event-ID.
+        self.unsubscribe(site_id, queue)
+        queue.put_nowait(None)
+
+    def _dispatch(self, site_id: Optional[str], frame_id: int, frame: bytes) -> None:
+        for key in {site_id, None}:
+            for queue in list(self._subscribers.get(key, ())):
+                if queue.qsize() >= settings.prayer_wall_queue_size:
+                    # A stalled viewer must not hold frames forever; it catches
+                    # up from the event log when it reconnects.
+                    self._close(key, queue)
+                    self.dropped += 1
+                    continue
+                queue.put_nowait((frame_id, frame))
+                self.delivered += 1
+
+    async def _listen(self) -> None:
+        while self._subscribers:
+            try:
+                await self._follow()
+            except (psycopg.Error, OSError):
+                logger.exception("Prayer wall listener lost its connection; reconnecting")
+                # Events may have been missed; let every viewer replay them.
+                for site_id, queues in list(self._subscribers.items()):
+                    for queue in list(queues):
+                        self._close(site_id, queue)
+                await asyncio.sleep(1)
+
+    async def _follow(self) -> None:
+        conninfo = _conninfo()
+        async with await psycopg.AsyncConnection.connect(
+            conninfo, autocommit=True
+        ) as listen_conn, await psycopg.AsyncConnection.connect(
+            conninfo, autocommit=True
+        ) as query_conn:
+            await listen_conn.execute(f"listen {CHANNEL}")
+            self._listening.set()
+            try:
+                await self._relay(listen_conn, query_conn)
+            finally:
+                self._listening.clear()
+
+    async def _relay(self, listen_conn, query_conn) -> None:
+        pruned_at = 0.0
+        while self._subscribers:
+            if time.monotonic() - pruned_at > PRUNE_INTERVAL_SECONDS:
+                await query_conn.execute(PRUNE_SQL, (settings.prayer_wall_retention_hours,))
+                pruned_at = time.monotonic()
+            # Returns every keepalive interval so an idle worker lets go
+            # of its connections once the last viewer leaves.
+            async for notify in listen_conn.notifies(
+                timeout=settings.prayer_wall_keepalive_seconds
+            ):
+                ids = [int(event_id) for event_id in notify.payload.split(",")]
+                cursor = await query_conn.execute(FETCH_SQL, (ids,))
+                for event_id, site_id, event_type, payload in await cursor.fetchall():
+                    self._dispatch(
+                        str(site_id) if site_id else None,
+                        event_id,
+                        sse_frame(event_id, event_type, payload),
+                    )
+
+    def stats(self) -> dict:
+        return {
+            "viewers": self.viewers(),
+            "sites": len(self._subscribers),
+            "listening": self._listening.is_set(),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+prayer_wall = PrayerWallHub()
+
+
+async def stream_wall_events(
+    site_id: Optional[str], last_event_id: Optional[int]
+) -> AsyncIterator[bytes]:
+    queue = prayer_wall.subscribe(site_id)
+    try:
+        # Replaying before LISTEN is in place could miss events committed in between.
+        try:
+            await asyncio.wait_for(
+                prayer_wall.listening(), timeout=settings.prayer_wall_listen_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            # The database is unreachable: end the stream with a longer retry
+            # so viewers back off instead of piling up open connections. No
+            # id, so the browser keeps its Last-Event-ID for the reconnect.
+            yield (
+                f"retry: {settings.prayer_wall_unavailable_retry_ms}\n"
+                "event: wall.unavailable\ndata: {}\n\n"
+            ).encode()
+            return
+        # Subscribed first, so anything committed during the replay is queued.
+        # Only frames the replay actually sent are skipped below: an id lower
+        # than the replayed ones may still be in flight (see publish_wall_events).
+        frames, replayed = await run_in_threadpool(_replay, site_id, last_event_id)
+        yield f"retry: {settings.prayer_wall_retry_ms}\n\n".encode()
+        for frame in frames:
+            yield frame
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    queue.get(), timeout=settings.prayer_wall_keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                # Keeps proxies from closing an idle stream.
+                yield b": keepalive\n\n"
+                continue
+            if item is None:
+                return
+            frame_id, frame = item
+            if frame_id not in replayed:
+                yield frame
+    finally:
+        prayer_wall.unsubscribe(site_id, queue)
@@ -1,42 +1,90 @@
 from typing import Optional
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import invalidate_responses
 from app.models.prayer import PrayerPrivacy, PrayerRequest, PrayerStatus
 from app.schemas.prayer import PrayerCreate
+from app.services.amens import amen_targets
+from app.services.dashboard import mark_dashboards_stale
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.prayer_wall import (
+    prayer_approved_event,
+    prayer_removed_event,
+    publish_wall_events,
+)
+from app.services.search import search_filter
 
 
-def list_prayers(
-    db: Session,
+def _sort_column(sort_by: str):
+    sort_map = {
+        "created_at": PrayerRequest.created_at,
+        "amen_count": PrayerRequest.amen_count,
+    }
+    return sort_map.get(sort_by, PrayerRequest.created_at)
+
+
+def _prayers_statement(
     site_id: Optional[str] = None,
     approved_only: bool = True,
     query: Optional[str] = None,
     privacy_level: Optional[PrayerPrivacy] = None,
     sort_by: str = "created_at",
     sort_dir: str = "desc",
-    limit: int = 50,
-    offset: int = 0,
-) -> list[PrayerRequest]:
-    query_set = db.query(PrayerRequest)
+    cursor: Optional[str] = None,
+) -> Select:
+    statement = select(PrayerRequest)
     if site_id:
-        query_set = query_set.filter(PrayerRequest.site_id == site_id)
+        statement = statement.where(PrayerRequest.site_id == site_id)
     if approved_only:
-        query_set = query_set.filter(PrayerRequest.status == PrayerStatus.approved)
+        statement = statement.where(PrayerRequest.status == PrayerStatus.approved)
     if privacy_level:
-        query_set = query_set.filter(PrayerRequest.privacy_level == privacy_level)
+        statement = statement.where(PrayerRequest.privacy_level == privacy_level)
     if query:
-        like_value = f"%{query}%"
-        query_set = query_set.filter(PrayerRequest.content.ilike(like_value))
-    sort_map = {
-        "created_at": PrayerRequest.created_at,
-        "amen_count": PrayerRequest.amen_count,
-    }
-    sort_column = sort_map.get(sort_by, PrayerRequest.created_at)
-    if sort_dir == "asc":
-        query_set = query_set.order_by(sort_column.asc())
-    else:
-        query_set = query_set.order_by(sort_column.desc())
-    return query_set.offset(offset).limit(limit).all()
+        statement = statement.where(search_filter(query, PrayerRequest.content))
+    return order_by_keyset(
+        statement, _sort_column(sort_by), PrayerRequest.id, sort_dir != "asc", cursor
+    )
+
+
+def list_prayers(
+    db: Session,
+    site_id: Optional[str] = None,
+    approved_only: bool = True,
+    query: Optional[str] = None,
+    privacy_level: Optional[PrayerPrivacy] = None,
+    sort_by: str = "created_at",
+    sort_dir: str = "desc",
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _prayers_statement(
+        site_id, approved_only, query, privacy_level, sort_by, sort_dir, cursor
+    )
+    rows = list(db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), PrayerRequest.id)
+
+
+async def list_prayers_async(
+    db: AsyncSession,
+    site_id: Optional[str] = None,
+    approved_only: bool = True,
+    query: Optional[str] = None,
+    privacy_level: Optional[PrayerPrivacy] = None,
+    sort_by: str = "created_at",
+    sort_dir: str = "desc",
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _prayers_statement(
+        site_id, approved_only, query, privacy_level, sort_by, sort_dir, cursor
+    )
+    rows = list(await db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), PrayerRequest.id)
 
 
 def update_prayer_status(
@@ -45,8 +93,16 @@ def update_prayer_status(
     prayer = db.query(PrayerRequest).filter(PrayerRequest.id == prayer_id).first()
     if not prayer:
         return None
+    was_approved = prayer.status == PrayerStatus.approved
     prayer.status = status
+    # Only approved prayers are on the public wall; push entering and leaving it.
+    if status == PrayerStatus.approved and not was_approved:
+        publish_wall_events(db, [prayer_approved_event(prayer)])
+    elif was_approved and status != PrayerStatus.approved:
+        publish_wall_events(db, [prayer_removed_event(prayer)])
     db.commit()
+    invalidate_responses("prayers")
+    amen_targets.delete(prayer_id)
     db.refresh(prayer)
     return prayer
 
@@ -59,6 +115,8 @@ def create_prayer(db: Session, payload: PrayerCreate, user_id: Optional[str]) ->
         user_id=user_id,
     )
     db.add(prayer)
+    mark_dashboards_stale(db, [user_id])
     db.commit()
+    invalidate_responses("prayers")
     db.refresh(prayer)
     return prayer
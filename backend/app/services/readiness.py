@@ -0,0 +1,121 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import engine, pool_stats
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+UPLOAD_DIRS = (BASE_DIR / "static" / "posters", BASE_DIR / "static" / "life-bulletins")
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def check_pools() -> dict:
+    # An exhausted pool means new requests wait pool_timeout for a
+    # connection, so the worker should stop taking traffic until it drains.
+    # A negative max_overflow means unlimited overflow: no capacity, never exhausted.
+    pools = []
+    for stats in pool_stats():
+        max_overflow = stats["max_overflow"] or 0
+        capacity = stats["size"] + max_overflow if max_overflow >= 0 else None
+        pools.append(
+            {
+                "name": stats["name"],
+                "checked_out": stats["checkedout"],
+                "capacity": capacity,
+                "saturation": round(stats["checkedout"] / capacity, 3) if capacity else None,
+            }
+        )
+    exhausted = [
+        pool["name"]
+        for pool in pools
+        if pool["capacity"] is not None and pool["checked_out"] >= pool["capacity"]
+    ]
+    check = {"ok": not exhausted, "pools": pools}
+    if exhausted:
+        check["error"] = f"connection pool exhausted: {', '.join(exhausted)}"
+    return check
+
+
+def check_database() -> dict:
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("select 1"))
+    except Exception as exc:
+        return {"ok": False, "latency_ms": _elapsed_ms(started), "error": type(exc).__name__}
+    return {"ok": True, "latency_ms": _elapsed_ms(started)}
+
+
+def check_upload_dirs() -> dict:
+    started = time.perf_counter()
+    for directory in UPLOAD_DIRS:
+        try:
+            with tempfile.NamedTemporaryFile(dir=directory, prefix=".ready-") as probe:
+                probe.write(b"ok")
+                probe.flush()
+        except OSError as exc:
+            return {
+                "ok": False,
+                "latency_ms": _elapsed_ms(started),
+                "error": f"{directory.name}: {exc.strerror or type(exc).__name__}",
+            }
+    return {"ok": True, "latency_ms": _elapsed_ms(started)}
+
+
+class ReadinessProbe:
+    # Load balancers probe every worker every few seconds. A result is
+    # reused for readiness_cache_seconds, and at most one check runs at a
+    # time: concurrent probes get the previous result instead of queueing
+    # more database round trips behind a slow one.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._started_at: Optional[float] = None
+
+    def cached(self) -> Optional[dict]:
+        if self._result is not None:
+            if time.monotonic() - self._checked_at < settings.readiness_cache_seconds:
+                return self._result
+        return None
+
+    def check(self) -> dict:
+        result = self.cached()
+        if result is not None:
+            return result
+        if not self._lock.acquire(blocking=self._result is None):
+            started_at = self._started_at
+            if started_at is not None and (
+                time.monotonic() - started_at > settings.readiness_timeout_seconds
+            ):
+                return {
+                    "ready": False,
+                    "checks": {"database": {"ok": False, "error": "check timed out"}},
+                }
+            return self._result
+        try:
+            result = self.cached()
+            if result is not None:
+                return result
+            self._started_at = time.monotonic()
+            pools = check_pools()
+            # Skipped when exhausted: the round trip would only wait for a connection.
+            database = check_database() if pools["ok"] else {"ok": False, "error": "skipped"}
+            checks = {"database": database, "pool": pools, "uploads": check_upload_dirs()}
+            result = {"ready": all(check["ok"] for check in checks.values()), "checks": checks}
+            self._result, self._checked_at = result, time.monotonic()
+            return result
+        finally:
+            self._started_at = None
+            self._lock.release()
+
+
+readiness = ReadinessProbe()
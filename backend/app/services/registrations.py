@@ -1,12 +1,46 @@
-from sqlalchemy import or_
+from sqlalchemy import Text, case, cast, literal, select, true, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 
-from app.models.registration import EventRegistration
+from app.models.registration import EventRegistration, RegistrationStatus
 from app.models.event import Event
 from app.models.user import User
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, Tuple
 
 from app.schemas.registration import RegistrationCreate, RegistrationUpdate
+from app.services.dashboard import mark_dashboards_stale
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.search import search_filter
+
+
+# Registrations in these states hold seats against Event.capacity.
+SEAT_HOLDING_STATUSES = (RegistrationStatus.pending, RegistrationStatus.confirmed)
+
+# Seats a registration occupies: its tickets plus one per proxy attendee.
+proxy_seat_count = case(
+    (
+        EventRegistration.is_proxy.is_(True),
+        func.coalesce(func.jsonb_array_length(EventRegistration.proxy_entries), 0),
+    ),
+    else_=0,
+)
+seat_count = EventRegistration.ticket_count + proxy_seat_count
+
+
+class EventNotFoundError(ValueError):
+    pass
+
+
+class EventFullError(ValueError):
+    pass
+
+
+def registration_seats(ticket_count: int, is_proxy: bool, proxy_entries: Optional[list]) -> int:
+    seats = ticket_count or 0
+    if is_proxy and proxy_entries:
+        seats += len(proxy_entries)
+    return seats
 
 
 def list_registrations(db: Session, user_id: str) -> list[EventRegistration]:
@@ -17,14 +51,13 @@ def list_registrations(db: Session, user_id: str) -> list[EventRegistration]:
         .all()
     )
 
-def list_registrations_for_event(
+def _registrations_for_event_query(
     db: Session,
     event_id: str,
     query: Optional[str] = None,
     status: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0,
-) -> List[Tuple[EventRegistration, Optional[User], Event]]:
+    cursor: Optional[str] = None,
+):
     base = (
         db.query(EventRegistration, User, Event)
         .join(Event, Event.id == EventRegistration.event_id)
@@ -34,13 +67,123 @@ def list_registrations_for_event(
     if status:
         base = base.filter(EventRegistration.status == status)
     if query:
-        like = f"%{query}%"
-        base = base.filter(or_(User.full_name.ilike(like), User.email.ilike(like)))
-    return (
-        base.order_by(EventRegistration.created_at.desc())
+        base = base.filter(search_filter(query, User.full_name, User.email))
+    return order_by_keyset(
+        base, EventRegistration.created_at, EventRegistration.id, True, cursor
+    )
+
+
+# Admin listing columns, labelled as RegistrationAdminOut fields; the event
+# columns are filled in by the caller, which has already loaded the event.
+# user_id comes back as text: it is only re-serialized, so parsing it into a
+# uuid.UUID per row would be wasted work.
+ADMIN_ROW_COLUMNS = (
+    EventRegistration.id,
+    cast(EventRegistration.user_id, Text).label("user_id"),
+    User.email.label("user_email"),
+    User.full_name.label("user_full_name"),
+    User.phone.label("user_phone"),
+    cast(User.member_type, Text).label("user_member_type"),
+    cast(User.role, Text).label("user_role"),
+    EventRegistration.status,
+    EventRegistration.ticket_count,
+    EventRegistration.is_proxy,
+    func.coalesce(EventRegistration.proxy_entries, literal([], JSONB)).label("proxy_entries"),
+    EventRegistration.created_at,
+    EventRegistration.updated_at,
+)
+
+
+def list_registration_rows_for_event(
+    db: Session,
+    event_id: str,
+    query: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    # One statement returns the page as plain rows plus the facets: a
+    # one-row aggregate over the event (and search), left-joined to the page
+    # so the facets come back even when the page is empty. Per-status counts
+    # ignore the status filter; total and ticket_total honour it.
+    matches = [EventRegistration.event_id == event_id]
+    if query:
+        matches.append(
+            EventRegistration.user_id.in_(
+                select(User.id).where(search_filter(query, User.full_name, User.email))
+            )
+        )
+    in_status = EventRegistration.status == status if status else true()
+    facets = (
+        select(
+            func.count().filter(in_status).label("total"),
+            func.coalesce(func.sum(EventRegistration.ticket_count).filter(in_status), 0).label(
+                "ticket_total"
+            ),
+            *(
+                func.count().filter(EventRegistration.status == item).label(f"count_{item.name}")
+                for item in RegistrationStatus
+            ),
+        )
+        .where(*matches)
+        .subquery("facets")
+    )
+    # Users are joined after the page is cut, so only the page's rows pay for it.
+    page_ids = (
+        order_by_keyset(
+            select(EventRegistration.id, EventRegistration.created_at).where(*matches, in_status),
+            EventRegistration.created_at,
+            EventRegistration.id,
+            True,
+            cursor,
+        )
         .offset(offset)
-        .limit(limit)
-        .all()
+        .limit(limit + 1)
+        .subquery("page_ids")
+    )
+    page = (
+        select(*ADMIN_ROW_COLUMNS)
+        .select_from(page_ids)
+        .join(EventRegistration, EventRegistration.id == page_ids.c.id)
+        .outerjoin(User, User.id == EventRegistration.user_id)
+        .subquery("page")
+    )
+    rows = db.execute(
+        select(facets, page)
+        .select_from(facets)
+        .outerjoin(page, true())
+        .order_by(page.c.created_at.desc(), page.c.id.desc())
+    ).all()
+    first = rows[0]
+    result = page_of(
+        [row for row in rows if row.id is not None],
+        limit,
+        EventRegistration.created_at,
+        EventRegistration.id,
+    )
+    result.facets = {
+        "total": first.total,
+        "ticket_total": first.ticket_total,
+        "status_counts": {
+            item.value: getattr(first, f"count_{item.name}") for item in RegistrationStatus
+        },
+    }
+    return result
+
+
+def iter_registrations_for_event(
+    db: Session,
+    event_id: str,
+    query: Optional[str] = None,
+    status: Optional[str] = None,
+    chunk_size: int = 500,
+) -> Iterator[Tuple[EventRegistration, Optional[User], Event]]:
+    # yield_per streams through a server-side cursor, chunk_size rows at a time.
+    return iter(
+        _registrations_for_event_query(db, event_id, query=query, status=status).yield_per(
+            chunk_size
+        )
     )
 
 def get_registration_by_id(
@@ -64,21 +207,92 @@ def get_registration_by_user_event(
     )
 
 
+def lock_event(db: Session, event_id) -> Optional[Event]:
+    # Serializes seat allocation per event; other events are not blocked.
+    return db.query(Event).filter(Event.id == event_id).with_for_update().first()
+
+
+def count_seats_taken(db: Session, event_id, exclude_id=None) -> int:
+    query = (
+        db.query(func.coalesce(func.sum(seat_count), 0))
+        .filter(EventRegistration.event_id == event_id)
+        .filter(EventRegistration.status.in_(SEAT_HOLDING_STATUSES))
+    )
+    if exclude_id is not None:
+        query = query.filter(EventRegistration.id != exclude_id)
+    return int(query.scalar())
+
+
+def promote_waitlist(db: Session, event: Event, exclude_ids=()) -> list[EventRegistration]:
+    # Admits waitlisted rows first-come-first-served; caller must hold lock_event.
+    # exclude_ids are rows the caller just set, so a staff-chosen Waitlisted
+    # status is not undone in the same transaction.
+    if event.capacity is None:
+        return []
+    query = (
+        db.query(EventRegistration)
+        .filter(EventRegistration.event_id == event.id)
+        .filter(EventRegistration.status == RegistrationStatus.waitlisted)
+    )
+    if exclude_ids:
+        query = query.filter(EventRegistration.id.notin_(exclude_ids))
+    waitlisted = query.order_by(
+        EventRegistration.created_at.asc(), EventRegistration.id.asc()
+    ).all()
+    if not waitlisted:
+        return []
+    remaining = event.capacity - count_seats_taken(db, event.id)
+    promoted: list[EventRegistration] = []
+    for registration in waitlisted:
+        seats = registration_seats(
+            registration.ticket_count, registration.is_proxy, registration.proxy_entries
+        )
+        if seats > remaining:
+            break
+        remaining -= seats
+        registration.status = RegistrationStatus.pending
+        promoted.append(registration)
+    return promoted
+
+
 def create_registration(
     db: Session, payload: RegistrationCreate, user_id: str
 ) -> EventRegistration:
-    existing = get_registration_by_user_event(db, user_id=user_id, event_id=payload.event_id)
-    if existing:
-        raise ValueError("Registration already exists")
-    registration = EventRegistration(
-        event_id=payload.event_id,
-        user_id=user_id,
-        ticket_count=payload.ticket_count,
-        is_proxy=payload.is_proxy,
-        proxy_entries=[entry.dict() for entry in payload.proxy_entries],
-    )
-    db.add(registration)
-    db.commit()
+    proxy_entries = [entry.dict() for entry in payload.proxy_entries]
+    seats = registration_seats(payload.ticket_count, payload.is_proxy, proxy_entries)
+    try:
+        event = lock_event(db, payload.event_id)
+        if not event:
+            raise EventNotFoundError("Event not found")
+        status = RegistrationStatus.pending
+        if event.capacity is not None:
+            if count_seats_taken(db, event.id) + seats > event.capacity:
+                if not event.waitlist_enabled:
+                    raise EventFullError("Event is full")
+                status = RegistrationStatus.waitlisted
+        # The unique (user_id, event_id) index settles duplicate submissions
+        # without a separate existence check.
+        statement = (
+            insert(EventRegistration)
+            .values(
+                event_id=event.id,
+                user_id=user_id,
+                status=status,
+                ticket_count=payload.ticket_count,
+                is_proxy=payload.is_proxy,
+                proxy_entries=proxy_entries,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "event_id"])
+            .returning(EventRegistration)
+        )
+        registration = db.scalars(statement).first()
+        if not registration:
+            raise ValueError("Registration already exists")
+        mark_dashboards_stale(db, [user_id])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     db.refresh(registration)
     return registration
 
@@ -88,19 +302,181 @@ def update_registration(
     registration: EventRegistration,
     payload: RegistrationUpdate,
 ) -> EventRegistration:
-    if payload.ticket_count is not None:
-        registration.ticket_count = payload.ticket_count
-    if payload.is_proxy is not None:
-        registration.is_proxy = payload.is_proxy
-    if payload.proxy_entries is not None:
-        registration.proxy_entries = [entry.dict() for entry in payload.proxy_entries]
-    if payload.status is not None:
-        registration.status = payload.status
-    db.commit()
+    try:
+        event = lock_event(db, registration.event_id)
+        db.refresh(registration)
+        seats_held = 0
+        if registration.status in SEAT_HOLDING_STATUSES:
+            seats_held = registration_seats(
+                registration.ticket_count, registration.is_proxy, registration.proxy_entries
+            )
+        if payload.ticket_count is not None:
+            registration.ticket_count = payload.ticket_count
+        if payload.is_proxy is not None:
+            registration.is_proxy = payload.is_proxy
+        if payload.proxy_entries is not None:
+            registration.proxy_entries = [entry.dict() for entry in payload.proxy_entries]
+        if payload.status is not None:
+            registration.status = payload.status
+        seats = 0
+        if registration.status in SEAT_HOLDING_STATUSES:
+            seats = registration_seats(
+                registration.ticket_count, registration.is_proxy, registration.proxy_entries
+            )
+        if event and event.capacity is not None and seats > seats_held:
+            taken = count_seats_taken(db, event.id, exclude_id=registration.id)
+            if taken + seats > event.capacity:
+                raise EventFullError("Event is full")
+        db.flush()
+        promoted = []
+        if event and seats < seats_held:
+            promoted = promote_waitlist(db, event, exclude_ids=[registration.id])
+        mark_dashboards_stale(db, [registration.user_id, *(row.user_id for row in promoted)])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     db.refresh(registration)
     return registration
 
 
 def delete_registration(db: Session, registration: EventRegistration) -> None:
-    db.delete(registration)
-    db.commit()
+    try:
+        event = lock_event(db, registration.event_id)
+        user_id = registration.user_id
+        held_seats = registration.status in SEAT_HOLDING_STATUSES
+        db.delete(registration)
+        db.flush()
+        promoted = promote_waitlist(db, event) if event and held_seats else []
+        mark_dashboards_stale(db, [user_id, *(row.user_id for row in promoted)])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def bulk_update_registrations(
+    db: Session,
+    event_id,
+    status: Optional[RegistrationStatus] = None,
+    ticket_count: Optional[int] = None,
+    ids: Optional[list] = None,
+    query: Optional[str] = None,
+    match_status: Optional[RegistrationStatus] = None,
+) -> Tuple[list[dict], list]:
+    # Applies one status/ticket change to many registrations of an event in a
+    # single statement and returns one outcome row per matched registration
+    # (id, status, ticket_count, outcome) plus any waitlist promotions.
+    try:
+        event = lock_event(db, event_id)
+        if not event:
+            raise EventNotFoundError("Event not found")
+        matches = [EventRegistration.event_id == event.id]
+        if ids is not None:
+            matches.append(EventRegistration.id.in_(ids))
+        if match_status:
+            matches.append(EventRegistration.status == match_status)
+        if query:
+            matches.append(
+                EventRegistration.user_id.in_(
+                    select(User.id).where(search_filter(query, User.full_name, User.email))
+                )
+            )
+        new_status = (
+            literal(status, EventRegistration.status.type) if status else EventRegistration.status
+        )
+        new_tickets = literal(ticket_count) if ticket_count is not None else EventRegistration.ticket_count
+        held = case((EventRegistration.status.in_(SEAT_HOLDING_STATUSES), seat_count), else_=0)
+        wanted = case((new_status.in_(SEAT_HOLDING_STATUSES), new_tickets + proxy_seat_count), else_=0)
+        candidates = (
+            select(
+                EventRegistration.id,
+                EventRegistration.created_at,
+                EventRegistration.status,
+                EventRegistration.ticket_count,
+                (
+                    new_status.is_distinct_from(EventRegistration.status)
+                    | (new_tickets != EventRegistration.ticket_count)
+                ).label("changed"),
+                (wanted - held).label("delta"),
+            )
+            .where(*matches)
+            .cte("candidates")
+        )
+        fits = true()
+        if event.capacity is not None:
+            # Seats go first come, first served, as on the waitlist: a row
+            # fits while the seats claimed by it and every earlier row stay
+            # within what is free, counting seats the same update releases.
+            remaining = event.capacity - count_seats_taken(db, event.id)
+            claimed = func.sum(func.greatest(candidates.c.delta, 0)).over(
+                order_by=(candidates.c.created_at, candidates.c.id)
+            )
+            released = -func.sum(func.least(candidates.c.delta, 0)).over()
+            fits = (candidates.c.delta <= 0) | (claimed <= remaining + released)
+        ranked = select(
+            candidates.c.id,
+            candidates.c.created_at,
+            candidates.c.status,
+            candidates.c.ticket_count,
+            candidates.c.changed,
+            candidates.c.delta,
+            fits.label("fits"),
+        ).cte("ranked")
+        values = {}
+        if status:
+            values["status"] = status
+        if ticket_count is not None:
+            values["ticket_count"] = ticket_count
+        updated = (
+            update(EventRegistration)
+            .where(EventRegistration.id == ranked.c.id, ranked.c.changed, ranked.c.fits)
+            .values(**values)
+            .returning(EventRegistration.id, EventRegistration.user_id)
+            .cte("updated")
+        )
+        rows = db.execute(
+            select(
+                ranked.c.id,
+                ranked.c.status,
+                ranked.c.ticket_count,
+                ranked.c.delta,
+                updated.c.user_id,
+                case(
+                    (updated.c.id.is_not(None), "updated"),
+                    (ranked.c.changed.is_(False), "unchanged"),
+                    else_="event_full",
+                ).label("outcome"),
+            )
+            .select_from(ranked)
+            .outerjoin(updated, updated.c.id == ranked.c.id)
+            .order_by(ranked.c.created_at, ranked.c.id)
+        ).all()
+        applied = [row for row in rows if row.outcome == "updated"]
+        promoted = []
+        if any(row.delta < 0 for row in applied):
+            promoted = promote_waitlist(db, event, exclude_ids=[row.id for row in applied])
+        mark_dashboards_stale(db, [*(row.user_id for row in applied), *(row.user_id for row in promoted)])
+        promoted_ids = [registration.id for registration in promoted]
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    results = [
+        {
+            "id": row.id,
+            "outcome": row.outcome,
+            "status": (
+                RegistrationStatus.pending
+                if row.id in promoted_ids
+                else status if row.outcome == "updated" and status else row.status
+            ),
+            "ticket_count": (
+                ticket_count
+                if row.outcome == "updated" and ticket_count is not None
+                else row.ticket_count
+            ),
+        }
+        for row in rows
+    ]
+    return results, promoted_ids
@@ -0,0 +1,47 @@
+from sqlalchemy import Text, false, func, or_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+
+# "ilike"   leading-wildcard ILIKE only (no extension or migration needed)
+# "trigram" ILIKE served by pg_trgm GIN indexes (shared/migrations/003)
+# "bigram"  CJK-friendly unigram/bigram token arrays (shared/migrations/002)
+SEARCH_BACKENDS = ("ilike", "trigram", "bigram")
+
+
+def _like_pattern(query: str) -> str:
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_tokens(query: str) -> list[str]:
+    # Mirrors public.search_tokens(): any substring of two or more characters
+    # contains all of its bigrams, so those narrow the GIN lookup; a single
+    # character falls back to its unigram.
+    lowered = query.lower()
+    bigrams = {
+        lowered[index : index + 2]
+        for index in range(len(lowered) - 1)
+        if not any(char.isspace() for char in lowered[index : index + 2])
+    }
+    if bigrams:
+        return sorted(bigrams)
+    return sorted({char for char in lowered if not char.isspace()})
+
+
+def search_filter(query: str, *columns) -> ColumnElement[bool]:
+    if not columns:
+        return false()
+    pattern = _like_pattern(query)
+    if settings.search_backend != "bigram":
+        return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+    tokens = search_tokens(query)
+    clauses = []
+    for column in columns:
+        clause = column.ilike(pattern, escape="\\")
+        if tokens:
+            # The ILIKE rechecks order and adjacency after the index match.
+            clause = func.search_tokens(column, type_=ARRAY(Text)).contains(tokens) & clause
+        clauses.append(clause)
+    return or_(*clauses)
@@ -1,48 +1,87 @@
 from typing import Optional
 
-from sqlalchemy import or_
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import invalidate_responses
 from app.models.sunday_message import SundayMessage
 from app.schemas.sunday_message import SundayMessageCreate, SundayMessageUpdate
+from app.services.pagination import Page, order_by_keyset, page_of
+from app.services.search import search_filter
 
 
 def get_sunday_message_by_id(db: Session, message_id: str) -> Optional[SundayMessage]:
     return db.query(SundayMessage).filter(SundayMessage.id == message_id).first()
 
 
-def list_sunday_messages(
-    db: Session,
+def _sort_column(sort_by: str):
+    sort_map = {
+        "message_date": SundayMessage.message_date,
+        "created_at": SundayMessage.created_at,
+        "title": SundayMessage.title,
+    }
+    return sort_map.get(sort_by, SundayMessage.message_date)
+
+
+def _sunday_messages_statement(
     site_id: Optional[str] = None,
     query: Optional[str] = None,
     sort_by: str = "message_date",
     sort_dir: str = "desc",
-    limit: int = 20,
-    offset: int = 0,
-) -> list[SundayMessage]:
-    list_query = db.query(SundayMessage)
+    cursor: Optional[str] = None,
+) -> Select:
+    statement = select(SundayMessage)
     if site_id:
-        list_query = list_query.filter(SundayMessage.site_id == site_id)
+        statement = statement.where(SundayMessage.site_id == site_id)
     if query:
-        like_value = f"%{query}%"
-        list_query = list_query.filter(
-            or_(
-                SundayMessage.title.ilike(like_value),
-                SundayMessage.speaker.ilike(like_value),
-                SundayMessage.description.ilike(like_value),
+        statement = statement.where(
+            search_filter(
+                query, SundayMessage.title, SundayMessage.speaker, SundayMessage.description
             )
         )
-    sort_map = {
-        "message_date": SundayMessage.message_date,
-        "created_at": SundayMessage.created_at,
-        "title": SundayMessage.title,
-    }
-    sort_column = sort_map.get(sort_by, SundayMessage.message_date)
-    if sort_dir == "asc":
-        list_query = list_query.order_by(sort_column.asc())
-    else:
-        list_query = list_query.order_by(sort_column.desc())
-    return list_query.offset(offset).limit(limit).all()
+    return order_by_keyset(
+        statement, _sort_column(sort_by), SundayMessage.id, sort_dir != "asc", cursor
+    )
+
+
+def _latest_sunday_messages_statement(site_id: Optional[str], limit: int) -> Select:
+    statement = select(SundayMessage)
+    if site_id:
+        statement = statement.where(SundayMessage.site_id == site_id)
+    return statement.order_by(
+        SundayMessage.message_date.desc(), SundayMessage.created_at.desc()
+    ).limit(limit)
+
+
+def list_sunday_messages(
+    db: Session,
+    site_id: Optional[str] = None,
+    query: Optional[str] = None,
+    sort_by: str = "message_date",
+    sort_dir: str = "desc",
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _sunday_messages_statement(site_id, query, sort_by, sort_dir, cursor)
+    rows = list(db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), SundayMessage.id)
+
+
+async def list_sunday_messages_async(
+    db: AsyncSession,
+    site_id: Optional[str] = None,
+    query: Optional[str] = None,
+    sort_by: str = "message_date",
+    sort_dir: str = "desc",
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Page:
+    statement = _sunday_messages_statement(site_id, query, sort_by, sort_dir, cursor)
+    rows = list(await db.scalars(statement.offset(offset).limit(limit + 1)))
+    return page_of(rows, limit, _sort_column(sort_by), SundayMessage.id)
 
 
 def list_latest_sunday_messages(
@@ -50,14 +89,15 @@ def list_latest_sunday_messages(
     site_id: Optional[str],
     limit: int = 5,
 ) -> list[SundayMessage]:
-    list_query = db.query(SundayMessage)
-    if site_id:
-        list_query = list_query.filter(SundayMessage.site_id == site_id)
-    return (
-        list_query.order_by(SundayMessage.message_date.desc(), SundayMessage.created_at.desc())
-        .limit(limit)
-        .all()
-    )
+    return list(db.scalars(_latest_sunday_messages_statement(site_id, limit)))
+
+
+async def list_latest_sunday_messages_async(
+    db: AsyncSession,
+    site_id: Optional[str],
+    limit: int = 5,
+) -> list[SundayMessage]:
+    return list(await db.scalars(_latest_sunday_messages_statement(site_id, limit)))
 
 
 def create_sunday_message(db: Session, payload: SundayMessageCreate) -> SundayMessage:
@@ -71,6 +111,7 @@ def create_sunday_message(db: Session, payload: SundayMessageCreate) -> SundayMe
     )
     db.add(record)
     db.commit()
+    invalidate_responses("sunday_messages")
     db.refresh(record)
     return record
 
@@ -94,6 +135,7 @@ def update_sunday_message(
     if payload.description is not None:
         record.description = payload.description
     db.commit()
+    invalidate_responses("sunday_messages")
     db.refresh(record)
     return record
 
@@ -104,4 +146,5 @@ def delete_sunday_message(db: Session, message_id: str) -> bool:
         return False
     db.delete(record)
     db.commit()
+    invalidate_responses("sunday_messages")
     return True
@@ -0,0 +1,63 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import anyio
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+def _discard(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _publish(temp_path: str, target_path: Path) -> None:
+    # Content-addressed names make an existing file an identical upload.
+    if target_path.exists():
+        _discard(temp_path)
+        return
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, target_path)
+
+
+def _create_temp(directory: Path) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    # The temp file lives in the target directory so the final rename is atomic.
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+    os.close(handle)
+    return temp_path
+
+
+async def store_upload(file: UploadFile, directory: Path, extension: str, max_bytes: int) -> str:
+    # UploadLimitMiddleware refuses most oversized bodies before they are
+    # spooled; these checks catch the rest.
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLargeError(f"File exceeds {max_bytes} bytes")
+    temp_path = await anyio.to_thread.run_sync(_create_temp, directory)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with await anyio.open_file(temp_path, "wb") as target:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"File exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                await target.write(chunk)
+            await target.flush()
+            await anyio.to_thread.run_sync(os.fsync, target.wrapped.fileno())
+        filename = f"{digest.hexdigest()[:32]}{extension}"
+        await anyio.to_thread.run_sync(_publish, temp_path, directory / filename)
+    except BaseException:
+        await anyio.to_thread.run_sync(_discard, temp_path)
+        raise
+    return filename
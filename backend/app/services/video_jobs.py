@@ -0,0 +1,74 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+# A job is one JSON file moving pending/ -> processing/ -> (deleted | failed/).
+# Each move is a rename within one filesystem, so any number of workers can
+# race for the same job and exactly one of them wins it.
+QUEUE_DIR = (
+    Path(settings.transcode_queue_dir)
+    if settings.transcode_queue_dir
+    else Path(__file__).resolve().parents[2] / "var" / "transcode"
+)
+PENDING_DIR = QUEUE_DIR / "pending"
+PROCESSING_DIR = QUEUE_DIR / "processing"
+FAILED_DIR = QUEUE_DIR / "failed"
+
+
+def _ensure_dirs() -> None:
+    for directory in (PENDING_DIR, PROCESSING_DIR, FAILED_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def enqueue_transcode(bulletin_id: str, source_path: Path, source_url: str) -> Path:
+    _ensure_dirs()
+    job = {
+        "bulletin_id": bulletin_id,
+        "source_path": str(source_path),
+        "source_url": source_url,
+        "enqueued_at": time.time(),
+    }
+    # Nanosecond prefixes keep pending/ in FIFO order when listed by name.
+    name = f"{time.time_ns()}-{bulletin_id}.json"
+    temp_path = QUEUE_DIR / f".{name}.part"
+    temp_path.write_text(json.dumps(job), encoding="utf-8")
+    target = PENDING_DIR / name
+    os.replace(temp_path, target)
+    return target
+
+
+def claim_next_job() -> Optional[tuple[Path, dict]]:
+    _ensure_dirs()
+    for name in sorted(os.listdir(PENDING_DIR)):
+        claimed = PROCESSING_DIR / name
+        try:
+            os.rename(PENDING_DIR / name, claimed)
+        except FileNotFoundError:
+            continue  # another worker got there first
+        return claimed, json.loads(claimed.read_text(encoding="utf-8"))
+    return None
+
+
+def complete_job(job_path: Path) -> None:
+    job_path.unlink(missing_ok=True)
+
+
+def fail_job(job_path: Path, job: dict, error: str) -> None:
+    job["error"] = error
+    job["failed_at"] = time.time()
+    job_path.write_text(json.dumps(job), encoding="utf-8")
+    os.replace(job_path, FAILED_DIR / job_path.name)
+
+
+def requeue_processing_jobs() -> int:
+    # For a single worker restarting after a crash; with several workers
+    # running this would hand a live job to a second one.
+    _ensure_dirs()
+    names = os.listdir(PROCESSING_DIR)
+    for name in names:
+        os.replace(PROCESSING_DIR / name, PENDING_DIR / name)
+    return len(names)
@@ -1,10 +1,15 @@
 from datetime import date
 from typing import Optional
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import invalidate_responses
 from app.models.weekly_verse import WeeklyVerse
 from app.schemas.weekly_verse import WeeklyVerseCreate, WeeklyVerseUpdate
+from app.services.dashboard import mark_site_dashboards_stale
+from app.services.pagination import Page, order_by_keyset, page_of
 
 
 def get_weekly_verse_by_id(db: Session, verse_id: str) -> Optional[WeeklyVerse]:
@@ -29,27 +34,37 @@ def list_weekly_verses(
     site_id: str,
     limit: int = 20,
     offset: int = 0,
-) -> list[WeeklyVerse]:
-    return (
-        db.query(WeeklyVerse)
-        .filter(WeeklyVerse.site_id == site_id)
-        .order_by(WeeklyVerse.week_start.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    cursor: Optional[str] = None,
+) -> Page:
+    query_set = order_by_keyset(
+        db.query(WeeklyVerse).filter(WeeklyVerse.site_id == site_id),
+        WeeklyVerse.week_start,
+        WeeklyVerse.id,
+        True,
+        cursor,
     )
+    rows = query_set.offset(offset).limit(limit + 1).all()
+    return page_of(rows, limit, WeeklyVerse.week_start, WeeklyVerse.id)
 
 
-def get_current_weekly_verse(db: Session, site_id: str) -> Optional[WeeklyVerse]:
+def _current_weekly_verse_statement(site_id: str) -> Select:
     return (
-        db.query(WeeklyVerse)
-        .filter(WeeklyVerse.site_id == site_id)
-        .filter(WeeklyVerse.week_start <= date.today())
+        select(WeeklyVerse)
+        .where(WeeklyVerse.site_id == site_id)
+        .where(WeeklyVerse.week_start <= date.today())
         .order_by(WeeklyVerse.week_start.desc())
-        .first()
+        .limit(1)
     )
 
 
+def get_current_weekly_verse(db: Session, site_id: str) -> Optional[WeeklyVerse]:
+    return db.scalars(_current_weekly_verse_statement(site_id)).first()
+
+
+async def get_current_weekly_verse_async(db: AsyncSession, site_id: str) -> Optional[WeeklyVerse]:
+    return (await db.scalars(_current_weekly_verse_statement(site_id))).first()
+
+
 def create_weekly_verse(db: Session, payload: WeeklyVerseCreate) -> WeeklyVerse:
     existing = get_weekly_verse_by_site_week(db, str(payload.site_id), payload.week_start)
     if existing:
@@ -62,7 +77,9 @@ def create_weekly_verse(db: Session, payload: WeeklyVerseCreate) -> WeeklyVerse:
         reading_plan=payload.reading_plan,
     )
     db.add(record)
+    mark_site_dashboards_stale(db, payload.site_id)
     db.commit()
+    invalidate_responses("weekly_verses")
     db.refresh(record)
     return record
 
@@ -86,7 +103,9 @@ def update_weekly_verse(
         record.reference = payload.reference
     if payload.reading_plan is not None:
         record.reading_plan = payload.reading_plan
+    mark_site_dashboards_stale(db, record.site_id)
     db.commit()
+    invalidate_responses("weekly_verses")
     db.refresh(record)
     return record
 
@@ -95,6 +114,8 @@ def delete_weekly_verse(db: Session, verse_id: str) -> bool:
     record = get_weekly_verse_by_id(db, verse_id)
     if not record:
         return False
+    mark_site_dashboards_stale(db, record.site_id)
     db.delete(record)
     db.commit()
+    invalidate_responses("weekly_verses")
     return True
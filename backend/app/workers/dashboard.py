@@ -0,0 +1,62 @@
+"""Keep dashboard summaries materialized from registrations, prayers and verses.
+
+Usage (from backend/):
+    python -m app.workers.dashboard          # poll the stale queue forever
+    python -m app.workers.dashboard --once   # drain the queue and exit
+    python -m app.workers.dashboard --all    # first queue every active user (backfill)
+
+Services queue a user in dashboard_summary_queue whenever their summary inputs
+change; this worker rebuilds only those users, a batch at a time. Several
+workers may run at once.
+"""
+import argparse
+import logging
+import time
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.dashboard import (
+    queue_all_dashboards,
+    queue_week_rollover,
+    refresh_stale_dashboards,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def drain() -> int:
+    refreshed = 0
+    with SessionLocal() as db:
+        queue_week_rollover(db)
+        while True:
+            count = refresh_stale_dashboards(db)
+            if not count:
+                return refreshed
+            refreshed += count
+
+
+def run(once: bool) -> None:
+    while True:
+        refreshed = drain()
+        if refreshed:
+            logger.info("Refreshed %d dashboard summaries", refreshed)
+        if once:
+            return
+        time.sleep(settings.dashboard_poll_seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="exit when the queue is empty")
+    parser.add_argument("--all", action="store_true", help="rebuild every active user first")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.all:
+        with SessionLocal() as db:
+            queue_all_dashboards(db)
+    run(args.once)
+
+
+if __name__ == "__main__":
+    main()
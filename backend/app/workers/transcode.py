@@ -0,0 +1,223 @@
+"""Transcode uploaded life bulletin videos into adaptive-bitrate HLS.
+
+Usage (from backend/):
+    python -m app.workers.transcode            # poll the queue forever
+    python -m app.workers.transcode --once     # drain the queue and exit
+    python -m app.workers.transcode --recover  # first requeue jobs a crashed worker held
+
+Needs ffmpeg and ffprobe (FFMPEG_PATH / FFPROBE_PATH). Output for an upload
+named <hash>.<ext> goes to static/life-bulletins/hls/<hash>/, so identical
+uploads are transcoded once and every file name stays content-addressed.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.media import precompress
+from app.db.session import SessionLocal
+from app.models.life_bulletin import LifeBulletinVideoStatus
+from app.services.life_bulletins import set_video_status
+from app.services.video_jobs import (
+    claim_next_job,
+    complete_job,
+    fail_job,
+    requeue_processing_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+VIDEO_DIR = BASE_DIR / "static" / "life-bulletins"
+HLS_DIR = VIDEO_DIR / "hls"
+HLS_URL = "/static/life-bulletins/hls"
+
+# (height, video kbit/s, audio kbit/s); renditions taller than the source are skipped.
+RENDITIONS = (
+    (360, 800, 96),
+    (720, 2800, 128),
+    (1080, 5000, 160),
+)
+SEGMENT_SECONDS = 4
+
+
+def probe(source: str) -> dict:
+    output = subprocess.run(
+        [
+            settings.ffprobe_path, "-v", "error",
+            "-show_entries", "stream=codec_type,width,height:stream_tags=rotate"
+            ":stream_side_data=rotation:format=duration",
+            "-of", "json", source,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    document = json.loads(output)
+    streams = document.get("streams", [])
+    video = next((stream for stream in streams if stream.get("codec_type") == "video"), None)
+    if video is None:
+        raise ValueError("No video stream")
+    width, height = int(video["width"]), int(video["height"])
+    rotation = video.get("tags", {}).get("rotate") or next(
+        (data.get("rotation") for data in video.get("side_data_list", []) if "rotation" in data),
+        0,
+    )
+    # ffmpeg applies the display rotation while decoding, so use display size.
+    if abs(int(float(rotation))) % 180 == 90:
+        width, height = height, width
+    return {
+        "width": width,
+        "height": height,
+        "duration": float(document.get("format", {}).get("duration") or 0),
+        "has_audio": any(stream.get("codec_type") == "audio" for stream in streams),
+    }
+
+
+def ffmpeg(*arguments: str) -> None:
+    subprocess.run(
+        [settings.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-y", *arguments],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def render_hls(source: str, digest: str, workdir: Path, info: dict) -> None:
+    renditions = [rendition for rendition in RENDITIONS if rendition[0] <= info["height"]]
+    if not renditions:
+        renditions = [(info["height"] - info["height"] % 2, RENDITIONS[0][1], RENDITIONS[0][2])]
+
+    master = ["#EXTM3U", "#EXT-X-VERSION:3"]
+    for height, video_kbps, audio_kbps in renditions:
+        width = round(info["width"] * height / info["height"] / 2) * 2
+        name = f"{digest}-{height}p"
+        audio = ["-map", "0:a:0", "-c:a", "aac", "-b:a", f"{audio_kbps}k", "-ac", "2"]
+        ffmpeg(
+            "-i", source,
+            "-map", "0:v:0", *(audio if info["has_audio"] else []),
+            "-vf", f"scale={width}:{height}",
+            "-c:v", "libx264", "-preset", "veryfast", "-profile:v", "main", "-pix_fmt", "yuv420p",
+            "-b:v", f"{video_kbps}k", "-maxrate", f"{int(video_kbps * 1.07)}k",
+            "-bufsize", f"{video_kbps * 2}k",
+            # Keyframes on segment boundaries keep renditions switchable.
+            "-force_key_frames", f"expr:gte(t,n_forced*{SEGMENT_SECONDS})",
+            "-f", "hls", "-hls_time", str(SEGMENT_SECONDS), "-hls_playlist_type", "vod",
+            "-hls_segment_filename", str(workdir / f"{name}-%05d.ts"),
+            str(workdir / f"{name}.m3u8"),
+        )
+        bandwidth = (video_kbps + (audio_kbps if info["has_audio"] else 0)) * 1100
+        master.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height}")
+        master.append(f"{name}.m3u8")
+
+    poster_height = min(720, info["height"])
+    ffmpeg(
+        "-ss", str(min(1.0, info["duration"] / 2)),
+        "-i", source,
+        "-frames:v", "1", "-vf", f"scale=-2:{poster_height}", "-q:v", "3",
+        str(workdir / f"{digest}-poster.jpg"),
+    )
+    (workdir / f"{digest}-master.m3u8").write_text("\n".join(master) + "\n", encoding="utf-8")
+    for playlist in workdir.glob("*.m3u8"):
+        precompress(str(playlist))
+
+
+def transcode(source: str) -> tuple[str, str]:
+    digest = Path(source).stem
+    output_dir = HLS_DIR / digest
+    if not (output_dir / f"{digest}-master.m3u8").exists():
+        HLS_DIR.mkdir(parents=True, exist_ok=True)
+        workdir = HLS_DIR / f".{digest}-{os.getpid()}.tmp"
+        shutil.rmtree(workdir, ignore_errors=True)
+        workdir.mkdir()
+        try:
+            render_hls(source, digest, workdir, probe(source))
+            try:
+                os.rename(workdir, output_dir)
+            except OSError:
+                if not output_dir.exists():
+                    raise
+                # Another worker finished the same upload first.
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    base_url = f"{HLS_URL}/{digest}"
+    return f"{base_url}/{digest}-master.m3u8", f"{base_url}/{digest}-poster.jpg"
+
+
+def mark_failed(job_path: Path, job: dict, detail: str) -> None:
+    # Best effort: the database may be what failed. The job leaves
+    # processing/ either way, so --recover never picks it up again.
+    try:
+        with SessionLocal() as db:
+            set_video_status(
+                db, job["bulletin_id"], job["source_url"], LifeBulletinVideoStatus.failed
+            )
+    except Exception:
+        logger.exception("Could not mark the bulletin of %s as failed", job_path.name)
+    fail_job(job_path, job, detail)
+
+
+def process_job(job_path: Path, job: dict) -> None:
+    bulletin_id, source_url = job["bulletin_id"], job["source_url"]
+    try:
+        with SessionLocal() as db:
+            if not set_video_status(
+                db, bulletin_id, source_url, LifeBulletinVideoStatus.processing
+            ):
+                logger.info("Skipping job %s: bulletin video was replaced", job_path.name)
+                complete_job(job_path)
+                return
+            playlist_url, poster_url = transcode(job["source_path"])
+            set_video_status(
+                db,
+                bulletin_id,
+                source_url,
+                LifeBulletinVideoStatus.ready,
+                video_url=playlist_url,
+                poster_url=poster_url,
+            )
+    except (OSError, ValueError, subprocess.CalledProcessError) as exc:
+        detail = exc.stderr if isinstance(exc, subprocess.CalledProcessError) else str(exc)
+        logger.error("Transcode failed for %s: %s", job_path.name, detail)
+        mark_failed(job_path, job, str(detail))
+        return
+    except Exception as exc:
+        # An unexpected probe result or a database error must not stop the
+        # worker or leave the job and bulletin stuck in processing.
+        logger.exception("Transcode failed for %s", job_path.name)
+        mark_failed(job_path, job, f"{type(exc).__name__}: {exc}")
+        return
+    complete_job(job_path)
+    logger.info("Transcoded %s -> %s", source_url, playlist_url)
+
+
+def run(once: bool) -> None:
+    while True:
+        claimed = claim_next_job()
+        if claimed is None:
+            if once:
+                return
+            time.sleep(settings.transcode_poll_seconds)
+            continue
+        process_job(*claimed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="exit when the queue is empty")
+    parser.add_argument("--recover", action="store_true", help="requeue jobs left in processing/")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.recover:
+        logger.info("Requeued %d interrupted jobs", requeue_processing_jobs())
+    run(args.once)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Performance benchmarks run against a local PostgreSQL database."""
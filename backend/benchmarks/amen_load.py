@@ -0,0 +1,270 @@
+"""Load-test prayer wall amens with bursts of taps on a few hot prayers.
+
+Usage (from backend/, needs httpx for --mode http):
+    python -m benchmarks.amen_load --server-workers 4 --clients 4 --concurrency 64 --taps 40000
+    python -m benchmarks.amen_load --mode service --threads 32 --taps 100000
+
+Seeds throwaway members and approved prayers. Most taps land on a handful of
+hot prayers and many repeat a (member, prayer) pair, as double taps do.
+--mode http starts uvicorn in a subprocess and fires POST /prayers/{id}/amen
+from several client processes. --mode service skips HTTP and auth and
+drives the amen buffer from threads, next to a baseline that writes every
+tap as its own INSERT + UPDATE transaction. Both modes then check that
+every prayer's amen_count equals its distinct amens: nothing lost, nothing
+double counted.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
+from sqlalchemy import delete, func, insert, select, text, update
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.models.dashboard import DashboardSummaryQueue
+from app.models.prayer import PrayerAmen, PrayerRequest, PrayerStatus
+from app.models.user import User
+from app.services.amens import amen_buffer, can_receive_amen
+from benchmarks.media_throughput import free_port
+
+NAIVE_SQL = text(
+    """
+    with new_amen as (
+        insert into prayer_amens (prayer_id, user_id) values (:prayer_id, :user_id)
+        on conflict do nothing
+        returning prayer_id
+    )
+    update prayer_requests set amen_count = amen_count + 1
+    where id = (select prayer_id from new_amen)
+    """
+)
+
+
+def setup(members: int, prayers: int) -> tuple[list[uuid.UUID], list[uuid.UUID], list[str]]:
+    user_ids = [uuid.uuid4() for _ in range(members)]
+    prayer_ids = [uuid.uuid4() for _ in range(prayers)]
+    emails = [f"amen-{user_id.hex}@example.com" for user_id in user_ids]
+    with SessionLocal() as db:
+        db.execute(
+            insert(User),
+            [
+                {"id": user_id, "email": email, "password_hash": "x"}
+                for user_id, email in zip(user_ids, emails)
+            ],
+        )
+        db.execute(
+            insert(PrayerRequest),
+            [
+                {
+                    "id": prayer_id,
+                    "user_id": user_ids[index % members],
+                    "content": f"amen-load {index}",
+                    "status": PrayerStatus.approved,
+                }
+                for index, prayer_id in enumerate(prayer_ids)
+            ],
+        )
+        db.commit()
+    return user_ids, prayer_ids, emails
+
+
+def teardown(user_ids: list[uuid.UUID], prayer_ids: list[uuid.UUID]) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(PrayerAmen).where(PrayerAmen.prayer_id.in_(prayer_ids)))
+        db.execute(delete(PrayerRequest).where(PrayerRequest.id.in_(prayer_ids)))
+        db.execute(delete(DashboardSummaryQueue).where(DashboardSummaryQueue.user_id.in_(user_ids)))
+        db.execute(delete(User).where(User.id.in_(user_ids)))
+        db.commit()
+
+
+def plan_taps(
+    taps: int, members: list[str], prayer_ids: list[uuid.UUID], hot: int, seed: int
+) -> list[tuple[str, str]]:
+    # (member, prayer) pairs; 80% of taps go to the first `hot` prayers.
+    rng = random.Random(seed)
+    plan = []
+    for _ in range(taps):
+        pool = prayer_ids[:hot] if rng.random() < 0.8 else prayer_ids
+        plan.append((rng.choice(members), str(rng.choice(pool))))
+    return plan
+
+
+async def fire(base_url: str, plan: list[tuple[str, str]], concurrency: int) -> tuple[list, dict]:
+    tokens = {email: create_access_token(email) for email, _ in plan}
+    queue: asyncio.Queue = asyncio.Queue()
+    for tap in plan:
+        queue.put_nowait(tap)
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            email, prayer_id = queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.post(
+                f"/prayers/{prayer_id}/amen",
+                headers={"Authorization": f"Bearer {tokens[email]}"},
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return latencies, statuses
+
+
+def run_client(base_url: str, plan: list[tuple[str, str]], concurrency: int):
+    return asyncio.run(fire(base_url, plan, concurrency))
+
+
+def wait_until_up(base_url: str) -> None:
+    for _ in range(100):
+        try:
+            httpx.get(f"{base_url}/health", timeout=1)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError("uvicorn did not start")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def check_counts(prayer_ids: list[uuid.UUID], distinct: set) -> bool:
+    with SessionLocal() as db:
+        counted = db.scalar(
+            select(func.sum(PrayerRequest.amen_count)).where(PrayerRequest.id.in_(prayer_ids))
+        )
+        stored = db.scalar(
+            select(func.count()).select_from(PrayerAmen).where(PrayerAmen.prayer_id.in_(prayer_ids))
+        )
+        hottest = db.scalar(
+            select(func.max(PrayerRequest.amen_count)).where(PrayerRequest.id.in_(prayer_ids))
+        )
+    print(f"distinct      {len(distinct)} (member, prayer) pairs, hottest prayer {hottest}")
+    print(f"amen_count    {counted} summed, {stored} prayer_amens rows")
+    return counted == len(distinct) and stored == len(distinct)
+
+
+def report(label: str, latencies: list[float], elapsed: float) -> None:
+    print(f"{label:<13} {len(latencies)} taps in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} amens/s)")
+    print(f"latency ms    p50={statistics.median(latencies):.2f} "
+          f"p95={percentile(latencies, 95):.2f} p99={percentile(latencies, 99):.2f} "
+          f"max={max(latencies):.2f}")
+
+
+def run_http(args, user_ids, prayer_ids, emails) -> bool:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+            "--workers", str(args.server_workers), "--log-level", "warning",
+        ]
+    )
+    try:
+        wait_until_up(base_url)
+        plans = [
+            plan_taps(args.taps // args.clients, emails, prayer_ids, args.hot, seed)
+            for seed in range(args.clients)
+        ]
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.clients) as pool:
+            results = list(
+                pool.map(run_client, [base_url] * args.clients, plans, [args.concurrency] * args.clients)
+            )
+        elapsed = time.perf_counter() - started
+        # Let every server worker flush what it still holds.
+        time.sleep(settings.amen_flush_interval_seconds * 4 + 1)
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = [latency for client_latencies, _ in results for latency in client_latencies]
+    statuses: dict[int, int] = {}
+    for _, client_statuses in results:
+        for code, count in client_statuses.items():
+            statuses[code] = statuses.get(code, 0) + count
+    print(f"http          {args.clients}x{args.concurrency} connections, "
+          f"{args.server_workers} server workers, statuses {statuses}")
+    report("buffered", latencies, elapsed)
+    distinct = {tap for plan in plans for tap in plan}
+    return statuses.get(202) == len(latencies) and check_counts(prayer_ids, distinct)
+
+
+def run_service(args, user_ids, prayer_ids, emails) -> bool:
+    members = [str(user_id) for user_id in user_ids]
+    plan = plan_taps(args.taps, members, prayer_ids, args.hot, 0)
+    distinct = set(plan)
+
+    def buffered(tap: tuple[str, str]) -> float:
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            if can_receive_amen(db, tap[1]):
+                amen_buffer.add(tap[1], tap[0])
+        return (time.perf_counter() - started) * 1000
+
+    def naive(tap: tuple[str, str]) -> float:
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            db.execute(NAIVE_SQL, {"prayer_id": tap[1], "user_id": tap[0]})
+            db.commit()
+        return (time.perf_counter() - started) * 1000
+
+    ok = True
+    for label, tap_once in (("buffered", buffered), ("per-tap", naive)):
+        taps = plan if label == "buffered" else plan[: args.naive_taps]
+        with SessionLocal() as db:
+            db.execute(delete(PrayerAmen).where(PrayerAmen.prayer_id.in_(prayer_ids)))
+            db.execute(
+                update(PrayerRequest).where(PrayerRequest.id.in_(prayer_ids)).values(amen_count=0)
+            )
+            db.commit()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            latencies = list(pool.map(tap_once, taps))
+        amen_buffer.flush()
+        elapsed = time.perf_counter() - started
+        report(label, latencies, elapsed)
+        ok = check_counts(prayer_ids, set(taps) if label != "buffered" else distinct) and ok
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["http", "service"], default="http")
+    parser.add_argument("--server-workers", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=4, help="client processes")
+    parser.add_argument("--concurrency", type=int, default=64, help="connections per client")
+    parser.add_argument("--threads", type=int, default=32, help="--mode service threads")
+    parser.add_argument("--taps", type=int, default=40_000)
+    parser.add_argument("--naive-taps", type=int, default=5_000, help="per-tap baseline taps")
+    parser.add_argument("--members", type=int, default=2_000)
+    parser.add_argument("--prayers", type=int, default=200)
+    parser.add_argument("--hot", type=int, default=5)
+    args = parser.parse_args()
+
+    user_ids, prayer_ids, emails = setup(args.members, args.prayers)
+    try:
+        run = run_http if args.mode == "http" else run_service
+        if not run(args, user_ids, prayer_ids, emails):
+            raise SystemExit("FAIL: amen counts do not match distinct taps")
+        print("OK: every distinct amen counted exactly once")
+    finally:
+        teardown(user_ids, prayer_ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""Load-test the API with traffic shaped like a church's busiest moments.
+
+Usage (from backend/, needs httpx):
+    python -m benchmarks.church_traffic --output before.json
+    python -m benchmarks.church_traffic --scenarios homepage registration --duration 30
+    python -m benchmarks.church_traffic --compare before.json after.json
+
+Seeds a throwaway site (members, a staff account, verses, messages,
+bulletins, events, registrations and approved prayers), starts uvicorn
+unless --base-url points at a running server, then runs each scenario:
+
+  homepage      Sunday morning: visitors keep loading the home page, which
+                fetches the weekly verse, latest messages, latest bulletins
+                and upcoming events at once.
+  registration  Conference launch: every member POSTs /registrations for one
+                capped, waitlisted event at the same moment.
+  export        Staff download the registration CSV of a large event.
+  prayer-wall   Members read the prayer wall and tap amen on what they see.
+
+Prints p50/p95/p99 latency and requests per second per scenario and route.
+--output writes the same numbers as JSON tagged with the git commit, and
+--compare prints the change between two such files. The seeded data is
+deleted afterwards. The client runs in one process, so on a small machine
+it competes with the server for CPU; compare runs made on the same machine.
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import text
+
+import app.models  # noqa: F401
+from app.core.security import create_access_token
+from app.db.session import engine
+from benchmarks.amen_load import percentile, wait_until_up
+from benchmarks.media_throughput import free_port
+
+SCENARIOS = ("homepage", "registration", "export", "prayer-wall")
+
+SITE_ID = "md5('traffic-site')::uuid"
+
+SEED_SQL = f"""
+insert into sites (id, code, name) values ({SITE_ID}, 'traffic-site', 'Traffic bench site');
+
+insert into users (id, email, password_hash, full_name, site_id)
+select md5('traffic-member' || i)::uuid, 'traffic-member-' || i || '@example.com', 'x',
+       'Member ' || i, {SITE_ID}
+from generate_series(1, :members) i;
+
+insert into users (id, email, password_hash, full_name, role, site_id)
+values (md5('traffic-staff')::uuid, 'traffic-staff@example.com', 'x', 'Traffic staff',
+        'CenterStaff', {SITE_ID});
+
+insert into weekly_verses (site_id, week_start, text, reference)
+values ({SITE_ID}, current_date - 1, 'For God so loved the world', 'John 3:16');
+
+insert into sunday_messages (site_id, message_date, title, speaker, youtube_url)
+select {SITE_ID}, current_date - 7 * i, 'Message ' || i, 'Pastor',
+       'https://www.youtube.com/watch?v=traffic' || i
+from generate_series(0, 19) i;
+
+insert into life_bulletins (site_id, bulletin_date, content, status)
+select {SITE_ID}, current_date - 7 * i, 'Bulletin ' || i, 'Published'
+from generate_series(0, 19) i;
+
+insert into events (id, site_id, title, start_at, status)
+select md5('traffic-event' || i)::uuid, {SITE_ID}, 'Event ' || i,
+       now() + (i || ' days')::interval, 'Published'
+from generate_series(1, 20) i;
+
+insert into events (id, site_id, title, start_at, capacity, waitlist_enabled, status)
+values (md5('traffic-conference')::uuid, {SITE_ID}, 'Conference', now() + interval '60 days',
+        :capacity, true, 'Published');
+
+insert into event_registrations (event_id, user_id, status, ticket_count, is_proxy, proxy_entries)
+select md5('traffic-event1')::uuid, md5('traffic-member' || i)::uuid,
+       (array['Pending', 'Confirmed', 'Confirmed', 'Waitlisted'])[1 + i % 4]::registration_status,
+       1 + i % 3, i % 3 = 0,
+       case when i % 3 = 0
+            then jsonb_build_array(jsonb_build_object('name', 'Guest ' || i, 'relation', 'Family'))
+            else '[]'::jsonb end
+from generate_series(1, :members) i;
+
+insert into prayer_requests (id, user_id, site_id, content, privacy_level, status)
+select md5('traffic-prayer' || i)::uuid, md5('traffic-member' || (1 + i % :members))::uuid,
+       {SITE_ID}, 'Prayer request ' || i, 'Public', 'Approved'
+from generate_series(1, :prayers) i;
+
+analyze event_registrations;
+analyze prayer_requests
+"""
+
+TEARDOWN_SQL = f"""
+delete from prayer_requests where site_id = {SITE_ID};
+delete from prayer_wall_events where site_id = {SITE_ID};
+delete from event_registrations
+where event_id in (select id from events where site_id = {SITE_ID});
+delete from events where site_id = {SITE_ID};
+delete from weekly_verses where site_id = {SITE_ID};
+delete from sunday_messages where site_id = {SITE_ID};
+delete from life_bulletins where site_id = {SITE_ID};
+delete from dashboard_summaries
+where user_id in (select id from users where site_id = {SITE_ID});
+delete from users where site_id = {SITE_ID};
+delete from sites where id = {SITE_ID}
+"""
+
+
+def run_sql(script: str, **params) -> None:
+    with engine.begin() as connection:
+        for statement in script.split(";\n"):
+            connection.execute(text(statement), params)
+
+
+def seed(args) -> dict:
+    # Leftovers of an interrupted run would collide with the fixed ids.
+    run_sql(TEARDOWN_SQL)
+    run_sql(SEED_SQL, members=args.members, prayers=args.prayers, capacity=args.members // 2)
+    with engine.connect() as connection:
+        ids = connection.execute(
+            text(
+                f"select {SITE_ID}, md5('traffic-conference')::uuid, md5('traffic-event1')::uuid"
+            )
+        ).one()
+        prayer_ids = connection.execute(
+            text(f"select id from prayer_requests where site_id = {SITE_ID}")
+        ).scalars().all()
+    members = [f"traffic-member-{index}@example.com" for index in range(1, args.members + 1)]
+    return {
+        "site_id": str(ids[0]),
+        "conference_id": str(ids[1]),
+        "export_event_id": str(ids[2]),
+        "prayer_ids": [str(prayer_id) for prayer_id in prayer_ids],
+        "member_tokens": [create_access_token(email) for email in members],
+        "staff_token": create_access_token("traffic-staff@example.com"),
+    }
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = {}
+        self.statuses: dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    async def request(self, client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            status = str(response.status_code)
+        except httpx.HTTPError as exc:
+            response, status = None, type(exc).__name__
+        self.samples.setdefault(route, []).append((time.perf_counter() - started) * 1000)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        return response
+
+    def stop(self) -> None:
+        self.elapsed = time.perf_counter() - self.started
+
+    def summary(self) -> dict:
+        def stats(latencies: list[float]) -> dict:
+            return {
+                "requests": len(latencies),
+                "rps": round(len(latencies) / self.elapsed, 1),
+                "p50_ms": round(percentile(latencies, 50), 2),
+                "p95_ms": round(percentile(latencies, 95), 2),
+                "p99_ms": round(percentile(latencies, 99), 2),
+                "max_ms": round(max(latencies), 2),
+            }
+
+        everything = [latency for latencies in self.samples.values() for latency in latencies]
+        return {
+            "elapsed_s": round(self.elapsed, 2),
+            "statuses": self.statuses,
+            **stats(everything),
+            "routes": {route: stats(latencies) for route, latencies in self.samples.items()},
+        }
+
+
+async def homepage(client: httpx.AsyncClient, data: dict, args, recorder: Recorder) -> None:
+    params = {"site_id": data["site_id"]}
+    deadline = time.perf_counter() + args.duration
+
+    async def visitor() -> None:
+        while time.perf_counter() < deadline:
+            await asyncio.gather(
+                recorder.request(client, "/weekly-verse/current", "GET", "/weekly-verse/current", params=params),
+                recorder.request(client, "/sunday-messages/latest", "GET", "/sunday-messages/latest", params=params),
+                recorder.request(client, "/life-bulletins/latest", "GET", "/life-bulletins/latest", params=params),
+                recorder.request(
+                    client, "/events", "GET", "/events", params={**params, "upcoming_only": "true"}
+                ),
+            )
+
+    await asyncio.gather(*(visitor() for _ in range(args.concurrency)))
+
+
+async def registration(client: httpx.AsyncClient, data: dict, args, recorder: Recorder) -> None:
+    # Everyone is already on the page when registration opens.
+    gate = asyncio.Semaphore(args.concurrency)
+    payload = {"event_id": data["conference_id"], "ticket_count": 1}
+
+    async def member(token: str) -> None:
+        async with gate:
+            await recorder.request(
+                client, "POST /registrations", "POST", "/registrations",
+                json=payload, headers={"Authorization": f"Bearer {token}"},
+            )
+
+    await asyncio.gather(*(member(token) for token in data["member_tokens"]))
+
+
+async def export(client: httpx.AsyncClient, data: dict, args, recorder: Recorder) -> None:
+    headers = {"Authorization": f"Bearer {data['staff_token']}"}
+    params = {"event_id": data["export_event_id"]}
+    gate = asyncio.Semaphore(args.export_concurrency)
+
+    async def download() -> None:
+        async with gate:
+            # Response bodies are read in full, so latency is time to last byte.
+            await recorder.request(
+                client, "/registrations/admin/export", "GET", "/registrations/admin/export",
+                params=params, headers=headers,
+            )
+
+    await asyncio.gather(*(download() for _ in range(args.exports)))
+
+
+async def prayer_wall(client: httpx.AsyncClient, data: dict, args, recorder: Recorder) -> None:
+    rng = random.Random(0)
+    deadline = time.perf_counter() + args.duration
+    params = {"site_id": data["site_id"], "limit": 20}
+
+    async def member() -> None:
+        headers = {"Authorization": f"Bearer {rng.choice(data['member_tokens'])}"}
+        while time.perf_counter() < deadline:
+            response = await recorder.request(client, "/prayers", "GET", "/prayers", params=params)
+            if response is None or response.status_code != 200:
+                continue
+            shown = [prayer["id"] for prayer in response.json()] or data["prayer_ids"][:1]
+            if rng.random() < args.amen_ratio:
+                await recorder.request(
+                    client, "POST /prayers/{prayer_id}/amen", "POST",
+                    f"/prayers/{rng.choice(shown)}/amen", headers=headers,
+                )
+
+    await asyncio.gather(*(member() for _ in range(args.concurrency)))
+
+
+RUNNERS = {
+    "homepage": homepage,
+    "registration": registration,
+    "export": export,
+    "prayer-wall": prayer_wall,
+}
+
+
+def print_summary(name: str, summary: dict) -> None:
+    print(f"\n{name}: {summary['requests']} requests in {summary['elapsed_s']}s "
+          f"({summary['rps']} req/s), statuses {summary['statuses']}")
+    print(f"  {'route':<34} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for route, stats in summary["routes"].items():
+        print(f"  {route:<34} {stats['rps']:>8} {stats['p50_ms']:>9} {stats['p95_ms']:>9} "
+              f"{stats['p99_ms']:>9} {stats['max_ms']:>9}")
+
+
+async def run(base_url: str, data: dict, args) -> dict:
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.export_concurrency))
+    results = {}
+    for name in args.scenarios:
+        # A fresh client per scenario: connections left idle in between would
+        # hit the server's keep-alive timeout and fail the next POST.
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+            recorder = Recorder()
+            await RUNNERS[name](client, data, args, recorder)
+            recorder.stop()
+        results[name] = recorder.summary()
+        print_summary(name, results[name])
+    return results
+
+
+def git_commit() -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip() or "unknown"
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as handle:
+        before = json.load(handle)
+    with open(after_path) as handle:
+        after = json.load(handle)
+    print(f"{before['commit']} -> {after['commit']}")
+    for name, new in after["scenarios"].items():
+        old = before["scenarios"].get(name)
+        if old is None:
+            continue
+        print(f"\n{name}")
+        print(f"  {'route':<34} {'metric':<7} {'before':>9} {'after':>9} {'change':>8}")
+        for route, stats in [("(all)", new), *new["routes"].items()]:
+            previous = old if route == "(all)" else old["routes"].get(route)
+            if previous is None:
+                continue
+            for metric in ("rps", "p50_ms", "p95_ms", "p99_ms"):
+                change = (stats[metric] - previous[metric]) / previous[metric] * 100 if previous[metric] else 0
+                print(f"  {route:<34} {metric:<7} {previous[metric]:>9} {stats[metric]:>9} {change:>+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--base-url", help="target a running server instead of starting one")
+    parser.add_argument("--server-workers", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=20, help="seconds, homepage and prayer-wall")
+    parser.add_argument("--concurrency", type=int, default=50, help="simultaneous visitors")
+    parser.add_argument("--members", type=int, default=2_000)
+    parser.add_argument("--prayers", type=int, default=500)
+    parser.add_argument("--exports", type=int, default=10)
+    parser.add_argument("--export-concurrency", type=int, default=2)
+    parser.add_argument("--amen-ratio", type=float, default=0.3)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    data = seed(args)
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                "--workers", str(args.server_workers), "--log-level", "warning",
+            ]
+        )
+    try:
+        wait_until_up(base_url)
+        results = asyncio.run(run(base_url, data, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        run_sql(TEARDOWN_SQL)
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "options": {
+                key: value for key, value in vars(args).items() if key not in ("output", "compare")
+            },
+            "scenarios": results,
+        }
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nwrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
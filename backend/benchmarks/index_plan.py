@@ -0,0 +1,266 @@
+"""Compare service query plans and latencies before and after an index migration.
+
+Usage (from backend/):
+    python -m benchmarks.index_plan --scale 1
+    python -m benchmarks.index_plan --no-seed --plans   # reuse data already loaded
+
+Everything runs inside one transaction that is rolled back at the end: the
+synthetic rows, the dropped indexes for the "before" pass and the migration
+applied for the "after" pass never persist. The SQL explained is captured
+from the real service functions, so it matches what the API sends.
+"""
+import argparse
+import json
+import re
+import statistics
+from pathlib import Path
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.db.session import engine
+from app.models.event import EventStatus
+from app.services.admin_users import list_users
+from app.services.care import list_logs, list_subjects
+from app.services.events import list_events
+from app.services.life_bulletins import list_latest_life_bulletins
+from app.services.prayers import list_prayers
+from app.services.registrations import list_registration_rows_for_event, list_registrations
+from app.services.sunday_messages import list_latest_sunday_messages
+from app.services.weekly_verse import get_current_weekly_verse
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "shared" / "migrations"
+
+# Row counts at --scale 1.
+BASE_ROWS = {
+    "users": 20_000,
+    "events": 2_000,
+    "registrations": 200_000,
+    "prayers": 100_000,
+    "care_subjects": 10_000,
+    "care_logs": 100_000,
+    "life_bulletins": 5_000,
+    "sunday_messages": 5_000,
+    "weekly_weeks": 500,
+}
+
+SEED_SQL = """
+insert into sites (id, code, name)
+select md5('bench-site' || s)::uuid, 'bench-site-' || s, 'Bench site ' || s
+from generate_series(0, 3) s;
+
+insert into users (id, email, password_hash, full_name, site_id, created_at)
+select md5('bench-user' || i)::uuid, 'bench-user-' || i || '@example.com', 'x',
+       'Member ' || i, md5('bench-site' || (i % 4))::uuid,
+       now() - (i || ' minutes')::interval
+from generate_series(0, :users - 1) i;
+
+insert into events (id, site_id, title, description, start_at, capacity, status)
+select md5('bench-event' || i)::uuid, md5('bench-site' || (i % 4))::uuid,
+       'Event ' || i, 'Description ' || i,
+       now() + ((i - :events / 2) || ' hours')::interval, 500,
+       (case when i % 5 = 0 then 'Draft' else 'Published' end)::event_status
+from generate_series(0, :events - 1) i;
+
+insert into event_registrations (event_id, user_id, status, ticket_count, created_at)
+select md5('bench-event' || ((i / :users + (i % :users) * 7) % :events))::uuid,
+       md5('bench-user' || (i % :users))::uuid,
+       (array['Pending', 'Confirmed', 'Waitlisted', 'Cancelled'])[1 + i % 4]::registration_status,
+       1 + i % 3, now() - (i || ' seconds')::interval
+from generate_series(0, :registrations - 1) i;
+
+insert into prayer_requests (user_id, site_id, content, status, amen_count, created_at)
+select md5('bench-user' || (i % :users))::uuid, md5('bench-site' || (i % 4))::uuid,
+       'Prayer ' || i,
+       (array['Pending', 'Approved', 'Approved', 'Archived'])[1 + i % 4]::prayer_status,
+       (i * 7919) % 500, now() - (i || ' seconds')::interval
+from generate_series(0, :prayers - 1) i;
+
+insert into care_subjects (id, site_id, name, created_at)
+select md5('bench-subject' || i)::uuid, md5('bench-site' || (i % 4))::uuid,
+       'Subject ' || i, now() - (i || ' minutes')::interval
+from generate_series(0, :care_subjects - 1) i;
+
+insert into care_logs (subject_id, note, created_at)
+select md5('bench-subject' || (i % :care_subjects))::uuid, 'Note ' || i,
+       now() - (i || ' seconds')::interval
+from generate_series(0, :care_logs - 1) i;
+
+insert into life_bulletins (site_id, bulletin_date, content, status)
+select md5('bench-site' || (i % 4))::uuid, current_date - i / 4, 'Bulletin ' || i,
+       (case when i % 3 = 0 then 'Draft' else 'Published' end)::life_bulletin_status
+from generate_series(0, :life_bulletins - 1) i;
+
+insert into sunday_messages (site_id, message_date, title, youtube_url)
+select md5('bench-site' || (i % 4))::uuid, current_date - i / 4, 'Message ' || i,
+       'https://youtu.be/bench' || i
+from generate_series(0, :sunday_messages - 1) i;
+
+insert into weekly_verses (site_id, week_start, text, reference)
+select md5('bench-site' || s)::uuid, current_date - 7 * w, 'Verse ' || w, 'Ref ' || w
+from generate_series(0, 3) s, generate_series(0, :weekly_weeks - 1) w;
+"""
+
+SAMPLE_SQL = {
+    "site_id": "select site_id from prayer_requests where site_id is not null "
+    "group by site_id order by count(*) desc limit 1",
+    "event_id": "select event_id from event_registrations group by event_id "
+    "order by count(*) desc limit 1",
+    "user_id": "select user_id from event_registrations where user_id is not null "
+    "group by user_id order by count(*) desc limit 1",
+    "subject_id": "select subject_id from care_logs group by subject_id "
+    "order by count(*) desc limit 1",
+}
+
+QUERIES = {
+    "registrations for event (admin)": lambda db, s: list_registration_rows_for_event(
+        db, s["event_id"]
+    ),
+    "registrations for event by status": lambda db, s: list_registration_rows_for_event(
+        db, s["event_id"], status="Confirmed"
+    ),
+    "my registrations": lambda db, s: list_registrations(db, s["user_id"]),
+    "prayer wall newest": lambda db, s: list_prayers(db, site_id=s["site_id"]),
+    "prayer wall by amen": lambda db, s: list_prayers(db, site_id=s["site_id"], sort_by="amen_count"),
+    "prayer wall all sites": lambda db, s: list_prayers(db),
+    "upcoming events for site": lambda db, s: list_events(
+        db, site_id=s["site_id"], status=EventStatus.published, upcoming_only=True
+    ),
+    "upcoming events all sites": lambda db, s: list_events(db, upcoming_only=True),
+    "latest life bulletins": lambda db, s: list_latest_life_bulletins(db, site_id=s["site_id"]),
+    "latest sunday messages": lambda db, s: list_latest_sunday_messages(db, site_id=s["site_id"]),
+    "current weekly verse": lambda db, s: get_current_weekly_verse(db, s["site_id"]),
+    "care logs for subject": lambda db, s: list_logs(db, s["subject_id"]),
+    "care subjects for site": lambda db, s: list_subjects(db, site_id=s["site_id"]),
+    "admin users for site": lambda db, s: list_users(db, site_id=s["site_id"]),
+}
+
+
+def migration_statements(path: Path) -> list[str]:
+    body = "\n".join(
+        line for line in path.read_text(encoding="utf-8").splitlines() if not line.startswith("--")
+    )
+    # CONCURRENTLY cannot run inside the benchmark's transaction.
+    return [
+        re.sub(r"\bconcurrently\s+", "", statement.strip(), flags=re.IGNORECASE)
+        for statement in body.split(";")
+        if statement.strip()
+    ]
+
+
+def created_indexes(statements: list[str]) -> list[str]:
+    names = []
+    for statement in statements:
+        match = re.search(r"create\s+(?:unique\s+)?index\s+if\s+not\s+exists\s+(\w+)", statement, re.I)
+        if match:
+            names.append(match.group(1))
+    return names
+
+
+def capture_sql(connection, samples: dict) -> dict[str, tuple[str, object]]:
+    captured: dict[str, tuple[str, object]] = {}
+    current = {}
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        current.setdefault("sql", (statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", listener)
+    try:
+        with Session(bind=connection) as db:
+            for name, run in QUERIES.items():
+                current.clear()
+                run(db, samples)
+                captured[name] = current["sql"]
+    finally:
+        event.remove(connection, "before_cursor_execute", listener)
+    return captured
+
+
+def plan_summary(plan: dict) -> str:
+    indexes = []
+    node_types = []
+
+    def walk(node):
+        node_types.append(node["Node Type"])
+        if "Index Name" in node:
+            indexes.append(node["Index Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan)
+    scans = [node for node in node_types if "Scan" in node]
+    return ", ".join(sorted(set(indexes))) or ", ".join(sorted(set(scans)))
+
+
+def explain(connection, sql: str, parameters, runs: int) -> tuple[float, dict]:
+    timings = []
+    plan = {}
+    for _ in range(runs):
+        result = connection.exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, parameters
+        ).scalar()
+        document = result if isinstance(result, list) else json.loads(result)
+        timings.append(document[0]["Execution Time"])
+        plan = document[0]["Plan"]
+    return statistics.median(timings), plan
+
+
+def measure(connection, captured, runs: int) -> dict[str, tuple[float, dict]]:
+    connection.execute(text("analyze"))
+    return {name: explain(connection, sql, params, runs) for name, (sql, params) in captured.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--no-seed", action="store_true", help="use the rows already in the database")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--migration", default="001_query_indexes.sql")
+    parser.add_argument("--plans", action="store_true", help="print full JSON plans")
+    args = parser.parse_args()
+
+    statements = migration_statements(MIGRATIONS_DIR / args.migration)
+    new_indexes = created_indexes(statements)
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            if not args.no_seed:
+                rows = {key: max(1, int(value * args.scale)) for key, value in BASE_ROWS.items()}
+                for statement in SEED_SQL.split(";\n"):
+                    if statement.strip():
+                        connection.execute(text(statement), rows)
+                print("seeded " + ", ".join(f"{key}={value}" for key, value in rows.items()))
+            samples = {key: str(connection.execute(text(sql)).scalar()) for key, sql in SAMPLE_SQL.items()}
+            captured = capture_sql(connection, samples)
+
+            before_point = connection.begin_nested()
+            for name in new_indexes:
+                connection.execute(text(f"drop index if exists {name}"))
+            before = measure(connection, captured, args.runs)
+            before_point.rollback()
+
+            for statement in statements:
+                connection.execute(text(statement))
+            after = measure(connection, captured, args.runs)
+        finally:
+            transaction.rollback()
+
+    width = max(len(name) for name in QUERIES)
+    print(f"{'query':<{width}}  {'before ms':>10}  {'after ms':>10}  {'speedup':>8}  plan after")
+    for name in QUERIES:
+        before_ms, before_plan = before[name]
+        after_ms, after_plan = after[name]
+        speedup = before_ms / after_ms if after_ms else float("inf")
+        print(
+            f"{name:<{width}}  {before_ms:>10.3f}  {after_ms:>10.3f}  {speedup:>7.1f}x  "
+            f"{plan_summary(after_plan)}"
+        )
+        if args.plans:
+            print("  before: " + plan_summary(before_plan))
+            print(json.dumps({"before": before_plan, "after": after_plan}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Measure a Sunday login spike: login throughput and what it does to other endpoints.
+
+Usage (from backend/, needs httpx):
+    python -m benchmarks.login_throughput --members 500 --concurrency 64 --logins 2000
+    python -m benchmarks.login_throughput --seed-rounds 10   # exercise rehash-on-login
+
+Seeds throwaway members sharing one password hashed at --seed-rounds, starts
+uvicorn with one worker and fires POST /auth/login from many connections
+while a probe keeps hitting GET /health. Reports logins per second, the
+status mix (503s are the hashing queue turning requests away; the client
+waits out Retry-After and tries again), login and probe latency, and how many stored hashes were upgraded to the configured
+PASSWORD_HASH_ROUNDS. The members are deleted afterwards.
+"""
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+from passlib.context import CryptContext
+from sqlalchemy import delete, func, insert, select
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.user import User
+from benchmarks.amen_load import percentile, wait_until_up
+from benchmarks.media_throughput import free_port
+
+PASSWORD = "sunday-service"
+
+
+def setup(members: int, rounds: int) -> list[str]:
+    password_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds).hash(PASSWORD)
+    prefix = uuid.uuid4().hex[:8]
+    emails = [f"login-{prefix}-{index}@example.com" for index in range(members)]
+    with SessionLocal() as db:
+        db.execute(insert(User), [{"email": email, "password_hash": password_hash} for email in emails])
+        db.commit()
+    return emails
+
+
+def teardown(emails: list[str]) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(User).where(User.email.in_(emails)))
+        db.commit()
+
+
+def upgraded(emails: list[str]) -> int:
+    prefix = f"$2b${settings.password_hash_rounds:02d}$"
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.count()).select_from(User).where(
+                User.email.in_(emails), User.password_hash.startswith(prefix)
+            )
+        )
+
+
+async def run(base_url: str, emails: list[str], args) -> None:
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(args.logins):
+        queue.put_nowait(emails[index % len(emails)])
+    latencies: list[float] = []
+    probes: list[float] = []
+    statuses: dict = {}
+    done = asyncio.Event()
+
+    async def login(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            email = queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.post(
+                "/auth/login", json={"email": email, "password": PASSWORD}
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 503:
+                # Back off as a browser honouring Retry-After would, then retry.
+                await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+                queue.put_nowait(email)
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    async def probe(client: httpx.AsyncClient) -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            try:
+                await client.get("/health")
+            except httpx.TransportError:
+                statuses["probe error"] = statuses.get("probe error", 0) + 1
+            probes.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.05)
+
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        prober = asyncio.create_task(probe(client))
+        started = time.perf_counter()
+        await asyncio.gather(*(login(client) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+
+    ok = statuses.get(200, 0)
+    print(f"logins        {len(latencies)} in {elapsed:.2f}s, {ok / elapsed:.1f} successful/s, "
+          f"responses {statuses}")
+    print(f"login ms      p50={statistics.median(latencies):.1f} "
+          f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f}")
+    print(f"/health ms    p50={statistics.median(probes):.1f} "
+          f"p95={percentile(probes, 95):.1f} p99={percentile(probes, 99):.1f} "
+          f"max={max(probes):.1f} over {len(probes)} probes")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--logins", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument(
+        "--seed-rounds", type=int, default=settings.password_hash_rounds,
+        help="bcrypt cost of the seeded hashes",
+    )
+    args = parser.parse_args()
+
+    emails = setup(args.members, args.seed_rounds)
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+            "--workers", "1", "--log-level", "warning",
+        ]
+    )
+    try:
+        wait_until_up(base_url)
+        asyncio.run(run(base_url, emails, args))
+        print(f"rehashed      {upgraded(emails)}/{len(emails)} members now at cost "
+              f"{settings.password_hash_rounds}")
+    finally:
+        server.terminate()
+        server.wait()
+        teardown(emails)
+
+
+if __name__ == "__main__":
+    main()
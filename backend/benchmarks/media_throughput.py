@@ -0,0 +1,148 @@
+"""Compare static media throughput of the plain StaticFiles mount and MediaFiles.
+
+Usage (from backend/, needs httpx):
+    python -m benchmarks.media_throughput --size-mb 64 --concurrency 8
+
+Starts uvicorn in a subprocess serving one synthetic video through both
+mounts, then measures full downloads, random 1 MiB range reads (what a
+player does when seeking) and conditional revalidation. Nothing touches the
+database or the real static directory.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from starlette.staticfiles import StaticFiles
+
+from app.core.media import MediaFiles
+
+MEDIA_NAME = "0123456789abcdef0123456789abcdef.mp4"
+RANGE_BYTES = 1024 * 1024
+
+
+def create_app() -> FastAPI:
+    directory = os.environ["MEDIA_BENCH_DIR"]
+    app = FastAPI()
+    app.mount("/media", MediaFiles(directory=directory), name="media")
+    app.mount("/static", StaticFiles(directory=directory), name="static")
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_until_up(client: httpx.AsyncClient) -> None:
+    for _ in range(100):
+        try:
+            await client.head(f"/media/{MEDIA_NAME}")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("uvicorn did not start")
+
+
+async def full_downloads(client, prefix: str, concurrency: int, rounds: int) -> tuple[float, str]:
+    async def download() -> int:
+        total = 0
+        async with client.stream("GET", f"{prefix}/{MEDIA_NAME}") as response:
+            async for chunk in response.aiter_raw():
+                total += len(chunk)
+        return total
+
+    started = time.perf_counter()
+    transferred = 0
+    for _ in range(rounds):
+        transferred += sum(await asyncio.gather(*(download() for _ in range(concurrency))))
+    elapsed = time.perf_counter() - started
+    head = await client.head(f"{prefix}/{MEDIA_NAME}")
+    return transferred / elapsed / 1024 / 1024, head.headers.get("cache-control", "-")
+
+
+async def range_reads(client, prefix: str, size: int, concurrency: int, requests: int) -> float:
+    rng = random.Random(7)
+    offsets = [rng.randrange(0, size - RANGE_BYTES) for _ in range(requests)]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def read(offset: int) -> None:
+        async with semaphore:
+            response = await client.get(
+                f"{prefix}/{MEDIA_NAME}",
+                headers={"Range": f"bytes={offset}-{offset + RANGE_BYTES - 1}"},
+            )
+            assert response.status_code == 206 and len(response.content) == RANGE_BYTES
+
+    started = time.perf_counter()
+    await asyncio.gather(*(read(offset) for offset in offsets))
+    return requests / (time.perf_counter() - started)
+
+
+async def revalidations(client, prefix: str, requests: int) -> float:
+    etag = (await client.head(f"{prefix}/{MEDIA_NAME}")).headers["etag"]
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(f"{prefix}/{MEDIA_NAME}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+    return requests / (time.perf_counter() - started)
+
+
+async def run(args, port: int, size: int) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120
+    ) as client:
+        await wait_until_up(client)
+        print(f"{'mount':<8}  {'full MB/s':>10}  {'range req/s':>12}  {'304 req/s':>10}  cache-control")
+        for label, prefix in (("static", "/static"), ("media", "/media")):
+            throughput, cache_control = await full_downloads(
+                client, prefix, args.concurrency, args.rounds
+            )
+            ranges = await range_reads(client, prefix, size, args.concurrency, args.range_requests)
+            not_modified = await revalidations(client, prefix, args.range_requests)
+            print(
+                f"{label:<8}  {throughput:>10.1f}  {ranges:>12.1f}  {not_modified:>10.1f}  "
+                f"{cache_control}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--range-requests", type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        size = args.size_mb * 1024 * 1024
+        with open(Path(directory) / MEDIA_NAME, "wb") as target:
+            for _ in range(args.size_mb):
+                target.write(os.urandom(1024 * 1024))
+        port = free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "benchmarks.media_throughput:create_app",
+                "--factory", "--port", str(port), "--log-level", "warning",
+            ],
+            env={**os.environ, "MEDIA_BENCH_DIR": directory},
+        )
+        try:
+            asyncio.run(run(args, port, size))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
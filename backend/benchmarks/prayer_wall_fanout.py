@@ -0,0 +1,118 @@
+"""Measure prayer wall push fan-out: many SSE viewers on one worker.
+
+Usage (from backend/, needs httpx):
+    python -m benchmarks.prayer_wall_fanout --viewers 2000 --events 50 --rate 10
+
+Starts uvicorn with one worker, opens N GET /prayers/stream connections for
+one throwaway site, then publishes events through publish_wall_events at a
+fixed rate, as amen flushes and approvals do. Reports how many viewers got
+every event and the publish-to-receive latency across all deliveries. The
+events are deleted afterwards.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete
+
+import app.models  # noqa: F401
+from app.db.session import SessionLocal
+from app.models.prayer import PrayerWallEvent
+from app.services.prayer_wall import publish_wall_events
+from benchmarks.amen_load import percentile, wait_until_up
+from benchmarks.media_throughput import free_port
+
+
+async def view(client: httpx.AsyncClient, site_id: str, args, ready: asyncio.Event,
+               connected: list, received: list) -> None:
+    async with client.stream("GET", "/prayers/stream", params={"site_id": site_id}) as response:
+        seen = 0
+        async for line in response.aiter_lines():
+            if line.startswith("event: ready"):
+                connected.append(1)
+                if len(connected) == args.viewers:
+                    ready.set()
+            elif line.startswith("data: ") and "sent" in line:
+                received.append(time.time() - json.loads(line[6:])["sent"])
+                seen += 1
+                if seen == args.events:
+                    return
+
+
+def publish(site_id: str, index: int) -> None:
+    with SessionLocal() as db:
+        publish_wall_events(
+            db,
+            [{"site_id": site_id, "type": "bench", "payload": {"sent": time.time(), "n": index}}],
+        )
+        db.commit()
+
+
+async def run(base_url: str, args) -> None:
+    site_id = str(uuid.uuid4())
+    ready = asyncio.Event()
+    connected: list = []
+    received: list[float] = []
+    limits = httpx.Limits(max_connections=args.viewers + 10)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        viewers = [
+            asyncio.create_task(view(client, site_id, args, ready, connected, received))
+            for _ in range(args.viewers)
+        ]
+        started = time.perf_counter()
+        await asyncio.wait_for(ready.wait(), args.timeout)
+        print(f"connected     {args.viewers} viewers in {time.perf_counter() - started:.2f}s")
+        try:
+            for index in range(args.events):
+                await asyncio.to_thread(publish, site_id, index)
+                await asyncio.sleep(1 / args.rate)
+            done, pending = await asyncio.wait(viewers, timeout=args.timeout)
+            for task in pending:
+                task.cancel()
+        finally:
+            with SessionLocal() as db:
+                db.execute(delete(PrayerWallEvent).where(PrayerWallEvent.site_id == site_id))
+                db.commit()
+        complete = sum(1 for task in done if task.exception() is None)
+        expected = args.viewers * args.events
+        latencies = [latency * 1000 for latency in received]
+        print(f"delivered     {len(received)}/{expected} frames, "
+              f"{complete}/{args.viewers} viewers got every event")
+        print(f"latency ms    p50={statistics.median(latencies):.1f} "
+              f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f} "
+              f"max={max(latencies):.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--viewers", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=10, help="events per second")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+            "--workers", "1", "--log-level", "warning",
+        ]
+    )
+    try:
+        wait_until_up(base_url)
+        asyncio.run(run(base_url, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Time confirming a whole event's registrations: per-row PATCH path vs one bulk update.
+
+Usage (from backend/):
+    python -m benchmarks.registration_bulk --registrations 2000
+
+Seeds one event with N pending registrations (reusing the listing
+benchmark's seed), then confirms all of them twice: once the way N calls to
+PATCH /registrations/admin/{id} do it (lookup, update_registration, user
+lookup, one commit each) and once with bulk_update_registrations. Sessions
+join an outer transaction that is rolled back at the end, so commits become
+savepoints and nothing is kept.
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.db.session import engine
+from app.models.registration import RegistrationStatus
+from app.models.user import User
+from app.schemas.registration import RegistrationUpdate
+from app.services.registrations import (
+    bulk_update_registrations,
+    get_registration_by_id,
+    update_registration,
+)
+from benchmarks.registration_listing import SEED_SQL
+
+
+def reset(connection, event_id) -> list:
+    connection.execute(
+        text("update event_registrations set status = 'Pending' where event_id = :event_id"),
+        {"event_id": event_id},
+    )
+    return connection.execute(
+        text("select id from event_registrations where event_id = :event_id order by created_at"),
+        {"event_id": event_id},
+    ).scalars().all()
+
+
+def per_row(db: Session, event_id, ids: list) -> None:
+    payload = RegistrationUpdate(status=RegistrationStatus.confirmed)
+    for registration_id in ids:
+        record = get_registration_by_id(db, registration_id)
+        record = update_registration(db, record, payload)
+        db.query(User).filter(User.id == record.user_id).first()
+
+
+def bulk(db: Session, event_id, ids: list) -> None:
+    bulk_update_registrations(db, event_id, status=RegistrationStatus.confirmed, ids=ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--registrations", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            for statement in SEED_SQL.split(";\n"):
+                connection.execute(text(statement), {"count": args.registrations})
+            connection.execute(text("analyze event_registrations"))
+            event_id = connection.execute(text("select md5('listing-event')::uuid")).scalar()
+            timings = {}
+            for label, apply in (("per-row", per_row), ("bulk", bulk)):
+                ids = reset(connection, event_id)
+                with Session(bind=connection, join_transaction_mode="create_savepoint") as db:
+                    started = time.perf_counter()
+                    apply(db, event_id, ids)
+                    timings[label] = time.perf_counter() - started
+                confirmed = connection.execute(
+                    text(
+                        "select count(*) from event_registrations"
+                        " where event_id = :event_id and status = 'Confirmed'"
+                    ),
+                    {"event_id": event_id},
+                ).scalar()
+                print(f"{label:<8} {timings[label] * 1000:>10.1f} ms  {confirmed} confirmed")
+            print(f"speedup  {timings['per-row'] / timings['bulk']:>10.1f}x")
+        finally:
+            transaction.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Hammer a single event with concurrent registrations.
+
+Usage (from backend/):
+    python -m benchmarks.registration_contention --workers 16 --requests 2000 --capacity 500
+
+Creates a throwaway event and users, registers every user from a pool of
+worker processes (so the client is not GIL-bound), then checks that the
+seats held never exceed capacity.
+"""
+import argparse
+import statistics
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert
+
+import app.models  # noqa: F401
+from app.db.session import SessionLocal, engine
+from app.models.event import Event, EventStatus
+from app.models.registration import EventRegistration, RegistrationStatus
+from app.models.user import User
+from app.schemas.registration import ProxyEntry, RegistrationCreate
+from app.services.registrations import (
+    EventFullError,
+    count_seats_taken,
+    create_registration,
+    delete_registration,
+)
+
+
+def setup(capacity: int, waitlist: bool, requests: int) -> tuple[uuid.UUID, list[uuid.UUID]]:
+    event_id = uuid.uuid4()
+    user_ids = [uuid.uuid4() for _ in range(requests)]
+    with SessionLocal() as db:
+        db.execute(
+            insert(Event).values(
+                id=event_id,
+                title=f"bench-{event_id.hex[:8]}",
+                start_at=datetime.now(timezone.utc) + timedelta(days=30),
+                capacity=capacity,
+                waitlist_enabled=waitlist,
+                status=EventStatus.published,
+            )
+        )
+        db.execute(
+            insert(User),
+            [
+                {"id": user_id, "email": f"bench-{user_id.hex}@example.com", "password_hash": "x"}
+                for user_id in user_ids
+            ],
+        )
+        db.commit()
+    return event_id, user_ids
+
+
+def teardown(event_id: uuid.UUID, user_ids: list[uuid.UUID]) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(EventRegistration).where(EventRegistration.event_id == event_id))
+        db.execute(delete(Event).where(Event.id == event_id))
+        db.execute(delete(User).where(User.id.in_(user_ids)))
+        db.commit()
+
+
+def init_worker() -> None:
+    # Connections inherited from the parent must not be shared after fork.
+    engine.dispose(close=False)
+
+
+def register(event_id: uuid.UUID, user_id: uuid.UUID, tickets: int, proxies: int):
+    payload = RegistrationCreate(
+        event_id=str(event_id),
+        ticket_count=tickets,
+        is_proxy=proxies > 0,
+        proxy_entries=[ProxyEntry(name=f"guest-{index}") for index in range(proxies)],
+    )
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        try:
+            registration = create_registration(db, payload, user_id=str(user_id))
+            outcome = registration.status.value
+        except EventFullError:
+            outcome = "Rejected"
+    return outcome, time.perf_counter() - started
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--capacity", type=int, default=500)
+    parser.add_argument("--tickets", type=int, default=1)
+    parser.add_argument("--proxies", type=int, default=1)
+    parser.add_argument("--no-waitlist", action="store_true")
+    parser.add_argument("--cancel", type=int, default=50, help="cancellations after the burst")
+    parser.add_argument("--keep", action="store_true", help="keep the generated rows")
+    args = parser.parse_args()
+
+    event_id, user_ids = setup(args.capacity, not args.no_waitlist, args.requests)
+    try:
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+            results = list(
+                pool.map(
+                    register,
+                    [event_id] * len(user_ids),
+                    user_ids,
+                    [args.tickets] * len(user_ids),
+                    [args.proxies] * len(user_ids),
+                    chunksize=16,
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+        outcomes: dict[str, int] = {}
+        for outcome, _ in results:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        latencies = [latency * 1000 for _, latency in results]
+
+        with SessionLocal() as db:
+            cancelled = (
+                db.query(EventRegistration)
+                .filter(EventRegistration.event_id == event_id)
+                .filter(EventRegistration.status == RegistrationStatus.pending)
+                .limit(args.cancel)
+                .all()
+            )
+            for registration in cancelled:
+                delete_registration(db, registration)
+            seats_taken = count_seats_taken(db, event_id)
+            waitlisted = (
+                db.query(EventRegistration)
+                .filter(EventRegistration.event_id == event_id)
+                .filter(EventRegistration.status == RegistrationStatus.waitlisted)
+                .count()
+            )
+
+        print(f"requests      {len(results)} from {args.workers} workers")
+        print(f"elapsed       {elapsed:.2f}s ({len(results) / elapsed:.0f} req/s)")
+        print(f"latency ms    p50={statistics.median(latencies):.1f} "
+              f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f} "
+              f"max={max(latencies):.1f}")
+        print(f"outcomes      {outcomes}")
+        print(f"cancelled     {len(cancelled)}, waitlist remaining {waitlisted}")
+        print(f"seats taken   {seats_taken} / {args.capacity}")
+        if seats_taken > args.capacity:
+            raise SystemExit("FAIL: event oversold")
+        print("OK: no overselling")
+    finally:
+        if not args.keep:
+            teardown(event_id, user_ids)
+
+
+if __name__ == "__main__":
+    main()
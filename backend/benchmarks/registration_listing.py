@@ -0,0 +1,146 @@
+"""Time the admin registration listing: ORM hydration vs columnar rows.
+
+Usage (from backend/):
+    python -m benchmarks.registration_listing --registrations 10000 --limits 50 200 10000
+
+Seeds one event with N registrations (about a third of them with proxy
+entries), then times each page size end to end as the route runs it: query,
+building the response items, and FastAPI's response-model validation and
+JSON encoding. The legacy path is the previous implementation: full
+EventRegistration/User/Event objects per row and a RegistrationAdminOut built
+in a loop, with no facets. Everything is rolled back at the end.
+"""
+import argparse
+import statistics
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.db.session import engine
+from app.models.event import Event
+from app.models.registration import EventRegistration
+from app.models.user import User
+from app.schemas.registration import RegistrationAdminOut
+from app.services.registrations import list_registration_rows_for_event
+
+SEED_SQL = """
+insert into sites (id, code, name)
+values (md5('listing-site')::uuid, 'listing-site', 'Listing site');
+
+insert into events (id, site_id, title, start_at, status)
+values (md5('listing-event')::uuid, md5('listing-site')::uuid, 'Listing bench',
+        now() + interval '30 days', 'Published');
+
+insert into users (id, email, password_hash, full_name, phone, site_id)
+select md5('listing-user' || i)::uuid, 'listing-user-' || i || '@example.com', 'x',
+       'Member ' || i, '09' || lpad(i::text, 8, '0'), md5('listing-site')::uuid
+from generate_series(1, :count) i;
+
+insert into event_registrations (event_id, user_id, status, ticket_count, is_proxy, proxy_entries, created_at)
+select md5('listing-event')::uuid, md5('listing-user' || i)::uuid,
+       (array['Pending', 'Confirmed', 'Confirmed', 'Waitlisted', 'Cancelled'])[1 + i % 5]::registration_status,
+       1 + i % 3, i % 3 = 0,
+       case when i % 3 = 0
+            then jsonb_build_array(jsonb_build_object('name', 'Guest ' || i, 'relation', 'Family'))
+            else '[]'::jsonb end,
+       now() - (i || ' seconds')::interval
+from generate_series(1, :count) i
+"""
+
+response_adapter = TypeAdapter(list[RegistrationAdminOut])
+
+
+def legacy_listing(db: Session, event_id: str, limit: int) -> bytes:
+    event = db.query(Event).filter(Event.id == event_id).first()
+    rows = (
+        db.query(EventRegistration, User, Event)
+        .join(Event, Event.id == EventRegistration.event_id)
+        .outerjoin(User, User.id == EventRegistration.user_id)
+        .filter(EventRegistration.event_id == event.id)
+        .order_by(EventRegistration.created_at.desc(), EventRegistration.id.desc())
+        .limit(limit + 1)
+        .all()[:limit]
+    )
+    results = [
+        RegistrationAdminOut(
+            id=registration.id,
+            event_id=registration.event_id,
+            event_title=event_row.title,
+            event_site_id=event_row.site_id,
+            event_start_at=event_row.start_at,
+            user_id=registration.user_id,
+            user_email=user.email if user else None,
+            user_full_name=user.full_name if user else None,
+            user_phone=user.phone if user else None,
+            user_member_type=user.member_type.value if user and user.member_type else None,
+            user_role=user.role.value if user and user.role else None,
+            status=registration.status,
+            ticket_count=registration.ticket_count,
+            is_proxy=registration.is_proxy,
+            proxy_entries=registration.proxy_entries or [],
+            created_at=registration.created_at,
+            updated_at=registration.updated_at,
+        )
+        for registration, user, event_row in rows
+    ]
+    return response_adapter.dump_json(response_adapter.validate_python(results))
+
+
+def columnar_listing(db: Session, event_id: str, limit: int) -> bytes:
+    event = db.query(Event).filter(Event.id == event_id).first()
+    page = list_registration_rows_for_event(db, event_id=str(event.id), limit=limit)
+    event_columns = {
+        "event_id": event.id,
+        "event_title": event.title,
+        "event_site_id": event.site_id,
+        "event_start_at": event.start_at,
+    }
+    items = [{**row._mapping, **event_columns} for row in page]
+    return response_adapter.dump_json(response_adapter.validate_python(items))
+
+
+def timed(connection, listing, event_id: str, limit: int, runs: int) -> tuple[float, int]:
+    timings = []
+    for _ in range(runs):
+        # A fresh session per run, as per request: no warm identity map.
+        with Session(bind=connection) as db:
+            started = time.perf_counter()
+            body = listing(db, event_id, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--registrations", type=int, default=10_000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[50, 200, 10_000])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            for statement in SEED_SQL.split(";\n"):
+                connection.execute(text(statement), {"count": args.registrations})
+            connection.execute(text("analyze event_registrations"))
+            event_id = connection.execute(text("select md5('listing-event')::uuid")).scalar()
+            with Session(bind=connection) as db:
+                facets = list_registration_rows_for_event(db, event_id=str(event_id), limit=1).facets
+            print(f"facets: {facets}")
+            print(f"{'limit':>7}  {'legacy ms':>10}  {'columnar ms':>12}  {'speedup':>8}  {'bytes':>10}")
+            for limit in args.limits:
+                legacy, size = timed(connection, legacy_listing, str(event_id), limit, args.runs)
+                columnar, _ = timed(connection, columnar_listing, str(event_id), limit, args.runs)
+                print(
+                    f"{limit:>7}  {legacy:>10.2f}  {columnar:>12.2f}  "
+                    f"{legacy / columnar:>7.2f}x  {size:>10}"
+                )
+        finally:
+            transaction.rollback()
+
+
+if __name__ == "__main__":
+    main()
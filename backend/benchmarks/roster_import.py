@@ -0,0 +1,67 @@
+"""Time a member roster import: rows per second through import_members.
+
+Usage (from backend/):
+    python -m benchmarks.roster_import --rows 100000 --with-password 0.01
+
+Builds a CSV in memory, shaped like a migrated branch roster (most rows
+without a password, a small share with one), runs it through read_rows and
+import_members as POST /admin/users/import does, then imports it again to
+time the update path. The imported members are deleted afterwards.
+"""
+import argparse
+import io
+import random
+import time
+import uuid
+
+from sqlalchemy import delete
+
+import app.models  # noqa: F401
+from app.db.session import SessionLocal
+from app.models.dashboard import DashboardSummaryQueue
+from app.models.user import User
+from app.services.imports import import_members, read_rows
+
+
+def build_csv(rows: int, with_password: float, prefix: str) -> bytes:
+    rng = random.Random(0)
+    lines = ["email,full_name,phone,password,member_type"]
+    for index in range(rows):
+        password = f"Pass-{index:06d}" if rng.random() < with_password else ""
+        member_type = "Seeker" if rng.random() < 0.2 else "Member"
+        lines.append(
+            f"{prefix}-{index}@example.com,Member {index},09{index:08d},{password},{member_type}"
+        )
+    return "\n".join(lines).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--with-password", type=float, default=0.01, help="share of rows")
+    args = parser.parse_args()
+
+    prefix = f"roster-{uuid.uuid4().hex[:8]}"
+    payload = build_csv(args.rows, args.with_password, prefix)
+    try:
+        for label in ("insert", "update"):
+            with SessionLocal() as db:
+                started = time.perf_counter()
+                report = import_members(db, read_rows(io.BytesIO(payload), "roster.csv"))
+                elapsed = time.perf_counter() - started
+            print(f"{label:<8} {report.total} rows in {elapsed:.1f}s "
+                  f"({report.total / elapsed:.0f} rows/s) inserted={report.inserted} "
+                  f"updated={report.updated} failed={report.failed}")
+    finally:
+        with SessionLocal() as db:
+            user_ids = db.scalars(
+                delete(User).where(User.email.like(f"{prefix}-%")).returning(User.id)
+            ).all()
+            db.execute(
+                delete(DashboardSummaryQueue).where(DashboardSummaryQueue.user_id.in_(user_ids))
+            )
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Measure substring search latency per search backend as the tables grow.
+
+Usage (from backend/):
+    python -m benchmarks.search_scaling --sizes 10000 40000 160000
+
+Prayer requests and members are filled with synthetic Chinese text in steps;
+after each step the real service functions are timed with every available
+backend. ILIKE grows with the table, the indexed backends with the number of
+matches. Everything runs in one transaction that is rolled back at the end.
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.db.session import engine
+from app.services.admin_users import list_users
+from app.services.prayers import list_prayers
+from benchmarks.index_plan import MIGRATIONS_DIR, migration_statements
+
+# Common characters; each synthetic text is a hash-driven walk over them, so a
+# given two-character term matches roughly the same fraction of rows at any size.
+CHARACTERS = (
+    "的一是不了人我在有他這中大來上國個到說們為子和你地出道也時年得就那要下以生會自著去之過家學對可她"
+    "裡後小麼心多天而能好都然沒日於起還發成事只作當想看文無開手十用主行方又如前所本見經頭面公同三已老從"
+    "動兩長知民樣現分將外但身些與高意進把法此實回二理美點月明其種聲全工己話兒者向情部正名定女問力機給等"
+    "幾很業最間新什打便位因重被走電四第門相次東政海口使教西再平真聽世氣信北少關並內加化由卻代軍產入先山"
+    "禱告恩典平安喜樂盼望愛心感謝讚美敬拜聚會團契禮拜福音聖經詩歌弟兄姊妹牧師長執同工代求醫治保守帶領"
+)
+
+SEED_SQL = """
+insert into sites (id, code, name)
+select md5('search-site')::uuid, 'search-site', 'Search site'
+on conflict do nothing;
+
+insert into users (id, email, password_hash, full_name, site_id)
+select md5('search-user' || i)::uuid, 'search-user-' || i || '@example.com', 'x',
+       (select string_agg(substr(:characters, 1 + abs(hashtext(i || ':' || k)) % :length, 1), '')
+        from generate_series(1, 3) k),
+       md5('search-site')::uuid
+from generate_series(:start, :stop - 1) i;
+
+insert into prayer_requests (user_id, site_id, content, status, created_at)
+select md5('search-user' || i)::uuid, md5('search-site')::uuid,
+       (select string_agg(substr(:characters, 1 + abs(hashtext(i || ':' || k)) % :length, 1), '')
+        from generate_series(1, 40) k),
+       'Approved', now() - (i || ' seconds')::interval
+from generate_series(:start, :stop - 1) i
+"""
+
+TERMS = ["禱告", "平安喜", "恩"]
+
+
+def available_backends(connection) -> list[str]:
+    backends = ["ilike", "bigram"]
+    trigram = connection.execute(
+        text("select 1 from pg_available_extensions where name = 'pg_trgm'")
+    ).scalar()
+    if trigram:
+        backends.append("trigram")
+    return backends
+
+
+def timed(run, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 40_000, 160_000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    configured_backend = settings.search_backend
+    results: list[tuple[int, str, str, str, float, int]] = []
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            backends = available_backends(connection)
+            for statement in migration_statements(MIGRATIONS_DIR / "002_search_tokens.sql"):
+                if "schema_migrations" not in statement:
+                    connection.execute(text(statement))
+            if "trigram" in backends:
+                for statement in migration_statements(MIGRATIONS_DIR / "003_trigram_indexes.sql"):
+                    if "schema_migrations" not in statement:
+                        connection.execute(text(statement))
+
+            seeded = 0
+            with Session(bind=connection) as db:
+                for size in sorted(args.sizes):
+                    for statement in SEED_SQL.split(";\n"):
+                        connection.execute(
+                            text(statement),
+                            {
+                                "characters": CHARACTERS,
+                                "length": len(CHARACTERS),
+                                "start": seeded,
+                                "stop": size,
+                            },
+                        )
+                    seeded = size
+                    connection.execute(text("analyze users"))
+                    connection.execute(text("analyze prayer_requests"))
+                    for backend in backends:
+                        settings.search_backend = backend
+                        for term in TERMS:
+                            found = len(list_prayers(db, query=term, limit=50))
+                            elapsed = timed(lambda: list_prayers(db, query=term, limit=50), args.runs)
+                            results.append((size, "prayers", backend, term, elapsed, found))
+                            found = len(list_users(db, query=term[:2]))
+                            elapsed = timed(lambda: list_users(db, query=term[:2]), args.runs)
+                            results.append((size, "users", backend, term[:2], elapsed, found))
+                    print(f"measured {size} rows")
+        finally:
+            settings.search_backend = configured_backend
+            transaction.rollback()
+
+    print(f"{'rows':>8}  {'table':<8}  {'backend':<8}  {'term':<6}  {'median ms':>10}  {'hits':>5}")
+    for size, table, backend, term, elapsed, found in results:
+        print(f"{size:>8}  {table:<8}  {backend:<8}  {term:<6}  {elapsed:>10.2f}  {found:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,581 @@
+"""Fill the database with a large, deterministic synthetic church.
+
+Usage (from backend/, after shared/schema.sql, shared/seed.sql and the migrations):
+    python -m benchmarks.synthetic_data                    # 1M registrations, 500k prayers
+    python -m benchmarks.synthetic_data --scale 0.05 --seed 7
+    python -m benchmarks.synthetic_data --registrations 3000000 --users 300000
+    python -m benchmarks.synthetic_data --remove
+
+Builds on shared/seed.sql: members, events, registrations (with proxy
+entries), prayers, care subjects and logs, bulletins, messages and weekly
+verses are spread over the four seeded sites plus --sites extra ones, so the
+demo accounts browse a full church. Popular events draw most registrations
+and a few members write most prayers, as in production.
+
+Rows stream in through COPY inside one transaction, so a failed run leaves
+nothing behind. Foreign keys and secondary indexes of the loaded tables are
+rebuilt afterwards, which locks those tables for the run: point it at a
+development or benchmark database, not production. The same --seed, --anchor and counts produce the same rows.
+Every generated id falls in one reserved UUID range; each run (and --remove)
+first deletes the previous load through it. All members share the demo
+accounts' password. Rebuild dashboard summaries afterwards with
+`python -m app.workers.dashboard --all --once`.
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import text
+
+import app.models  # noqa: F401
+from app.core.security import hash_password
+from app.db.session import engine
+
+# Row counts at --scale 1; bulletins, messages and verses get one per site per week.
+BASE_ROWS = {
+    "users": 100_000,
+    "events": 5_000,
+    "registrations": 1_000_000,
+    "prayers": 500_000,
+    "care_subjects": 50_000,
+    "care_logs": 400_000,
+    "weeks": 520,
+}
+
+# shared/seed.sql
+SEED_SITE_IDS = (
+    "11111111-1111-1111-1111-111111111111",
+    "22222222-2222-2222-2222-222222222222",
+    "33333333-3333-3333-3333-333333333333",
+    "44444444-4444-4444-4444-444444444444",
+)
+SEED_PASSWORD = "churchriverlife"
+
+# Generated ids are 5eedTTTT-...-<row>, T being the table, so one range
+# covers a whole load and deleting it is an index range scan per table.
+ID_PREFIX = 0x5EED
+TABLE_CODES = {
+    "sites": 1,
+    "users": 2,
+    "events": 3,
+    "event_registrations": 4,
+    "prayer_requests": 5,
+    "care_subjects": 6,
+    "care_logs": 7,
+    "life_bulletins": 8,
+    "sunday_messages": 9,
+    "weekly_verses": 10,
+}
+ID_FIRST = str(UUID(int=ID_PREFIX << 112))
+ID_LAST = str(UUID(int=((ID_PREFIX + 1) << 112) - 1))
+
+REMOVE_SQL = """
+delete from care_logs
+where id between :first and :last or subject_id between :first and :last
+   or created_by between :first and :last;
+delete from care_subjects where id between :first and :last;
+delete from event_registrations
+where id between :first and :last or event_id between :first and :last
+   or user_id between :first and :last;
+delete from prayer_amens
+where user_id between :first and :last or prayer_id between :first and :last;
+delete from prayer_requests
+where id between :first and :last or user_id between :first and :last;
+delete from events where id between :first and :last or created_by between :first and :last;
+delete from life_bulletins where id between :first and :last;
+delete from sunday_messages where id between :first and :last;
+delete from weekly_verses where id between :first and :last;
+delete from dashboard_summaries where user_id between :first and :last;
+delete from dashboard_summary_queue where user_id between :first and :last;
+delete from users where id between :first and :last;
+delete from sites where id between :first and :last
+"""
+
+SURNAMES = "陳林黃張李王吳劉蔡楊許鄭謝郭洪曾邱廖賴周徐蘇葉莊呂江何蕭羅高"
+GIVEN_NAMES = "家志俊雅婷怡君宏明建美惠玲淑芬文華心恩慈信望愛光平安喜樂"
+ENGLISH_NAMES = ("Grace", "Joshua", "Esther", "Daniel", "Ruth", "Samuel", "Hannah", "David")
+RELATIONS = ("配偶", "子女", "父母", "朋友", "同事")
+EVENT_THEMES = (
+    "城市復興特會",
+    "青年特會",
+    "家庭關係工作坊",
+    "禱告會",
+    "洗禮班",
+    "門徒訓練",
+    "兒童夏令營",
+    "敬拜讚美之夜",
+    "培靈會",
+    "宣教分享會",
+    "Alpha 啟發課程",
+    "婚前輔導",
+)
+PRAYER_PHRASES = (
+    "求主保守家人平安",
+    "為工作面試禱告",
+    "孩子考試順利",
+    "母親身體早日康復",
+    "求主賜下智慧與方向",
+    "為婚姻關係代禱",
+    "經濟上的需要",
+    "為未信主的朋友禱告",
+    "手術順利",
+    "求主醫治失眠",
+    "please pray for my family",
+    "感謝主的恩典",
+)
+CARE_NOTES = (
+    "近期壓力較大，已安排關懷禱告。",
+    "家庭議題需要後續跟進。",
+    "初次探訪，願意參加下次小組活動。",
+    "身體狀況好轉，持續代禱。",
+    "已轉介專業輔導。",
+    "穩定參加主日，情緒平穩。",
+    "工作變動，需要陪伴。",
+)
+VERSES = (
+    ("凡勞苦擔重擔的人，可以到我這裡來。", "馬太福音 11:28"),
+    ("耶和華是我的牧者，我必不致缺乏。", "詩篇 23:1"),
+    ("神愛世人，甚至將他的獨生子賜給他們。", "約翰福音 3:16"),
+    ("你們要先求他的國和他的義。", "馬太福音 6:33"),
+    ("我靠著那加給我力量的，凡事都能做。", "腓立比書 4:13"),
+    ("愛是恆久忍耐，又有恩慈。", "哥林多前書 13:4"),
+)
+SPEAKERS = ("主任牧師", "副牧師", "青年牧師", "客座講員", "長老")
+
+
+def scaled_counts(args) -> dict:
+    counts = {}
+    for name, rows in BASE_ROWS.items():
+        value = getattr(args, name)
+        counts[name] = value if value is not None else max(1, round(rows * args.scale))
+    counts["registrations"] = min(counts["registrations"], counts["users"] * counts["events"])
+    return counts
+
+
+def synthetic_id(table: str, index: int) -> str:
+    # Same text as str(UUID(int=...)) without building a UUID per row.
+    prefix = f"{ID_PREFIX:04x}{TABLE_CODES[table]:04x}-0000-0000"
+    return f"{prefix}-{index >> 48:04x}-{index & 0xFFFFFFFFFFFF:012x}"
+
+
+class SyntheticChurch:
+    # Each table draws from its own generator seeded by (--seed, table), so
+    # its rows do not depend on which tables were generated before it.
+    def __init__(self, seed: int, anchor: date, counts: dict, sites: int):
+        self.seed = seed
+        self.counts = counts
+        self.now = datetime.combine(anchor, datetime.min.time(), tzinfo=timezone.utc)
+        # Weeks start on Sunday, like weekly_verses.week_start.
+        self.this_sunday = anchor - timedelta(days=(anchor.weekday() + 1) % 7)
+        self.site_ids = [*SEED_SITE_IDS, *(synthetic_id("sites", i) for i in range(sites))]
+        rng = self.rng("sites")
+        # The center site is the largest, the rest vary.
+        self.site_weights = [8, *(rng.uniform(1, 4) for _ in self.site_ids[1:])]
+        self.user_sites: list[int] = []
+        self.staff: list[int] = []
+
+    def rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def ago(self, rng: random.Random, days: float) -> datetime:
+        return self.now - timedelta(seconds=rng.uniform(0, days * 86400))
+
+    def name(self, rng: random.Random) -> str:
+        if rng.random() < 0.05:
+            return f"{rng.choice(ENGLISH_NAMES)} {rng.choice(SURNAMES)}"
+        return rng.choice(SURNAMES) + "".join(rng.choices(GIVEN_NAMES, k=rng.choice((1, 2, 2))))
+
+    def phone(self, rng: random.Random) -> str:
+        return f"09{rng.randrange(10**8):08d}"
+
+    def sites(self):
+        for index, site_id in enumerate(self.site_ids[len(SEED_SITE_IDS):]):
+            yield site_id, f"synthetic-{index}", f"合成教會 {index}"
+
+    def users(self):
+        rng = self.rng("users")
+        total = self.counts["users"]
+        password_hash = hash_password(SEED_PASSWORD)
+        self.user_sites = rng.choices(range(len(self.site_ids)), self.site_weights, k=total)
+        roles = rng.choices(
+            ("Member", "Leader", "BranchStaff", "CenterStaff"), (970, 20, 8, 2), k=total
+        )
+        self.staff = [index for index, role in enumerate(roles) if role != "Member"] or [0]
+        for index in range(total):
+            yield (
+                synthetic_id("users", index),
+                f"member{index:07d}@synthetic.example.com",
+                password_hash,
+                self.name(rng),
+                self.phone(rng) if rng.random() < 0.7 else None,
+                roles[index],
+                "Seeker" if rng.random() < 0.2 else "Member",
+                self.site_ids[self.user_sites[index]],
+                rng.random() < 0.97,
+                self.ago(rng, 5 * 365),
+            )
+
+    def events(self):
+        rng = self.rng("events")
+        self.event_plans = []
+        for index, signups in enumerate(self.registration_counts(rng)):
+            start_at = self.now + timedelta(days=rng.uniform(-730, 180))
+            # Capped events are sized around their demand; some overflow.
+            capacity = None if rng.random() < 0.4 else max(10, round(signups * rng.uniform(0.8, 2)))
+            waitlist = capacity is not None and rng.random() < 0.5
+            if start_at < self.now:
+                status = "Closed" if rng.random() < 0.6 else "Published"
+            else:
+                status = "Draft" if rng.random() < 0.15 else "Published"
+            self.event_plans.append((start_at, signups, capacity, waitlist))
+            theme = rng.choice(EVENT_THEMES)
+            yield (
+                synthetic_id("events", index),
+                rng.choices(self.site_ids, self.site_weights)[0],
+                f"{theme} {start_at:%Y/%m}",
+                f"{theme}：{rng.choice(PRAYER_PHRASES)}，歡迎弟兄姊妹邀請親友一同參加。",
+                start_at,
+                start_at + timedelta(hours=rng.choice((2, 3, 4, 8))),
+                capacity,
+                waitlist,
+                status,
+                synthetic_id("users", rng.choice(self.staff)),
+                start_at - timedelta(days=rng.uniform(14, 90)),
+            )
+
+    def registration_counts(self, rng: random.Random) -> list[int]:
+        # Pareto popularity: a few conferences draw far more sign-ups than the rest.
+        users, total = self.counts["users"], self.counts["registrations"]
+        weights = [rng.paretovariate(2) for _ in range(self.counts["events"])]
+        scale = total / sum(weights)
+        counts = [min(users, int(weight * scale)) for weight in weights]
+        short = total - sum(counts)
+        while short > 0:
+            for index, count in enumerate(counts):
+                if short and count < users:
+                    counts[index] += 1
+                    short -= 1
+        return counts
+
+    def proxy_entries(self, rng: random.Random) -> list[dict]:
+        entries = []
+        for _ in range(rng.choice((1, 1, 2, 3))):
+            entry = {"name": self.name(rng), "relation": rng.choice(RELATIONS)}
+            if rng.random() < 0.5:
+                entry["phone"] = self.phone(rng)
+            entries.append(entry)
+        return entries
+
+    def event_registrations(self):
+        rng = self.rng("event_registrations")
+        row = 0
+        for event, (start_at, count, capacity, waitlist) in enumerate(self.event_plans):
+            event_id = synthetic_id("events", event)
+            # Sign-ups in arrival order, so seats fill before the waitlist.
+            created = sorted(
+                start_at - timedelta(seconds=rng.uniform(3600, 60 * 86400)) for _ in range(count)
+            )
+            seats = 0
+            for user, created_at in zip(rng.sample(range(self.counts["users"]), count), created):
+                entries = self.proxy_entries(rng) if rng.random() < 0.15 else []
+                tickets = 1 + len(entries)
+                if rng.random() < 0.06:
+                    status = "Cancelled"
+                elif start_at > self.now and rng.random() < 0.1:
+                    status = "Pending"
+                elif capacity is not None and seats + tickets > capacity:
+                    status = "Waitlisted" if waitlist else "Cancelled"
+                else:
+                    status = "Confirmed"
+                    seats += tickets
+                yield (
+                    synthetic_id("event_registrations", row),
+                    event_id,
+                    synthetic_id("users", user),
+                    status,
+                    tickets,
+                    bool(entries),
+                    json.dumps(entries, ensure_ascii=False),
+                    created_at,
+                    created_at,
+                )
+                row += 1
+
+    def prayer_requests(self):
+        rng = self.rng("prayer_requests")
+        users = self.counts["users"]
+        for index in range(self.counts["prayers"]):
+            # Squaring skews authorship toward a core of frequent writers.
+            user = int(users * rng.random() ** 2)
+            yield (
+                synthetic_id("prayer_requests", index),
+                synthetic_id("users", user),
+                self.site_ids[self.user_sites[user]],
+                "，".join(rng.sample(PRAYER_PHRASES, rng.randint(1, 3))) + "。",
+                rng.choices(("Private", "Group", "Public"), (20, 50, 30))[0],
+                rng.choices(("Pending", "Approved", "Archived"), (10, 75, 15))[0],
+                self.ago(rng, 3 * 365),
+            )
+
+    def care_subjects(self):
+        rng = self.rng("care_subjects")
+        for index in range(self.counts["care_subjects"]):
+            subject_type = rng.choices(
+                ("Member", "Seeker", "Family", "Community"), (50, 30, 15, 5)
+            )[0]
+            name = self.name(rng)
+            yield (
+                synthetic_id("care_subjects", index),
+                rng.choices(self.site_ids, self.site_weights)[0],
+                f"{name[0]}家" if subject_type == "Family" else name,
+                subject_type,
+                rng.choices(("Active", "Paused", "Closed"), (70, 15, 15))[0],
+                self.ago(rng, 4 * 365),
+            )
+
+    def care_logs(self):
+        rng = self.rng("care_logs")
+        subjects = self.counts["care_subjects"]
+
+        def score():
+            return rng.randint(1, 5) if rng.random() < 0.9 else None
+
+        for index in range(self.counts["care_logs"]):
+            yield (
+                synthetic_id("care_logs", index),
+                synthetic_id("care_subjects", int(subjects * rng.random() ** 2)),
+                synthetic_id("users", rng.choice(self.staff)),
+                rng.choice(CARE_NOTES),
+                score(),
+                score(),
+                self.ago(rng, 4 * 365),
+            )
+
+    def weekly(self, table: str):
+        # One row per site per week, newest week first.
+        rng = self.rng(table)
+        row = 0
+        for week in range(self.counts["weeks"]):
+            sunday = self.this_sunday - timedelta(weeks=week)
+            for site_id in self.site_ids:
+                yield rng, synthetic_id(table, row), site_id, week, sunday
+                row += 1
+
+    def life_bulletins(self):
+        for rng, row_id, site_id, week, sunday in self.weekly("life_bulletins"):
+            created_at = datetime.combine(sunday, datetime.min.time(), tzinfo=timezone.utc)
+            video = f"https://www.youtube.com/watch?v={rng.getrandbits(64):016x}"
+            yield (
+                row_id,
+                site_id,
+                sunday,
+                "\n".join(rng.sample(PRAYER_PHRASES, 4) + rng.sample(CARE_NOTES, 2)),
+                video if rng.random() < 0.3 else None,
+                "Draft" if week == 0 and rng.random() < 0.5 else "Published",
+                created_at,
+                created_at,
+            )
+
+    def sunday_messages(self):
+        for rng, row_id, site_id, _, sunday in self.weekly("sunday_messages"):
+            verse, reference = rng.choice(VERSES)
+            yield (
+                row_id,
+                site_id,
+                sunday,
+                f"{reference} {rng.choice(EVENT_THEMES)}",
+                rng.choice(SPEAKERS),
+                f"https://www.youtube.com/watch?v={rng.getrandbits(64):016x}",
+                verse,
+                datetime.combine(sunday, datetime.min.time(), tzinfo=timezone.utc),
+            )
+
+    def weekly_verses(self):
+        for rng, row_id, site_id, _, sunday in self.weekly("weekly_verses"):
+            verse, reference = rng.choice(VERSES)
+            yield row_id, site_id, sunday, verse, reference
+
+
+# Load order follows foreign keys. weekly_verses goes through a staging table:
+# shared/seed.sql already holds this week's verse for its center site.
+TABLES = (
+    ("sites", ("id", "code", "name")),
+    (
+        "users",
+        ("id", "email", "password_hash", "full_name", "phone", "role", "member_type", "site_id",
+         "is_active", "created_at"),
+    ),
+    (
+        "events",
+        ("id", "site_id", "title", "description", "start_at", "end_at", "capacity",
+         "waitlist_enabled", "status", "created_by", "created_at"),
+    ),
+    (
+        "event_registrations",
+        ("id", "event_id", "user_id", "status", "ticket_count", "is_proxy", "proxy_entries",
+         "created_at", "updated_at"),
+    ),
+    (
+        "prayer_requests",
+        ("id", "user_id", "site_id", "content", "privacy_level", "status", "created_at"),
+    ),
+    ("care_subjects", ("id", "site_id", "name", "subject_type", "status", "created_at")),
+    (
+        "care_logs",
+        ("id", "subject_id", "created_by", "note", "mood_score", "spiritual_score", "created_at"),
+    ),
+    (
+        "life_bulletins",
+        ("id", "site_id", "bulletin_date", "content", "video_url", "status", "created_at",
+         "updated_at"),
+    ),
+    (
+        "sunday_messages",
+        ("id", "site_id", "message_date", "title", "speaker", "youtube_url", "description",
+         "created_at"),
+    ),
+    ("weekly_verses", ("id", "site_id", "week_start", "text", "reference")),
+)
+
+STAGE_VERSES_SQL = """
+create temporary table synthetic_weekly_verses
+  (like weekly_verses including defaults) on commit drop
+"""
+
+MERGE_VERSES_SQL = """
+insert into weekly_verses select * from synthetic_weekly_verses
+on conflict (site_id, week_start) do nothing
+"""
+
+
+# Foreign keys from, to and secondary indexes of the loaded tables. They are
+# dropped while the previous load is deleted and the new one copied, then
+# recreated: one validating join and one sorted build per table are far
+# cheaper than a trigger and an index insert per row. With the foreign keys
+# gone nothing cascades, so REMOVE_SQL deletes dependent rows itself.
+DEFERRED_DDL_SQL = """
+select format('alter table %s drop constraint %I', conrelid::regclass, conname),
+       format('alter table %s add constraint %I %s', conrelid::regclass, conname,
+              pg_get_constraintdef(oid))
+from pg_constraint
+where contype = 'f'
+  and (conrelid = any(cast(:tables as regclass[])) or confrelid = any(cast(:tables as regclass[])))
+union all
+select format('drop index %s', indexrelid::regclass), pg_get_indexdef(indexrelid)
+from pg_index
+where indrelid = any(cast(:tables as regclass[])) and not indisprimary
+  and not exists (select 1 from pg_constraint where conindid = indexrelid)
+"""
+
+# weekly_verses keeps its unique index: the verse merge relies on it.
+DEFERRED_TABLES = [table for table, _ in TABLES if table != "weekly_verses"]
+
+
+def run_sql(connection, script: str, **params) -> None:
+    for statement in script.split(";\n"):
+        connection.execute(text(statement), params)
+
+
+def copy_rows(cursor, table: str, columns: tuple, rows) -> int:
+    count = 0
+    with cursor.copy(f"copy {table} ({', '.join(columns)}) from stdin") as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+def drop_deferred(connection) -> list[str]:
+    deferred = connection.execute(text(DEFERRED_DDL_SQL), {"tables": DEFERRED_TABLES}).all()
+    for drop, _ in deferred:
+        connection.execute(text(drop))
+    return [create for _, create in deferred]
+
+
+def restore_deferred(connection, creates: list[str]) -> None:
+    started = time.perf_counter()
+    for create in creates:
+        connection.execute(text(create))
+    elapsed = time.perf_counter() - started
+    print(f"rebuilt {len(creates)} foreign keys and indexes in {elapsed:.1f}s")
+
+
+def load(church: SyntheticChurch) -> None:
+    with engine.begin() as connection:
+        present = connection.execute(
+            text("select count(*) from sites where id = any(cast(:ids as uuid[]))"),
+            {"ids": list(SEED_SITE_IDS)},
+        ).scalar_one()
+        if present < len(SEED_SITE_IDS):
+            raise SystemExit("Apply shared/seed.sql first: its sites anchor the synthetic data.")
+
+        creates = drop_deferred(connection)
+        started = time.perf_counter()
+        run_sql(connection, REMOVE_SQL, first=ID_FIRST, last=ID_LAST)
+        print(f"removed previous synthetic data in {time.perf_counter() - started:.1f}s")
+
+        connection.execute(text(STAGE_VERSES_SQL))
+        cursor = connection.connection.driver_connection.cursor()
+        for table, columns in TABLES:
+            started = time.perf_counter()
+            target = "synthetic_weekly_verses" if table == "weekly_verses" else table
+            count = copy_rows(cursor, target, columns, getattr(church, table)())
+            if table == "weekly_verses":
+                count = connection.execute(text(MERGE_VERSES_SQL)).rowcount
+            elapsed = time.perf_counter() - started
+            print(f"{table:<20} {count:>10,} rows in {elapsed:6.1f}s ({count / elapsed:,.0f}/s)")
+        cursor.close()
+
+        restore_deferred(connection, creates)
+
+        started = time.perf_counter()
+        for table, _ in TABLES:
+            connection.execute(text(f"analyze {table}"))
+        print(f"analyzed in {time.perf_counter() - started:.1f}s, committing")
+
+
+def remove() -> None:
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        creates = drop_deferred(connection)
+        run_sql(connection, REMOVE_SQL, first=ID_FIRST, last=ID_LAST)
+        print(f"removed synthetic data in {time.perf_counter() - started:.1f}s")
+        restore_deferred(connection, creates)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default 1)")
+    parser.add_argument(
+        "--anchor",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="date the data is generated around, YYYY-MM-DD (default today)",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies every row count")
+    parser.add_argument("--sites", type=int, default=4, help="sites added to the seeded four")
+    for name, rows in BASE_ROWS.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=int,
+            help=f"overrides --scale (default {rows:,} x scale)",
+        )
+    parser.add_argument("--remove", action="store_true", help="delete a previous load and exit")
+    args = parser.parse_args()
+
+    if args.remove:
+        remove()
+        return
+    counts = scaled_counts(args)
+    print("generating " + ", ".join(f"{name}={count:,}" for name, count in counts.items()))
+    started = time.perf_counter()
+    load(SyntheticChurch(args.seed, args.anchor, counts, args.sites))
+    print(f"done in {time.perf_counter() - started:.1f}s")
+    print("Rebuild dashboard summaries: python -m app.workers.dashboard --all --once")
+
+
+if __name__ == "__main__":
+    main()
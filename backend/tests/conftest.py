@@ -0,0 +1,76 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db.session import SessionLocal
+
+
+@pytest.fixture
+def db():
+    # Runs against DATABASE_URL; skipped when no database is reachable.
+    session = SessionLocal()
+    try:
+        session.execute(text("select 1"))
+    except OperationalError:
+        session.close()
+        pytest.skip("database not reachable")
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_event(db):
+    # Creates an event with one registration per status in `statuses`, in
+    # that created_at order, and removes everything afterwards.
+    event_ids, user_ids = [], []
+
+    def factory(capacity, statuses, waitlist_enabled=True):
+        event_id = uuid.uuid4()
+        db.execute(
+            text(
+                "insert into events (id, title, start_at, status, capacity, waitlist_enabled)"
+                " values (:id, 'test event', now(), 'Published', :capacity, :waitlist)"
+            ),
+            {"id": event_id, "capacity": capacity, "waitlist": waitlist_enabled},
+        )
+        event_ids.append(event_id)
+        registration_ids = []
+        for position, status in enumerate(statuses):
+            user_id = uuid.uuid4()
+            db.execute(
+                text(
+                    "insert into users (id, email, password_hash, full_name)"
+                    " values (:id, :email, 'x', 'Test User')"
+                ),
+                {"id": user_id, "email": f"test-{user_id}@example.com"},
+            )
+            user_ids.append(user_id)
+            registration_ids.append(
+                db.execute(
+                    text(
+                        "insert into event_registrations"
+                        " (event_id, user_id, status, ticket_count, created_at)"
+                        " values (:event_id, :user_id, :status, 1,"
+                        " now() + make_interval(secs => :position)) returning id"
+                    ),
+                    {
+                        "event_id": event_id,
+                        "user_id": user_id,
+                        "status": status,
+                        "position": position,
+                    },
+                ).scalar_one()
+            )
+        db.commit()
+        return event_id, registration_ids
+
+    yield factory
+    db.rollback()
+    db.execute(
+        text("delete from event_registrations where event_id = any(:ids)"), {"ids": event_ids}
+    )
+    db.execute(text("delete from events where id = any(:ids)"), {"ids": event_ids})
+    db.execute(text("delete from users where id = any(:ids)"), {"ids": user_ids})
+    db.commit()
@@ -0,0 +1,28 @@
+from app.services import readiness
+
+
+def stub_pool_stats(monkeypatch, **stats):
+    snapshot = {"name": "sync", "size": 5, "max_overflow": 10, "checkedout": 0, **stats}
+    monkeypatch.setattr(readiness, "pool_stats", lambda: [snapshot])
+
+
+def test_unlimited_overflow_is_never_exhausted(monkeypatch):
+    stub_pool_stats(monkeypatch, max_overflow=-1, checkedout=40)
+
+    check = readiness.check_pools()
+
+    assert check["ok"] is True
+    assert check["pools"] == [
+        {"name": "sync", "checked_out": 40, "capacity": None, "saturation": None}
+    ]
+
+
+def test_full_bounded_pool_is_exhausted(monkeypatch):
+    stub_pool_stats(monkeypatch, max_overflow=10, checkedout=15)
+
+    check = readiness.check_pools()
+
+    assert check["ok"] is False
+    assert check["pools"][0]["capacity"] == 15
+    assert check["pools"][0]["saturation"] == 1.0
+    assert check["error"] == "connection pool exhausted: sync"
@@ -0,0 +1,74 @@
+import pytest
+
+from app.models.registration import EventRegistration, RegistrationStatus
+from app.schemas.registration import RegistrationUpdate
+from app.services.registrations import bulk_update_registrations, update_registration
+
+
+def statuses(db, registration_ids):
+    rows = db.query(EventRegistration).filter(EventRegistration.id.in_(registration_ids))
+    by_id = {row.id: row.status for row in rows}
+    return [by_id[registration_id] for registration_id in registration_ids]
+
+
+@pytest.mark.parametrize("capacity", [None, 5])
+def test_staff_set_waitlisted_is_kept(db, make_event, capacity):
+    _, ids = make_event(capacity, ["Pending", "Pending"])
+    registration = db.get(EventRegistration, ids[1])
+
+    update_registration(db, registration, RegistrationUpdate(status=RegistrationStatus.waitlisted))
+
+    db.expire_all()
+    assert statuses(db, ids) == [RegistrationStatus.pending, RegistrationStatus.waitlisted]
+
+
+def test_unrelated_edit_without_capacity_promotes_nobody(db, make_event):
+    _, ids = make_event(None, ["Pending", "Waitlisted"])
+    registration = db.get(EventRegistration, ids[0])
+
+    update_registration(db, registration, RegistrationUpdate(ticket_count=2))
+
+    db.expire_all()
+    assert statuses(db, ids) == [RegistrationStatus.pending, RegistrationStatus.waitlisted]
+
+
+def test_cancel_promotes_next_waitlisted(db, make_event):
+    _, ids = make_event(1, ["Pending", "Waitlisted", "Waitlisted"])
+    registration = db.get(EventRegistration, ids[0])
+
+    update_registration(db, registration, RegistrationUpdate(status=RegistrationStatus.cancelled))
+
+    db.expire_all()
+    assert statuses(db, ids) == [
+        RegistrationStatus.cancelled,
+        RegistrationStatus.pending,
+        RegistrationStatus.waitlisted,
+    ]
+
+
+@pytest.mark.parametrize("capacity", [None, 5])
+@pytest.mark.parametrize("by_ids", [True, False])
+def test_bulk_waitlisted_is_kept(db, make_event, capacity, by_ids):
+    event_id, ids = make_event(capacity, ["Pending", "Pending"])
+    match = {"ids": ids} if by_ids else {"match_status": RegistrationStatus.pending}
+
+    results, promoted = bulk_update_registrations(
+        db, event_id, status=RegistrationStatus.waitlisted, **match
+    )
+
+    db.expire_all()
+    assert promoted == []
+    assert [result["status"] for result in results] == [RegistrationStatus.waitlisted] * 2
+    assert statuses(db, ids) == [RegistrationStatus.waitlisted] * 2
+
+
+def test_bulk_cancel_promotes_other_waitlisted(db, make_event):
+    event_id, ids = make_event(1, ["Pending", "Waitlisted"])
+
+    _, promoted = bulk_update_registrations(
+        db, event_id, status=RegistrationStatus.cancelled, ids=ids[:1]
+    )
+
+    db.expire_all()
+    assert promoted == [ids[1]]
+    assert statuses(db, ids) == [RegistrationStatus.cancelled, RegistrationStatus.pending]
@@ -0,0 +1,63 @@
+-- 001: composite indexes for the filter/sort combinations in backend/app/services.
+-- Run outside a transaction (CONCURRENTLY): psql -d Church -f shared/migrations/001_query_indexes.sql
+
+create table if not exists public.schema_migrations (
+  version text primary key,
+  applied_at timestamp with time zone default timezone('utc'::text, now()) not null
+);
+
+-- registrations.list_registrations_for_event: event_id [+ status] order by created_at desc
+create index concurrently if not exists event_registrations_event_created_idx
+  on public.event_registrations (event_id, created_at desc);
+
+-- registrations.list_registrations: user_id order by created_at desc
+create index concurrently if not exists event_registrations_user_created_idx
+  on public.event_registrations (user_id, created_at desc);
+
+-- prayers.list_prayers: site_id + status, sorted by created_at or amen_count
+create index concurrently if not exists prayer_requests_site_status_created_idx
+  on public.prayer_requests (site_id, status, created_at desc);
+
+create index concurrently if not exists prayer_requests_site_status_amen_idx
+  on public.prayer_requests (site_id, status, amen_count desc);
+
+-- prayers.list_prayers without site_id (all-sites wall)
+create index concurrently if not exists prayer_requests_status_created_idx
+  on public.prayer_requests (status, created_at desc);
+
+-- events.list_events: site_id [+ status] order by start_at, upcoming_only filters start_at
+create index concurrently if not exists events_site_status_start_idx
+  on public.events (site_id, status, start_at);
+
+create index concurrently if not exists events_start_idx
+  on public.events (start_at);
+
+-- life_bulletins.list_latest_life_bulletins: site_id + status order by bulletin_date, created_at
+create index concurrently if not exists life_bulletins_site_status_date_idx
+  on public.life_bulletins (site_id, status, bulletin_date desc, created_at desc);
+
+-- sunday_messages.list_latest_sunday_messages: site_id order by message_date, created_at.
+-- Supersedes sunday_messages_site_date_idx, which is a prefix of it.
+create index concurrently if not exists sunday_messages_site_date_created_idx
+  on public.sunday_messages (site_id, message_date desc, created_at desc);
+
+drop index concurrently if exists public.sunday_messages_site_date_idx;
+
+-- weekly_verses.get_current_weekly_verse is served by the existing unique
+-- weekly_verses_site_week_key (site_id, week_start) scanned backwards.
+
+-- care.list_logs: subject_id order by created_at desc
+create index concurrently if not exists care_logs_subject_created_idx
+  on public.care_logs (subject_id, created_at desc);
+
+-- care.list_subjects: site_id [+ status] order by created_at desc
+create index concurrently if not exists care_subjects_site_status_created_idx
+  on public.care_subjects (site_id, status, created_at desc);
+
+-- admin_users.list_users: site_id order by created_at desc
+create index concurrently if not exists users_site_created_idx
+  on public.users (site_id, created_at desc);
+
+insert into public.schema_migrations (version)
+values ('001_query_indexes')
+on conflict (version) do nothing;
@@ -0,0 +1,63 @@
+-- 002: CJK-friendly substring search for SEARCH_BACKEND=bigram (backend/app/services/search.py).
+-- Needs no extension: every searched column gets a GIN index over its lower-cased
+-- unigrams and bigrams, so a query of any length narrows to candidate rows before
+-- the ILIKE recheck. Chinese text has no word boundaries, which rules out the
+-- built-in tsvector parsers, and two-character terms are too short for pg_trgm.
+-- Run outside a transaction (CONCURRENTLY): psql -d Church -f shared/migrations/002_search_tokens.sql
+
+create or replace function public.search_tokens(value text) returns text[]
+language sql immutable strict parallel safe as $$
+  select coalesce(array_agg(distinct token), '{}')
+  from (select lower(value) as lowered) source,
+  lateral (
+    select substr(lowered, position, 1) as token
+    from generate_series(1, char_length(lowered)) as position
+    union all
+    select substr(lowered, position, 2)
+    from generate_series(1, char_length(lowered) - 1) as position
+  ) tokens
+  where token !~ '\s'
+$$;
+
+-- events.list_events
+create index concurrently if not exists events_title_search_idx
+  on public.events using gin (public.search_tokens(title));
+
+create index concurrently if not exists events_description_search_idx
+  on public.events using gin (public.search_tokens(description));
+
+-- registrations.list_registrations_for_event, admin_users.list_users
+create index concurrently if not exists users_full_name_search_idx
+  on public.users using gin (public.search_tokens(full_name));
+
+create index concurrently if not exists users_email_search_idx
+  on public.users using gin (public.search_tokens(email));
+
+-- prayers.list_prayers
+create index concurrently if not exists prayer_requests_content_search_idx
+  on public.prayer_requests using gin (public.search_tokens(content));
+
+-- care.list_subjects
+create index concurrently if not exists care_subjects_name_search_idx
+  on public.care_subjects using gin (public.search_tokens(name));
+
+-- life_bulletins.list_life_bulletins
+create index concurrently if not exists life_bulletins_content_search_idx
+  on public.life_bulletins using gin (public.search_tokens(content));
+
+create index concurrently if not exists life_bulletins_video_url_search_idx
+  on public.life_bulletins using gin (public.search_tokens(video_url));
+
+-- sunday_messages.list_sunday_messages
+create index concurrently if not exists sunday_messages_title_search_idx
+  on public.sunday_messages using gin (public.search_tokens(title));
+
+create index concurrently if not exists sunday_messages_speaker_search_idx
+  on public.sunday_messages using gin (public.search_tokens(speaker));
+
+create index concurrently if not exists sunday_messages_description_search_idx
+  on public.sunday_messages using gin (public.search_tokens(description));
+
+insert into public.schema_migrations (version)
+values ('002_search_tokens')
+on conflict (version) do nothing;
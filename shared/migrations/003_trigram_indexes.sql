@@ -0,0 +1,50 @@
+-- 003: pg_trgm GIN indexes for SEARCH_BACKEND=trigram (backend/app/services/search.py).
+-- The queries stay plain ILIKE '%term%'; pg_trgm serves them from the index for
+-- terms of three or more characters. Shorter terms (common in Chinese) fall back
+-- to a full index scan, which is what the bigram backend (002) avoids.
+-- Run outside a transaction (CONCURRENTLY): psql -d Church -f shared/migrations/003_trigram_indexes.sql
+
+create extension if not exists pg_trgm;
+
+-- events.list_events
+create index concurrently if not exists events_title_trgm_idx
+  on public.events using gin (title gin_trgm_ops);
+
+create index concurrently if not exists events_description_trgm_idx
+  on public.events using gin (description gin_trgm_ops);
+
+-- registrations.list_registrations_for_event, admin_users.list_users
+create index concurrently if not exists users_full_name_trgm_idx
+  on public.users using gin (full_name gin_trgm_ops);
+
+create index concurrently if not exists users_email_trgm_idx
+  on public.users using gin (email gin_trgm_ops);
+
+-- prayers.list_prayers
+create index concurrently if not exists prayer_requests_content_trgm_idx
+  on public.prayer_requests using gin (content gin_trgm_ops);
+
+-- care.list_subjects
+create index concurrently if not exists care_subjects_name_trgm_idx
+  on public.care_subjects using gin (name gin_trgm_ops);
+
+-- life_bulletins.list_life_bulletins
+create index concurrently if not exists life_bulletins_content_trgm_idx
+  on public.life_bulletins using gin (content gin_trgm_ops);
+
+create index concurrently if not exists life_bulletins_video_url_trgm_idx
+  on public.life_bulletins using gin (video_url gin_trgm_ops);
+
+-- sunday_messages.list_sunday_messages
+create index concurrently if not exists sunday_messages_title_trgm_idx
+  on public.sunday_messages using gin (title gin_trgm_ops);
+
+create index concurrently if not exists sunday_messages_speaker_trgm_idx
+  on public.sunday_messages using gin (speaker gin_trgm_ops);
+
+create index concurrently if not exists sunday_messages_description_trgm_idx
+  on public.sunday_messages using gin (description gin_trgm_ops);
+
+insert into public.schema_migrations (version)
+values ('003_trigram_indexes')
+on conflict (version) do nothing;
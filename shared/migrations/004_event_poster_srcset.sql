@@ -0,0 +1,9 @@
+-- 004: resized poster derivatives (backend/app/services/posters.py), keyed by MIME type.
+-- Run: psql -d Church -f shared/migrations/004_event_poster_srcset.sql
+
+alter table public.events
+  add column if not exists poster_srcset jsonb;
+
+insert into public.schema_migrations (version)
+values ('004_event_poster_srcset')
+on conflict (version) do nothing;
@@ -0,0 +1,18 @@
+-- 005: HLS transcode job state on life bulletins (backend/app/workers/transcode.py).
+-- Run: psql -d Church -f shared/migrations/005_life_bulletin_video_jobs.sql
+
+do $$
+begin
+  if not exists (select 1 from pg_type where typname = 'life_bulletin_video_status') then
+    create type public.life_bulletin_video_status as enum ('Queued', 'Processing', 'Ready', 'Failed');
+  end if;
+end $$;
+
+alter table public.life_bulletins
+  add column if not exists video_source_url text,
+  add column if not exists video_poster_url text,
+  add column if not exists video_status life_bulletin_video_status;
+
+insert into public.schema_migrations (version)
+values ('005_life_bulletin_video_jobs')
+on conflict (version) do nothing;
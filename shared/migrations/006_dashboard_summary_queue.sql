@@ -0,0 +1,16 @@
+-- 006: stale-user queue for the dashboard summary materializer (backend/app/workers/dashboard.py).
+-- Run outside a transaction (CONCURRENTLY): psql -d Church -f shared/migrations/006_dashboard_summary_queue.sql
+-- Then backfill: cd backend && python -m app.workers.dashboard --all --once
+
+create table if not exists public.dashboard_summary_queue (
+  user_id uuid primary key references public.users(id) on delete cascade,
+  queued_at timestamp with time zone default timezone('utc'::text, now()) not null
+);
+
+-- dashboard.build_dashboard_summaries: latest prayers per user
+create index concurrently if not exists prayer_requests_user_created_idx
+  on public.prayer_requests (user_id, created_at desc);
+
+insert into public.schema_migrations (version)
+values ('006_dashboard_summary_queue')
+on conflict (version) do nothing;
@@ -0,0 +1,13 @@
+-- 007: one amen per member per prayer (backend/app/services/amens.py).
+-- Run: psql -d Church -f shared/migrations/007_prayer_amens.sql
+
+create table if not exists public.prayer_amens (
+  prayer_id uuid not null references public.prayer_requests(id) on delete cascade,
+  user_id uuid not null references public.users(id),
+  created_at timestamp with time zone default timezone('utc'::text, now()) not null,
+  primary key (prayer_id, user_id)
+);
+
+insert into public.schema_migrations (version)
+values ('007_prayer_amens')
+on conflict (version) do nothing;
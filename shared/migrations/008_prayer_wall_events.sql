@@ -0,0 +1,18 @@
+-- 008: replayable prayer wall push events (backend/app/services/prayer_wall.py).
+-- Run: psql -d Church -f shared/migrations/008_prayer_wall_events.sql
+
+create table if not exists public.prayer_wall_events (
+  id bigserial primary key,
+  site_id uuid,
+  type text not null,
+  payload jsonb not null,
+  created_at timestamp with time zone default timezone('utc'::text, now()) not null
+);
+
+-- prayer_wall.prune_wall_events
+create index if not exists prayer_wall_events_created_idx
+  on public.prayer_wall_events (created_at);
+
+insert into public.schema_migrations (version)
+values ('008_prayer_wall_events')
+on conflict (version) do nothing;
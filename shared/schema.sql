@@ -1,4 +1,5 @@
 create extension if not exists "uuid-ossp";
+create extension if not exists pg_trgm;
 
 do $$
 begin
@@ -34,6 +35,9 @@ create table if not exists public.users (
 alter table if exists public.users
   add column if not exists is_active boolean default true not null;
 
+create index if not exists users_site_created_idx
+  on public.users (site_id, created_at desc);
+
 alter table if exists public.users
   add column if not exists phone text;
 
@@ -43,12 +47,20 @@ alter table if exists public.users
 alter table if exists public.events
   add column if not exists poster_url text;
 
+alter table if exists public.events
+  add column if not exists poster_srcset jsonb;
+
 create table if not exists public.dashboard_summaries (
   user_id uuid primary key references public.users(id),
   data jsonb not null,
   updated_at timestamp with time zone default timezone('utc'::text, now()) not null
 );
 
+create table if not exists public.dashboard_summary_queue (
+  user_id uuid primary key references public.users(id) on delete cascade,
+  queued_at timestamp with time zone default timezone('utc'::text, now()) not null
+);
+
 create table if not exists public.weekly_verses (
   id uuid default uuid_generate_v4() primary key,
   site_id uuid not null references public.sites(id),
@@ -70,8 +82,10 @@ create table if not exists public.sunday_messages (
   created_at timestamp with time zone default timezone('utc'::text, now()) not null
 );
 
-create index if not exists sunday_messages_site_date_idx
-  on public.sunday_messages (site_id, message_date desc);
+-- Supersedes sunday_messages_site_date_idx (001).
+drop index if exists public.sunday_messages_site_date_idx;
+create index if not exists sunday_messages_site_date_created_idx
+  on public.sunday_messages (site_id, message_date desc, created_at desc);
 
 create table if not exists public.life_bulletins (
   id uuid default uuid_generate_v4() primary key,
@@ -79,6 +93,9 @@ create table if not exists public.life_bulletins (
   bulletin_date date not null,
   content text not null,
   video_url text,
+  video_source_url text,
+  video_poster_url text,
+  video_status life_bulletin_video_status,
   status life_bulletin_status default 'Draft'::life_bulletin_status not null,
   created_at timestamp with time zone default timezone('utc'::text, now()) not null,
   updated_at timestamp with time zone default timezone('utc'::text, now()) not null
@@ -87,6 +104,9 @@ create table if not exists public.life_bulletins (
 create index if not exists life_bulletins_site_date_idx
   on public.life_bulletins (site_id, bulletin_date desc);
 
+create index if not exists life_bulletins_site_status_date_idx
+  on public.life_bulletins (site_id, status, bulletin_date desc, created_at desc);
+
 
 alter table if exists public.weekly_verses
   add column if not exists week_start date;
@@ -128,14 +148,27 @@ begin
   if not exists (select 1 from pg_type where typname = 'life_bulletin_status') then
     create type public.life_bulletin_status as enum ('Draft', 'Published');
   end if;
+  if not exists (select 1 from pg_type where typname = 'life_bulletin_video_status') then
+    create type public.life_bulletin_video_status as enum ('Queued', 'Processing', 'Ready', 'Failed');
+  end if;
 end $$;
 
+alter table if exists public.life_bulletins
+  add column if not exists video_source_url text;
+
+alter table if exists public.life_bulletins
+  add column if not exists video_poster_url text;
+
+alter table if exists public.life_bulletins
+  add column if not exists video_status life_bulletin_video_status;
+
 create table if not exists public.events (
   id uuid default uuid_generate_v4() primary key,
   site_id uuid references public.sites(id),
   title text not null,
   description text,
   poster_url text,
+  poster_srcset jsonb,
   start_at timestamp with time zone not null,
   end_at timestamp with time zone,
   capacity integer,
@@ -145,6 +178,12 @@ create table if not exists public.events (
   created_at timestamp with time zone default timezone('utc'::text, now()) not null
 );
 
+create index if not exists events_site_status_start_idx
+  on public.events (site_id, status, start_at);
+
+create index if not exists events_start_idx
+  on public.events (start_at);
+
 create table if not exists public.event_registrations (
   id uuid default uuid_generate_v4() primary key,
   event_id uuid not null references public.events(id),
@@ -170,6 +209,15 @@ alter table if exists public.event_registrations
 create unique index if not exists event_registrations_user_event_key
   on public.event_registrations (user_id, event_id);
 
+create index if not exists event_registrations_event_status_idx
+  on public.event_registrations (event_id, status);
+
+create index if not exists event_registrations_event_created_idx
+  on public.event_registrations (event_id, created_at desc);
+
+create index if not exists event_registrations_user_created_idx
+  on public.event_registrations (user_id, created_at desc);
+
 create table if not exists public.prayer_requests (
   id uuid default uuid_generate_v4() primary key,
   user_id uuid references public.users(id),
@@ -181,6 +229,33 @@ create table if not exists public.prayer_requests (
   created_at timestamp with time zone default timezone('utc'::text, now()) not null
 );
 
+create index if not exists prayer_requests_site_status_created_idx
+  on public.prayer_requests (site_id, status, created_at desc);
+
+create index if not exists prayer_requests_site_status_amen_idx
+  on public.prayer_requests (site_id, status, amen_count desc);
+
+create index if not exists prayer_requests_status_created_idx
+  on public.prayer_requests (status, created_at desc);
+
+create table if not exists public.prayer_amens (
+  prayer_id uuid not null references public.prayer_requests(id) on delete cascade,
+  user_id uuid not null references public.users(id),
+  created_at timestamp with time zone default timezone('utc'::text, now()) not null,
+  primary key (prayer_id, user_id)
+);
+
+create table if not exists public.prayer_wall_events (
+  id bigserial primary key,
+  site_id uuid,
+  type text not null,
+  payload jsonb not null,
+  created_at timestamp with time zone default timezone('utc'::text, now()) not null
+);
+
+create index if not exists prayer_wall_events_created_idx
+  on public.prayer_wall_events (created_at);
+
 create table if not exists public.care_subjects (
   id uuid default uuid_generate_v4() primary key,
   site_id uuid references public.sites(id),
@@ -190,6 +265,9 @@ create table if not exists public.care_subjects (
   created_at timestamp with time zone default timezone('utc'::text, now()) not null
 );
 
+create index if not exists care_subjects_site_status_created_idx
+  on public.care_subjects (site_id, status, created_at desc);
+
 create table if not exists public.care_logs (
   id uuid default uuid_generate_v4() primary key,
   subject_id uuid not null references public.care_subjects(id),
@@ -199,3 +277,87 @@ create table if not exists public.care_logs (
   spiritual_score integer,
   created_at timestamp with time zone default timezone('utc'::text, now()) not null
 );
+
+create index if not exists care_logs_subject_created_idx
+  on public.care_logs (subject_id, created_at desc);
+
+-- Keyword search indexes for SEARCH_BACKEND=bigram (002) and trigram (003).
+create or replace function public.search_tokens(value text) returns text[]
+language sql immutable strict parallel safe as $$
+  select coalesce(array_agg(distinct token), '{}')
+  from (select lower(value) as lowered) source,
+  lateral (
+    select substr(lowered, position, 1) as token
+    from generate_series(1, char_length(lowered)) as position
+    union all
+    select substr(lowered, position, 2)
+    from generate_series(1, char_length(lowered) - 1) as position
+  ) tokens
+  where token !~ '\s'
+$$;
+
+create index if not exists events_title_search_idx
+  on public.events using gin (public.search_tokens(title));
+
+create index if not exists events_description_search_idx
+  on public.events using gin (public.search_tokens(description));
+
+create index if not exists users_full_name_search_idx
+  on public.users using gin (public.search_tokens(full_name));
+
+create index if not exists users_email_search_idx
+  on public.users using gin (public.search_tokens(email));
+
+create index if not exists prayer_requests_content_search_idx
+  on public.prayer_requests using gin (public.search_tokens(content));
+
+create index if not exists care_subjects_name_search_idx
+  on public.care_subjects using gin (public.search_tokens(name));
+
+create index if not exists life_bulletins_content_search_idx
+  on public.life_bulletins using gin (public.search_tokens(content));
+
+create index if not exists life_bulletins_video_url_search_idx
+  on public.life_bulletins using gin (public.search_tokens(video_url));
+
+create index if not exists sunday_messages_title_search_idx
+  on public.sunday_messages using gin (public.search_tokens(title));
+
+create index if not exists sunday_messages_speaker_search_idx
+  on public.sunday_messages using gin (public.search_tokens(speaker));
+
+create index if not exists sunday_messages_description_search_idx
+  on public.sunday_messages using gin (public.search_tokens(description));
+
+create index if not exists events_title_trgm_idx
+  on public.events using gin (title gin_trgm_ops);
+
+create index if not exists events_description_trgm_idx
+  on public.events using gin (description gin_trgm_ops);
+
+create index if not exists users_full_name_trgm_idx
+  on public.users using gin (full_name gin_trgm_ops);
+
+create index if not exists users_email_trgm_idx
+  on public.users using gin (email gin_trgm_ops);
+
+create index if not exists prayer_requests_content_trgm_idx
+  on public.prayer_requests using gin (content gin_trgm_ops);
+
+create index if not exists care_subjects_name_trgm_idx
+  on public.care_subjects using gin (name gin_trgm_ops);
+
+create index if not exists life_bulletins_content_trgm_idx
+  on public.life_bulletins using gin (content gin_trgm_ops);
+
+create index if not exists life_bulletins_video_url_trgm_idx
+  on public.life_bulletins using gin (video_url gin_trgm_ops);
+
+create index if not exists sunday_messages_title_trgm_idx
+  on public.sunday_messages using gin (title gin_trgm_ops);
+
+create index if not exists sunday_messages_speaker_trgm_idx
+  on public.sunday_messages using gin (speaker gin_trgm_ops);
+
+create index if not exists sunday_messages_description_trgm_idx
+  on public.sunday_messages using gin (description gin_trgm_ops);